@@ -0,0 +1,677 @@
+"""
+Benchmarks del proyecto. Uso:
+
+    python benchmark.py [seccion ...]
+
+Sin argumentos corre todas las secciones.
+"""
+import os
+import random
+import sys
+import time
+from math import log
+
+import numpy as np
+
+from core.generadores import (
+    crear_generador,
+    generar_numeros_pseudoaleatorios,
+    darDistExp,
+    darDistNorm,
+    darDistUnifAB,
+    generar_exponencial,
+    generar_normal,
+    generar_uniforme_ab,
+)
+from core.paralelo import generar_paralelo, histograma_paralelo
+
+TAMANIOS = (10_000, 100_000, 1_000_000)
+
+
+def medir(funcion, repeticiones=3):
+    """Devuelve el mejor tiempo (en segundos) de varias ejecuciones."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor
+
+
+def _exp_python_puro(n, lmd):
+    # Camino original: lista de random.random() y un round por elemento
+    nums = [random.random() for _ in range(n)]
+    return [round(-1 / lmd * log(x), 4) for x in nums]
+
+
+def bench_generacion():
+    """Compara el camino de listas con el motor vectorizado de numpy."""
+    print("== Generacion: listas vs motor numpy ==")
+    print(f"{'N':>10} {'Distribucion':<14} {'Python puro':>12} "
+          f"{'API listas':>12} {'Motor numpy':>12} {'Aceleracion':>12}")
+    rng = crear_generador(0)
+    casos = [
+        ("Exponencial",
+         lambda n: darDistExp(generar_numeros_pseudoaleatorios(n), 0.5),
+         lambda n: generar_exponencial(n, 0.5, rng)),
+        ("Normal",
+         lambda n: darDistNorm(generar_numeros_pseudoaleatorios(n), 0, 1),
+         lambda n: generar_normal(n, 0, 1, rng)),
+        ("Uniforme",
+         lambda n: darDistUnifAB(generar_numeros_pseudoaleatorios(n), 0, 1),
+         lambda n: generar_uniforme_ab(n, 0, 1, rng)),
+    ]
+    for n in TAMANIOS:
+        t_puro = medir(lambda: _exp_python_puro(n, 0.5), 1)
+        for nombre, por_lista, por_arreglo in casos:
+            t_lista = medir(lambda: por_lista(n))
+            t_arreglo = medir(lambda: por_arreglo(n))
+            puro = f"{t_puro * 1e3:10.1f}ms" if nombre == "Exponencial" else f"{'-':>12}"
+            print(f"{n:>10} {nombre:<14} {puro} {t_lista * 1e3:10.1f}ms "
+                  f"{t_arreglo * 1e3:10.1f}ms {t_lista / t_arreglo:11.1f}x")
+
+
+def bench_paralelo():
+    """Throughput de la generacion en paralelo segun cantidad de procesos."""
+    cantidad = 20_000_000
+    bordes = np.linspace(-6, 6, 11)
+    print(f"== Paralelo: {cantidad:,} valores Normal (nucleos: "
+          f"{os.cpu_count()}) ==")
+    print(f"{'Procesos':>9} {'Serie':>12} {'Histograma':>12} "
+          f"{'Mvalores/s':>11}")
+    for trabajadores in (1, 2, 4, 8):
+        t_serie = medir(lambda: generar_paralelo(
+            "Normal", cantidad, (0, 1), 0, trabajadores), 1)
+        t_hist = medir(lambda: histograma_paralelo(
+            "Normal", cantidad, (0, 1), 10, 0, bordes, trabajadores), 1)
+        print(f"{trabajadores:>9} {t_serie:11.2f}s {t_hist:11.2f}s "
+              f"{cantidad / t_hist / 1e6:11.1f}")
+
+
+def bench_vistas():
+    """
+    Latencia de apertura de PaginaResultados con 1M de valores: con
+    construccion diferida solo se arma la tabla; antes se armaban las tres
+    vistas (tabla, histograma y serie) antes de mostrar la pagina.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from core.analisis import Analisis
+    from paginas.PaginaResultados import PaginaResultados
+
+    app = QApplication.instance() or QApplication([])
+    cantidad, intervalos, params = 1_000_000, 10, (0, 1)
+    datos = generar_normal(cantidad, *params, crear_generador(0))
+    analisis = Analisis.desde_datos(datos, intervalos, "Normal", params)
+
+    pagina = PaginaResultados(None, None, "Normal", intervalos, params)
+    pagina.cargar_datos(datos)
+    pagina.cargar_analisis(analisis)
+    pagina.mostrar_histograma()
+    pagina.mostrar_serie()
+    app.processEvents()
+
+    t = pagina.tiempos
+    diferida = t["apertura"]
+    completa = diferida + t["histograma"] + t["serie"]
+    print(f"== Vistas de PaginaResultados ({cantidad:,} valores) ==")
+    for nombre in ("tabla", "histograma", "serie"):
+        print(f"{'Construir ' + nombre:<22} {t[nombre] * 1e3:8.1f}ms")
+    print(f"{'Apertura diferida':<22} {diferida * 1e3:8.1f}ms")
+    print(f"{'Apertura con todas':<22} {completa * 1e3:8.1f}ms")
+    print(f"{'Ahorro':<22} {(completa - diferida) * 1e3:8.1f}ms")
+
+
+def bench_exportacion():
+    """Tiempo de exportacion de 1M de valores en cada formato disponible."""
+    import tempfile
+    from core.exportar import exportar, formatos_disponibles
+
+    cantidad = 1_000_000
+    datos = generar_normal(cantidad, 0, 1, crear_generador(0))
+    print(f"== Exportacion ({cantidad:,} valores) ==")
+    with tempfile.TemporaryDirectory() as carpeta:
+        for formato in formatos_disponibles():
+            ruta = os.path.join(carpeta, f"serie.{formato}")
+            t = medir(lambda: exportar(ruta, datos, formato, {}), 1)
+            tamanio = os.path.getsize(ruta) / 2**20
+            print(f"{formato:<8} {t * 1e3:8.1f}ms {tamanio:8.1f}MiB")
+
+
+def bench_agrupacion():
+    """χ² agrupado de muchas series: una llamada por serie vs chi2_lote."""
+    from core.generadores import (
+        agrupar_frecuencias, agrupar_intervalos_chi2, chi2_lote,
+        chi2_por_clase)
+
+    series, k = 10_000, 20
+    rng = crear_generador(0)
+    fe = -1000 * np.diff(np.exp(-np.linspace(0, 6, k + 1)))
+    fo = rng.poisson(fe, size=(series, k))
+    # Como las arma clases_desde_arreglos: valores de Python
+    clases = [[{"li": i, "ls": i + 1, "fo": f, "fe": e}
+               for i, (f, e) in enumerate(zip(fila, fe.tolist()))]
+              for fila in fo.tolist()]
+
+    def bucle_original(clases):
+        # Agrupacion de la version original (un metodo de PaginaResultados),
+        # como referencia
+        agrupadas = []
+        actual = clases[0].copy()
+        for c in clases[1:]:
+            if actual["fe"] < 5:
+                actual["ls"] = c["ls"]
+                actual["fo"] += c["fo"]
+                actual["fe"] += c["fe"]
+            else:
+                agrupadas.append(actual)
+                actual = c.copy()
+        if actual["fe"] < 5 and agrupadas:
+            agrupadas[-1]["ls"] = actual["ls"]
+            agrupadas[-1]["fo"] += actual["fo"]
+            agrupadas[-1]["fe"] += actual["fe"]
+        else:
+            agrupadas.append(actual)
+        return agrupadas
+
+    def con_dicts_original():
+        for cl in clases:
+            sum((g["fo"] - g["fe"]) ** 2 / g["fe"]
+                for g in bucle_original(cl))
+
+    def con_dicts():
+        for cl in clases:
+            sum((g["fo"] - g["fe"]) ** 2 / g["fe"]
+                for g in agrupar_intervalos_chi2(cl))
+
+    def con_arreglos():
+        for fila in fo:
+            _, fo_agr, fe_agr = agrupar_frecuencias(fila, fe)
+            chi2_por_clase(fo_agr, fe_agr).sum()
+
+    print(f"== Agrupacion y χ² ({series:,} series de {k} clases) ==")
+    for nombre, funcion in [
+        ("dicts, bucle original", con_dicts_original),
+        ("dicts, una por serie", con_dicts),
+        ("arreglos, una por serie", con_arreglos),
+        ("chi2_lote (FE comun)", lambda: chi2_lote(fo, fe)),
+        ("chi2_lote (FE por serie)",
+         lambda: chi2_lote(fo, np.broadcast_to(fe, fo.shape))),
+    ]:
+        t = medir(funcion, 1)
+        print(f"{nombre:<26} {t * 1e3:9.1f}ms {t / series * 1e6:8.2f}us/serie")
+
+
+def bench_fe():
+    """FE: CDF escalar por intervalo vs una evaluacion por borde vs lote."""
+    from math import erf, sqrt
+
+    from core.generadores import (
+        frecuencias_esperadas_bordes, frecuencias_esperadas_lote)
+
+    def cdf_norm(x, media, desviacion):
+        # CDF escalar de la version original, como referencia
+        return 0.5 * (1 + erf((x - media) / (desviacion * sqrt(2))))
+
+    juegos, k = 10_000, 20
+    bordes = np.linspace(-4, 4, k + 1)
+    limites = list(zip(bordes[:-1], bordes[1:]))
+    params = [(m, d) for m, d in zip(np.linspace(-1, 1, juegos),
+                                     np.linspace(0.5, 2, juegos))]
+
+    def escalar():
+        for media, desv in params:
+            [(cdf_norm(ls, media, desv) - cdf_norm(li, media, desv)) * 1000
+             for li, ls in limites]
+
+    def por_bordes():
+        for p in params:
+            frecuencias_esperadas_bordes(bordes, 1000, "Normal", p)
+
+    print(f"== FE Normal ({juegos:,} juegos de parametros, {k} clases) ==")
+    for nombre, funcion in [
+        ("CDF escalar por intervalo", escalar),
+        ("CDF por borde, uno a uno", por_bordes),
+        ("frecuencias_esperadas_lote", lambda: frecuencias_esperadas_lote(
+            bordes, 1000, "Normal", params)),
+    ]:
+        t = medir(funcion, 1)
+        print(f"{nombre:<28} {t * 1e3:9.1f}ms")
+
+
+def bench_critico():
+    """chi2_critico: scipy en cada llamada vs tabla/cache y camino en lote."""
+    from scipy.stats import chi2 as chi2_dist
+    from core.generadores import chi2_critico, chi2_criticos_gl
+
+    llamadas = 10_000
+    grados = np.random.default_rng(0).integers(1, 25, llamadas)
+    print(f"== Valor critico χ² ({llamadas:,} llamadas) ==")
+    for nombre, funcion in [
+        ("scipy.stats.chi2.ppf", lambda: [chi2_dist.ppf(0.95, g)
+                                          for g in grados]),
+        ("chi2_critico (tabla)", lambda: [chi2_critico(g + 1, 0.05)
+                                          for g in grados]),
+        ("chi2_critico (LRU)", lambda: [chi2_critico(g + 1, 0.07)
+                                        for g in grados]),
+        ("chi2_criticos_gl", lambda: chi2_criticos_gl(grados, 0.05)),
+    ]:
+        t = medir(funcion, 1)
+        print(f"{nombre:<22} {t * 1e3:9.2f}ms")
+
+
+_ABRIR_VENTANA = """
+import sys
+from PyQt5.QtWidgets import QApplication
+import main
+app = QApplication(sys.argv)
+ventana = main.MainWindow()
+ventana.show()
+app.processEvents()
+"""
+
+
+def bench_arranque():
+    """
+    Arranque en frio: reporte de `python -X importtime -c "import main"`
+    (modulos mas pesados y si se cargaron numpy/scipy/matplotlib) y tiempo
+    hasta mostrar la primera ventana, en un proceso nuevo cada vez.
+    """
+    import subprocess
+
+    entorno = dict(os.environ)
+    entorno.setdefault("QT_QPA_PLATFORM", "offscreen")
+    raiz = os.path.dirname(os.path.abspath(__file__))
+
+    salida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=raiz, env=entorno, capture_output=True, text=True).stderr
+    modulos = []
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "cumulative" in linea:
+            continue
+        _, acumulado, nombre = linea.split("|")
+        modulos.append((int(acumulado), nombre.strip()))
+    total = max(m[0] for m in modulos)
+
+    print("== Arranque ==")
+    print(f"{'import main (acumulado)':<34} {total / 1e3:8.1f}ms")
+    for pesado in ("numpy", "scipy", "matplotlib"):
+        cargado = any(nombre == pesado for _, nombre in modulos)
+        print(f"{'  ' + pesado + ' cargado al inicio':<34} "
+              f"{'si' if cargado else 'no':>8}")
+    print("Modulos mas pesados:")
+    for acumulado, nombre in sorted(modulos, reverse=True)[:8]:
+        print(f"  {nombre:<32} {acumulado / 1e3:8.1f}ms")
+
+    def abrir():
+        subprocess.run([sys.executable, "-c", _ABRIR_VENTANA], cwd=raiz,
+                       env=entorno, capture_output=True, check=True)
+    print(f"{'Hasta mostrar la ventana':<34} {medir(abrir) * 1e3:8.1f}ms")
+
+
+def bench_memoria():
+    """
+    Memoria en una sesion larga: corridas repetidas de 1M de valores
+    (tabla, histograma y serie) volviendo a los parametros entre cada una.
+    Con las paginas de resultados descartadas al volver, la memoria
+    residente deberia quedar estable.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtCore import QCoreApplication, QEvent
+    from PyQt5.QtWidgets import QApplication
+    import main
+
+    app = QApplication.instance() or QApplication([])
+    ventana = main.MainWindow()
+    ventana.elegir_dist()
+    ventana.ir_a_parametros("Normal", 1_000_000, 10)
+    parametros = ventana.stack.currentWidget()
+
+    print("== Memoria en corridas repetidas (1,000,000 valores) ==")
+    print(f"{'Corrida':>8} {'Residente':>12} {'Pila':>6} "
+          f"{'Resultados vivos':>17}")
+    for corrida in range(1, 9):
+        parametros.generar()
+        resultados = ventana.stack.currentWidget()
+        resultados.tarea.wait()
+        app.processEvents()
+        resultados.mostrar_histograma()
+        resultados.mostrar_serie()
+        app.processEvents()
+        resultados.volver()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        del resultados
+
+        memoria = ventana.memoria()
+        print(f"{corrida:>8} "
+              f"{memoria['memoria_residente'] / 2**20:10.1f}MiB "
+              f"{memoria['paginas_en_pila']:>6} "
+              f"{memoria['resultados_vivos']:>17}")
+
+
+def bench_histograma():
+    """
+    Redibujo del histograma: figura nueva en cada cambio (camino anterior)
+    contra actualizar las barras sobre el fondo guardado (blitting), y costo
+    de la superposicion teorica.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from matplotlib.backends.backend_qt5agg import (
+        FigureCanvasQTAgg as FigureCanvas)
+    from matplotlib.figure import Figure
+    from paginas.GraficoHistograma import GraficoHistograma
+
+    app = QApplication.instance() or QApplication([])
+    datos = generar_normal(1_000_000, 0, 1, crear_generador(0))
+    fo, bordes = np.histogram(datos, bins=25)
+
+    def figura_nueva():
+        fig = Figure(figsize=(6, 6))
+        ax = fig.add_subplot(111)
+        ax.bar(bordes[:-1], fo, width=np.diff(bordes), align='edge')
+        ax.set_xticks(bordes)
+        canvas = FigureCanvas(fig)
+        canvas.resize(640, 640)
+        canvas.draw()
+
+    grafico = GraficoHistograma("Normal")
+    grafico.resize(640, 640)
+    grafico.actualizar(bordes, fo)
+    grafico.draw()
+    app.processEvents()
+    alturas = [fo * f for f in np.linspace(0.5, 1, 20)]
+
+    def blit():
+        for a in alturas:
+            grafico.actualizar(bordes, a)
+
+    def redibujo():
+        grafico.actualizar(bordes, fo)
+        grafico.draw()
+
+    print("== Histograma (25 intervalos) ==")
+    print(f"{'Figura nueva':<22} {medir(figura_nueva) * 1e3:8.2f}ms")
+    print(f"{'Redibujo completo':<22} {medir(redibujo) * 1e3:8.2f}ms")
+    print(f"{'Blitting':<22} {medir(blit) / len(alturas) * 1e3:8.2f}ms")
+
+    # Superposicion teorica: calculo en frio, en cache y alternarla
+    from core.generadores import curva_densidad, frecuencias_esperadas_bordes
+    clave = ("Normal", (0.0, 1.0), tuple(bordes.tolist()))
+    fe = frecuencias_esperadas_bordes(bordes, len(datos), "Normal", (0, 1))
+
+    def en_frio():
+        curva_densidad.cache_clear()
+        curva_densidad(*clave)
+
+    x, densidad = curva_densidad(*clave)
+    grafico.superponer(bordes, fe, x, densidad, len(datos))
+    grafico.draw()
+    visible = [True]
+
+    def alternar():
+        visible[0] = not visible[0]
+        grafico.mostrar_superposicion(visible[0])
+
+    print(f"{'Densidad en frio':<22} {medir(en_frio) * 1e3:8.2f}ms")
+    print(f"{'Densidad en cache':<22} "
+          f"{medir(lambda: curva_densidad(*clave)) * 1e3:8.2f}ms")
+    print(f"{'Mostrar/ocultar':<22} {medir(alternar) * 1e3:8.2f}ms")
+
+
+def bench_distribuciones():
+    """Cada kernel (muestreo, CDF, densidad, inversa) de cada distribucion
+    registrada, sobre 1M de valores."""
+    from core.distribuciones import DISTRIBUCIONES
+
+    cantidad = 1_000_000
+    rng = crear_generador(0)
+    p = rng.random(cantidad)
+    print(f"== Kernels por distribucion ({cantidad:,} valores, "
+          f"Mvalores/s) ==")
+    print(f"{'Distribucion':<22} {'muestrear':>10} {'cdf':>10} "
+          f"{'pdf':>10} {'ppf':>10}")
+    for d in DISTRIBUCIONES.values():
+        params = d.defectos()
+        x = d.muestrear(cantidad, params, rng)
+        kernels = [
+            lambda: d.muestrear(cantidad, params, rng),
+            lambda: d.cdf(x, params),
+            lambda: d.pdf(x, params),
+            lambda: d.ppf(p, params),
+        ]
+        tasas = [cantidad / medir(k) / 1e6 for k in kernels]
+        print(f"{d.nombre:<22} " + " ".join(f"{t:10.1f}" for t in tasas))
+
+
+def bench_generadores():
+    """Muestras por segundo de cada generador pseudoaleatorio: uniformes
+    solas y normales (Box-Muller) generadas por bloques."""
+    from core.aleatorios import DESCRIPCIONES, GENERADORES
+    from core.generadores import generar_por_bloques
+
+    cantidad = 1_000_000
+
+    def normales(generador):
+        for _ in generar_por_bloques("Normal", cantidad, (0, 1), 0,
+                                     generador=generador):
+            pass
+
+    print(f"== Generadores ({cantidad:,} valores, Mmuestras/s) ==")
+    print(f"{'Generador':<38} {'Uniformes':>10} {'Normales':>10}")
+    t = medir(lambda: generar_numeros_pseudoaleatorios(cantidad), 1)
+    print(f"{'random global (lista)':<38} {cantidad / t / 1e6:10.1f} "
+          f"{'-':>10}")
+    for clave in GENERADORES:
+        rng = crear_generador(0, clave)
+        repeticiones = 1 if clave == "random" else 3
+        t_unif = medir(lambda: rng.random(cantidad), repeticiones)
+        t_norm = medir(lambda: normales(clave), repeticiones)
+        print(f"{DESCRIPCIONES[clave]:<38} {cantidad / t_unif / 1e6:10.1f} "
+              f"{cantidad / t_norm / 1e6:10.1f}")
+
+
+def bench_pruebas():
+    """K-S y Anderson-Darling sobre 1M de valores: ordenando una vez, por
+    bloques (K-S aproximado) y con scipy.stats como referencia."""
+    from scipy import stats
+
+    from core.paralelo import TAM_BLOQUE
+    from core.pruebas import (KSPorBloques, anderson_darling, ks,
+                              pruebas_ordenadas)
+
+    cantidad = 1_000_000
+    datos = generar_normal(cantidad, 0, 1, crear_generador(0))
+
+    def por_bloques():
+        acumulador = KSPorBloques("Normal", (0, 1))
+        for inicio in range(0, cantidad, TAM_BLOQUE):
+            acumulador.agregar(datos[inicio:inicio + TAM_BLOQUE])
+        return acumulador.resultado()
+
+    print(f"== Pruebas K-S y Anderson-Darling ({cantidad:,} valores) ==")
+    for nombre, funcion in [
+        ("K-S (ordena)", lambda: ks(datos, "Normal", (0, 1))),
+        ("Anderson-Darling (ordena)",
+         lambda: anderson_darling(datos, "Normal", (0, 1))),
+        ("K-S + A-D (un solo orden)",
+         lambda: pruebas_ordenadas(datos, "Normal", (0, 1))),
+        ("K-S por bloques", por_bloques),
+        ("scipy.stats.kstest", lambda: stats.kstest(datos, "norm")),
+    ]:
+        print(f"{nombre:<28} {medir(funcion):8.3f} s")
+    exacto = ks(datos, "Normal", (0, 1))["estadistico"]
+    aproximado = por_bloques()
+    print(f"D exacto {exacto:.6f} · D por bloques "
+          f"{aproximado['estadistico']:.6f} "
+          f"(error maximo {aproximado['error_maximo']:.1e}) · "
+          f"scipy {stats.kstest(datos, 'norm').statistic:.6f}")
+
+
+def bench_resumen():
+    """Resumen de 1M de valores: por bloques en una pasada (ResumenSerie),
+    con varias pasadas de numpy sobre la serie completa y sobre una lista."""
+    import statistics
+
+    from scipy import stats
+
+    from core.estadisticas import CUANTILES, ResumenSerie
+    from core.generadores import TAM_BLOQUE
+
+    cantidad = 1_000_000
+    datos = generar_normal(cantidad, 0, 1, crear_generador(0))
+    lista = datos.tolist()
+
+    def por_bloques():
+        resumen = ResumenSerie()
+        for inicio in range(0, cantidad, TAM_BLOQUE):
+            resumen.agregar(datos[inicio:inicio + TAM_BLOQUE])
+        return resumen.resultado()
+
+    def numpy_pasadas():
+        return (datos.mean(), datos.var(ddof=1), stats.skew(datos),
+                stats.kurtosis(datos), datos.min(), datos.max(),
+                np.quantile(datos, CUANTILES))
+
+    def lista_python():
+        return (statistics.fmean(lista), statistics.variance(lista),
+                statistics.quantiles(lista, n=100))
+
+    print(f"== Resumen de la serie ({cantidad:,} valores) ==")
+    t_gen = medir(lambda: generar_normal(cantidad, 0, 1))
+    print(f"{'Generar (referencia)':<32} {t_gen:8.3f} s")
+    for nombre, funcion, repeticiones in [
+        ("ResumenSerie por bloques", por_bloques, 3),
+        ("numpy/scipy (varias pasadas)", numpy_pasadas, 3),
+        ("statistics sobre lista", lista_python, 1),
+    ]:
+        print(f"{nombre:<32} {medir(funcion, repeticiones):8.3f} s")
+
+    ordenados = np.sort(datos)
+    aproximados = np.array(list(por_bloques()["cuantiles"].values()))
+    error = np.abs(np.searchsorted(ordenados, aproximados) / cantidad
+                   - np.array(CUANTILES)).max()
+    print(f"Error maximo de rango de los cuantiles: {error:.5f}")
+
+
+def bench_almacenamiento():
+    """
+    Memoria y costo de histograma de una serie de 1M de valores guardada
+    como lista de floats (camino original) o como arreglo float64/float32.
+    La memoria es el pico y lo retenido medidos con tracemalloc.
+    """
+    import tracemalloc
+
+    from core.paralelo import generar_paralelo
+
+    cantidad = 1_000_000
+    caminos = [
+        ("lista (darDistNorm)",
+         lambda: darDistNorm(generar_numeros_pseudoaleatorios(cantidad, 0),
+                             0, 1)),
+        ("arreglo float64",
+         lambda: generar_paralelo("Normal", cantidad, (0, 1), 0, 1)),
+        ("arreglo float32",
+         lambda: generar_paralelo("Normal", cantidad, (0, 1), 0, 1,
+                                  tipo="float32")),
+    ]
+    print(f"== Almacenamiento de la serie ({cantidad:,} valores) ==")
+    print(f"{'Serie':<22} {'Retenido':>10} {'Pico':>10} {'Histograma':>11}")
+    for nombre, generar in caminos:
+        tracemalloc.start()
+        serie = generar()
+        retenido, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        t_hist = medir(lambda: np.histogram(serie, bins=10))
+        print(f"{nombre:<22} {retenido / 2**20:8.1f}MiB "
+              f"{pico / 2**20:8.1f}MiB {t_hist * 1e3:9.1f}ms")
+        del serie
+
+
+def bench_intervalos():
+    """
+    Estrategias de intervalos sobre 1M de valores exponenciales: cantidad de
+    intervalos, clases que quedan tras agrupar FE < 5 y tiempo de armar los
+    bordes y contar FO, sobre la serie ordenada y sin ordenar (por bloques).
+    """
+    from core.analisis import Analisis
+    from core.intervalos import ESTRATEGIAS, contar
+
+    cantidad = 1_000_000
+    datos = generar_exponencial(cantidad, 1.0, crear_generador(0))
+    ordenados = np.sort(datos)
+    bordes = np.linspace(0, 8, 21)
+
+    print(f"== Estrategias de intervalos ({cantidad:,} valores, "
+          f"exponencial) ==")
+    print(f"{'Estrategia':<28} {'k':>5} {'Agrupadas':>10} {'χ²':>10} "
+          f"{'Ordenada':>9} {'Bloques':>9}")
+    for clave, nombre in ESTRATEGIAS.items():
+        fijos = bordes if clave == "fijos" else None
+        a = Analisis.desde_datos(ordenados, 10, "Exponencial Negativa",
+                                 (1.0,), clave, fijos, ordenados=True)
+        t_ord = medir(lambda: Analisis.desde_datos(
+            ordenados, 10, "Exponencial Negativa", (1.0,), clave, fijos,
+            ordenados=True))
+        t_bloques = medir(lambda: Analisis.desde_datos(
+            datos, 10, "Exponencial Negativa", (1.0,), clave, fijos))
+        print(f"{nombre:<28} {a.intervalos:>5} {len(a.agrupadas):>10} "
+              f"{a.chi2:10.3f} {t_ord * 1e3:7.1f}ms {t_bloques * 1e3:7.1f}ms")
+
+    bordes = np.linspace(datos.min(), datos.max(), 11)
+    print(f"Contar FO (10 intervalos): np.histogram "
+          f"{medir(lambda: np.histogram(datos, bins=bordes)) * 1e3:.1f}ms, "
+          f"searchsorted sobre la serie ordenada "
+          f"{medir(lambda: contar(ordenados, bordes, True)) * 1e3:.3f}ms")
+
+
+def bench_barrido():
+    """
+    Barrido de 3 x 3 parametros normales x 2 N x 2 intervalos (36 celdas):
+    sin cache con 1 y con todos los procesos, y repetido con la cache llena.
+    """
+    import tempfile
+
+    from core.barrido import CacheBarrido, armar_grilla, barrido
+
+    celdas, _ = armar_grilla(
+        "Normal", {"media": [0, 0.05, 0.1], "desviacion": [1, 1.1, 1.2]},
+        [100_000, 1_000_000], [10, 20], semillas=[0])
+    print(f"== Barrido ({len(celdas)} celdas, nucleos: {os.cpu_count()}) ==")
+    with tempfile.TemporaryDirectory() as directorio:
+        cache = CacheBarrido(directorio)
+        for trabajadores in sorted({1, os.cpu_count() or 1}):
+            t = medir(lambda: list(barrido(celdas, trabajadores)), 1)
+            print(f"Sin cache, {trabajadores} procesos: {t:.2f}s")
+        list(barrido(celdas, None, cache))
+        t = medir(lambda: list(barrido(celdas, None, cache)))
+        print(f"Con la cache llena: {t * 1e3:.1f}ms")
+
+
+SECCIONES = {
+    "generacion": bench_generacion,
+    "paralelo": bench_paralelo,
+    "vistas": bench_vistas,
+    "exportacion": bench_exportacion,
+    "agrupacion": bench_agrupacion,
+    "fe": bench_fe,
+    "critico": bench_critico,
+    "arranque": bench_arranque,
+    "memoria": bench_memoria,
+    "histograma": bench_histograma,
+    "distribuciones": bench_distribuciones,
+    "generadores": bench_generadores,
+    "pruebas": bench_pruebas,
+    "resumen": bench_resumen,
+    "almacenamiento": bench_almacenamiento,
+    "intervalos": bench_intervalos,
+    "barrido": bench_barrido,
+}
+
+
+if __name__ == "__main__":
+    elegidas = sys.argv[1:] or list(SECCIONES)
+    for nombre in elegidas:
+        SECCIONES[nombre]()
+        print()
@@ -0,0 +1,285 @@
+"""
+Modo de linea de comandos, sin interfaz grafica (no importa Qt ni
+matplotlib). Ejemplos:
+
+    python -m core chi2 --dist normal -n 1000000 --params 0 1 --semilla 42
+    python -m core chi2 --dist exponencial -n 5000 --params 0.5 \\
+        --intervalos 15 --alpha 0.01 --salida resultado.csv
+    python -m core chi2 --dist normal -n 100000 --params 0 1 \\
+        --estrategia equiprobables --intervalos 20
+    python -m core montecarlo --dist exponencial --params 1 \\
+        --hip normal --params-hip 1 1 -n 200 --replicas 100000
+    python -m core barrido --dist normal --param media 0 0.1 \\
+        --param desviacion 1 2 -n 10000 100000 --intervalos 10 20 \\
+        --semillas 1 2 3 --salida barrido.csv
+
+Las distribuciones y sus parametros salen del registro de
+core.distribuciones.
+
+La serie se genera por bloques y solo se guarda su histograma, asi que la
+memoria no depende de N. Con la misma semilla se obtiene la misma serie que
+en la interfaz.
+"""
+import argparse
+import csv
+import json
+import math
+import sys
+
+from core.aleatorios import GENERADOR_POR_DEFECTO, GENERADORES
+from core.analisis import ejecutar_chi2
+from core.barrido import (
+    DIRECTORIO_CACHE, CacheBarrido, armar_grilla, barrido, fila_resumen)
+from core.distribuciones import DISTRIBUCIONES, por_clave
+from core.intervalos import ESTRATEGIA_POR_DEFECTO, ESTRATEGIAS, calcular_bordes
+from core.montecarlo import estudio_chi2
+
+CLAVES = [d.clave for d in DISTRIBUCIONES.values()]
+AYUDA_PARAMS = "; ".join(
+    f"{d.clave}: {' '.join(d.nombres_parametros())}"
+    for d in DISTRIBUCIONES.values())
+
+
+def escribir_csv(resultado, f):
+    """Tabla de χ² agrupada, igual a la que muestra la interfaz."""
+    escritor = csv.writer(f)
+    escritor.writerow(["desde", "hasta", "fo", "fe", "chi2", "chi2_acumulado"])
+    acumulado = 0.0
+    for g in resultado["agrupadas"]:
+        # Con FE = 0 (ver "motivo" en el resultado) χ² no esta definido
+        chi2 = ((g["fo"] - g["fe"]) ** 2 / g["fe"] if g["fe"] > 0
+                else float("nan"))
+        acumulado += chi2
+        escritor.writerow([g["li"], g["ls"], g["fo"], g["fe"], chi2, acumulado])
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m core",
+        description="Generacion y prueba de χ² sin interfaz grafica.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    chi2 = sub.add_parser("chi2", help="genera una serie y aplica χ²")
+    chi2.add_argument("--dist", required=True, choices=CLAVES)
+    chi2.add_argument("-n", "--cantidad", type=int, required=True)
+    chi2.add_argument("--params", type=float, nargs="+", required=True,
+                      help=AYUDA_PARAMS)
+    chi2.add_argument("--intervalos", type=int, default=10)
+    chi2.add_argument("--estrategia", choices=ESTRATEGIAS,
+                      default=ESTRATEGIA_POR_DEFECTO,
+                      help="como armar los intervalos (sturges y "
+                           "freedman-diaconis eligen su cantidad)")
+    chi2.add_argument("--bordes", type=float, nargs="+", default=None,
+                      help="bordes fijos crecientes (implica --estrategia "
+                           "fijos)")
+    chi2.add_argument("--alpha", type=float, default=0.05)
+    chi2.add_argument("--semilla", type=int, default=None)
+    chi2.add_argument("--generador", choices=GENERADORES,
+                      default=GENERADOR_POR_DEFECTO)
+    chi2.add_argument("--trabajadores", type=int, default=1)
+    chi2.add_argument("--sin-ks", action="store_true",
+                      help="no calcular K-S aproximado (otra pasada)")
+    chi2.add_argument("--salida", default=None,
+                      help="archivo .json o .csv (por defecto JSON a stdout)")
+
+    mc = sub.add_parser(
+        "montecarlo",
+        help="tasa de rechazo de χ² en muchas replicas (tamaño/potencia)")
+    mc.add_argument("--dist", required=True, choices=CLAVES,
+                    help="distribucion real de los datos")
+    mc.add_argument("--params", type=float, nargs="+", required=True,
+                    help=AYUDA_PARAMS)
+    mc.add_argument("--hip", choices=CLAVES, default=None,
+                    help="distribucion hipotetica (por defecto, la real)")
+    mc.add_argument("--params-hip", type=float, nargs="+", default=None)
+    mc.add_argument("-n", "--cantidad", type=int, required=True)
+    mc.add_argument("--replicas", type=int, default=10_000)
+    mc.add_argument("--intervalos", type=int, default=10)
+    mc.add_argument("--alpha", type=float, default=0.05)
+    mc.add_argument("--semilla", type=int, default=None)
+    mc.add_argument("--generador", choices=GENERADORES,
+                    default=GENERADOR_POR_DEFECTO)
+    mc.add_argument("--trabajadores", type=int, default=1)
+    mc.add_argument("--salida", default=None,
+                    help="archivo .json (por defecto JSON a stdout)")
+
+    bar = sub.add_parser(
+        "barrido",
+        help="χ² para cada combinacion de una grilla de parametros, con "
+             "cache en disco")
+    bar.add_argument("--dist", required=True, choices=CLAVES)
+    bar.add_argument("--param", nargs="+", action="append", default=[],
+                     metavar=("NOMBRE", "VALOR"),
+                     help="valores de un parametro (se repite por "
+                          "parametro; los que faltan van por defecto). "
+                          + AYUDA_PARAMS)
+    bar.add_argument("-n", "--cantidad", type=int, nargs="+", required=True)
+    bar.add_argument("--intervalos", type=int, nargs="+", default=[10])
+    bar.add_argument("--estrategia",
+                     choices=[e for e in ESTRATEGIAS if e != "fijos"],
+                     default=ESTRATEGIA_POR_DEFECTO)
+    bar.add_argument("--semillas", type=int, nargs="+", default=[0])
+    bar.add_argument("--alpha", type=float, default=0.05)
+    bar.add_argument("--generador", choices=GENERADORES,
+                     default=GENERADOR_POR_DEFECTO)
+    bar.add_argument("--trabajadores", type=int, default=None,
+                     help="procesos (por defecto, uno por nucleo)")
+    bar.add_argument("--sin-ks", action="store_true")
+    bar.add_argument("--cache", default=str(DIRECTORIO_CACHE),
+                     help="directorio de la cache (por defecto %(default)s)")
+    bar.add_argument("--sin-cache", action="store_true",
+                     help="no leer ni guardar resultados en la cache")
+    bar.add_argument("--salida", default=None,
+                     help="archivo .json o .csv (por defecto JSON a stdout)")
+    return parser
+
+
+def _distribucion(parser, clave, params):
+    """(nombre, params validados) o un error de uso si no son validos."""
+    distribucion = por_clave(clave)
+    try:
+        return distribucion.nombre, distribucion.validar(params)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def _bordes(parser, args, distribucion, params):
+    """(estrategia, bordes) del chi2; error de uso si los bordes no sirven
+    (tambien si no abarcan valores posibles de la distribucion)."""
+    if args.bordes is None:
+        if args.estrategia == "fijos":
+            parser.error("--estrategia fijos necesita --bordes")
+        return args.estrategia, None
+    try:
+        calcular_bordes("fijos", None, distribucion, params, None, None,
+                        None, bordes=args.bordes)
+    except ValueError as e:
+        parser.error(str(e))
+    return "fijos", args.bordes
+
+
+def _validar_numeros(parser, args):
+    """Error de uso si N, intervalos, alpha o trabajadores no sirven."""
+    if args.cantidad < 1:
+        parser.error("-n/--cantidad debe ser al menos 1")
+    if args.intervalos < 2:
+        parser.error("--intervalos debe ser al menos 2")
+    if not 0 < args.alpha < 1:
+        parser.error("--alpha debe estar entre 0 y 1 (sin incluirlos)")
+    if args.trabajadores < 1:
+        parser.error("--trabajadores debe ser al menos 1")
+    if getattr(args, "replicas", 1) < 1:
+        parser.error("--replicas debe ser al menos 1")
+
+
+def _montecarlo(parser, args):
+    real, params = _distribucion(parser, args.dist, args.params)
+    hip, params_hip = None, None
+    if args.hip:
+        hip, params_hip = _distribucion(
+            parser, args.hip, args.params_hip or [])
+    resultado = estudio_chi2(
+        args.cantidad, args.intervalos, args.alpha, args.replicas,
+        real, params, hip, params_hip, args.semilla, args.trabajadores,
+        args.generador)
+    # Por replica solo se informa la media del estadistico (de las que
+    # tienen un χ² finito)
+    chi2 = [c for c in resultado.pop("chi2").tolist() if math.isfinite(c)]
+    resultado["chi2_medio"] = sum(chi2) / len(chi2) if chi2 else None
+    resultado["grados_libertad_medio"] = float(
+        resultado.pop("grados_libertad").mean())
+    return resultado
+
+
+def _barrido(parser, args):
+    distribucion = por_clave(args.dist)
+    valores = {}
+    for nombre, *textos in args.param:
+        try:
+            valores[nombre] = [float(t) for t in textos]
+        except ValueError:
+            parser.error(f"--param {nombre}: los valores deben ser numeros")
+        if not textos:
+            parser.error(f"--param {nombre} necesita al menos un valor")
+    if min(args.cantidad) < 1:
+        parser.error("-n/--cantidad: cada N debe ser al menos 1")
+    if min(args.intervalos) < 2:
+        parser.error("--intervalos: cada cantidad debe ser al menos 2")
+    if not 0 < args.alpha < 1:
+        parser.error("--alpha debe estar entre 0 y 1 (sin incluirlos)")
+    if args.trabajadores is not None and args.trabajadores < 1:
+        parser.error("--trabajadores debe ser al menos 1")
+    if min(args.semillas) < 0:
+        parser.error("--semillas: las semillas no pueden ser negativas")
+    try:
+        celdas, omitidas = armar_grilla(
+            distribucion.nombre, valores, args.cantidad, args.intervalos,
+            args.semillas, args.generador, args.estrategia, args.alpha,
+            con_ks=not args.sin_ks)
+    except ValueError as e:
+        parser.error(str(e))
+    if not celdas:
+        parser.error(f"Ninguna combinacion es valida: {omitidas[0][1]}")
+
+    cache = None if args.sin_cache else CacheBarrido(args.cache)
+    filas = [None] * len(celdas)
+    for i, resultado, de_cache in barrido(celdas, args.trabajadores, cache):
+        filas[i] = fila_resumen(celdas[i], resultado, de_cache)
+    return {
+        "distribucion": distribucion.nombre,
+        "celdas": filas,
+        "en_cache": sum(f["de_cache"] for f in filas),
+        "omitidas": [{"parametros": list(p), "motivo": m}
+                     for p, m in omitidas],
+    }
+
+
+def escribir_csv_barrido(resultado, f):
+    """Una fila por celda, con una columna por parametro."""
+    escritor = csv.writer(f)
+    filas = resultado["celdas"]
+    nombres = list(filas[0]["parametros"])
+    columnas = [c for c in filas[0] if c != "parametros"]
+    escritor.writerow(nombres + columnas)
+    for fila in filas:
+        escritor.writerow(list(fila["parametros"].values())
+                          + [fila[c] for c in columnas])
+
+
+def main(argv=None):
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.comando in ("chi2", "montecarlo"):
+        _validar_numeros(parser, args)
+
+    if args.comando == "montecarlo":
+        resultado = _montecarlo(parser, args)
+    elif args.comando == "barrido":
+        resultado = _barrido(parser, args)
+    else:
+        distribucion, params = _distribucion(parser, args.dist, args.params)
+        estrategia, bordes = _bordes(parser, args, distribucion, params)
+        resultado = ejecutar_chi2(
+            distribucion, args.cantidad, params, args.intervalos,
+            args.alpha, args.semilla, args.trabajadores, args.generador,
+            con_ks=not args.sin_ks, estrategia=estrategia, bordes=bordes)
+
+    if args.comando == "chi2" and args.salida and args.salida.endswith(".csv"):
+        with open(args.salida, "w", encoding="utf-8", newline="") as f:
+            escribir_csv(resultado, f)
+    elif (args.comando == "barrido" and args.salida
+            and args.salida.endswith(".csv")):
+        with open(args.salida, "w", encoding="utf-8", newline="") as f:
+            escribir_csv_barrido(resultado, f)
+    elif args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2,
+                      allow_nan=False)
+    else:
+        json.dump(resultado, sys.stdout, ensure_ascii=False, indent=2,
+                  allow_nan=False)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Generadores de numeros pseudoaleatorios intercambiables.
+
+Todos se crean a partir de una semilla (None, entero o SeedSequence) y
+ofrecen random(n): un arreglo float64 de n uniformes en [0, 1) (o un float
+si n es None), que es lo unico que usan las transformaciones de
+core.distribuciones.
+
+- "pcg64": numpy PCG64 (por defecto; igual a numpy.random.default_rng)
+- "philox": numpy Philox (basado en contador)
+- "sfc64": numpy SFC64 (el mas rapido de numpy)
+- "random": random.Random de la biblioteca estandar (Mersenne Twister),
+  un llamado por valor
+- "lcg": congruencial lineal mixto de 32 bits, vectorizado
+"""
+import random
+
+import numpy as np
+
+GENERADOR_POR_DEFECTO = "pcg64"
+
+
+def secuencia_semilla(semilla=None):
+    """Normaliza una semilla (None, entero o SeedSequence) a SeedSequence."""
+    if isinstance(semilla, np.random.SeedSequence):
+        return semilla
+    return np.random.SeedSequence(semilla)
+
+
+class GeneradorRandom:
+    """Adaptador de random.Random con la interfaz random(n)."""
+
+    def __init__(self, semilla=None):
+        estado = secuencia_semilla(semilla).generate_state(4, np.uint32)
+        self._random = random.Random(int.from_bytes(estado.tobytes(), "little"))
+
+    def random(self, n=None):
+        if n is None:
+            return self._random.random()
+        siguiente = self._random.random
+        return np.fromiter((siguiente() for _ in range(n)),
+                           dtype=np.float64, count=n)
+
+
+class GeneradorLCG:
+    """
+    Congruencial lineal mixto X[i+1] = (a X[i] + c) mod 2^32, con las
+    constantes de Numerical Recipes. U[i] = X[i] / 2^32.
+
+    Se genera de a tramos: con los coeficientes a^k y c(a^(k-1) + ... + 1)
+    precalculados para k = 1..TRAMO, cada valor de un tramo sale del ultimo
+    valor del tramo anterior en una sola operacion vectorizada, y la
+    secuencia es la misma que aplicando la formula de a un valor.
+    """
+    A = 1664525
+    C = 1013904223
+    M = 2 ** 32
+    TRAMO = 65536
+    _coeficientes = None
+
+    def __init__(self, semilla=None):
+        estado = secuencia_semilla(semilla).generate_state(1, np.uint32)
+        self.estado = int(estado[0])
+
+    @classmethod
+    def coeficientes(cls):
+        """(a^k, c(a^(k-1) + ... + 1)) mod 2^32 para k = 1..TRAMO, armados
+        por duplicacion: con los de 1..h salen los de h+1..2h."""
+        if cls._coeficientes is None:
+            mascara = np.uint64(cls.M - 1)
+            mult = np.array([cls.A], dtype=np.uint64)
+            suma = np.array([cls.C], dtype=np.uint64)
+            while len(mult) < cls.TRAMO:
+                # X[h+j] = a^j X[h] + c_j = a^j (a^h X[0] + c_h) + c_j
+                mult, suma = (
+                    np.concatenate([mult, (mult * mult[-1]) & mascara]),
+                    np.concatenate([suma, (mult * suma[-1] + suma) & mascara]),
+                )
+            cls._coeficientes = mult[:cls.TRAMO], suma[:cls.TRAMO]
+        return cls._coeficientes
+
+    def random(self, n=None):
+        if n is None:
+            return float(self.random(1)[0])
+        mult, suma = self.coeficientes()
+        mascara = np.uint64(self.M - 1)
+        res = np.empty(n, dtype=np.float64)
+        x = np.uint64(self.estado)
+        for inicio in range(0, n, self.TRAMO):
+            m = min(self.TRAMO, n - inicio)
+            tramo = (mult[:m] * x + suma[:m]) & mascara
+            res[inicio:inicio + m] = tramo
+            x = tramo[-1]
+        self.estado = int(x)
+        res *= 1.0 / self.M
+        return res
+
+
+def _numpy(bit_generator):
+    return lambda semilla: np.random.Generator(
+        bit_generator(secuencia_semilla(semilla)))
+
+
+GENERADORES = {
+    "pcg64": _numpy(np.random.PCG64),
+    "philox": _numpy(np.random.Philox),
+    "sfc64": _numpy(np.random.SFC64),
+    "random": GeneradorRandom,
+    "lcg": GeneradorLCG,
+}
+
+DESCRIPCIONES = {
+    "pcg64": "PCG64 (numpy)",
+    "philox": "Philox (numpy)",
+    "sfc64": "SFC64 (numpy)",
+    "random": "Mersenne Twister (random de Python)",
+    "lcg": "Congruencial lineal 32 bits",
+}
+
+
+def crear_generador(semilla=None, generador=GENERADOR_POR_DEFECTO):
+    """
+    Crea el generador indicado (una clave de GENERADORES) inicializado con
+    semilla. Con "pcg64" es un numpy.random.Generator igual al de
+    numpy.random.default_rng(semilla).
+    """
+    try:
+        fabrica = GENERADORES[generador]
+    except KeyError:
+        raise ValueError(f"Generador desconocido: {generador}") from None
+    return fabrica(semilla)
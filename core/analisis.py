@@ -0,0 +1,232 @@
+"""
+Analisis de una serie para la prueba de χ².
+
+Los bordes, FO, FE y las clases agrupadas se calculan una sola vez por serie
+(con un unico histograma) y todas las vistas de resultados leen de aca.
+"""
+import time
+from functools import cached_property
+
+import numpy as np
+
+from core.aleatorios import GENERADOR_POR_DEFECTO
+from core.distribuciones import obtener
+from core.estadisticas import ResumenSerie, resumen_teorico
+from core.generadores import (
+    TAM_BLOQUE,
+    HistogramaAcumulado,
+    agrupar_frecuencias,
+    chi2_por_clase,
+    chi2_critico_gl,
+    clases_desde_arreglos,
+    frecuencias_esperadas_bordes,
+    semilla_raiz,
+)
+from core.intervalos import (
+    ESTRATEGIA_POR_DEFECTO,
+    calcular_bordes,
+    colas_abiertas,
+    contar,
+    fe_condicionada,
+    rango_intercuartil,
+    usa_ric,
+)
+from core.paralelo import histograma_paralelo, ks_paralelo
+from core.pruebas import rechaza, valor_critico
+
+
+class Analisis:
+    """
+    Resultado del analisis de una serie:
+    - bordes: arreglo con los k+1 limites de los intervalos
+    - fo, fe: arreglos con las frecuencias observada y esperada por intervalo
+    - clases: lista de dicts {'li', 'ls', 'fo', 'fe'} por intervalo
+    - agrupadas: clases agrupadas hasta que cada una tenga FE >= 5
+    - chi2_grupos: aporte (FO - FE)^2 / FE de cada grupo
+    - estrategia: la de core.intervalos con que se armaron los bordes (con
+      "equiprobables" las clases de los extremos son abiertas en FE)
+    - fuera: valores que quedaron fuera de los bordes (solo con "fijos"; FE
+      se reparte entre los de adentro)
+    """
+
+    def __init__(self, bordes, fo, total, distrib, params,
+                 estrategia=ESTRATEGIA_POR_DEFECTO):
+        self.bordes = np.asarray(bordes, dtype=np.float64)
+        self.total = total
+        self.distribucion = distrib
+        self.params = tuple(params)
+        self.estrategia = estrategia
+
+        self.fo = np.asarray(fo, dtype=np.int64)
+        dentro = int(self.fo.sum())
+        self.fuera = total - dentro
+        if fe_condicionada(estrategia):
+            # FO y FE suman lo mismo: la probabilidad de cada clase se
+            # divide por la de [b₀, bₖ] y se multiplica por los de adentro
+            prob = frecuencias_esperadas_bordes(self.bordes, 1.0, distrib,
+                                                params)
+            masa = prob.sum()
+            self.fe = prob * (dentro / masa) if masa > 0 else prob * 0.0
+        else:
+            self.fe = frecuencias_esperadas_bordes(
+                self.bordes, total, distrib, params,
+                colas_abiertas(estrategia))
+
+        cortes, fo_agr, fe_agr = agrupar_frecuencias(self.fo, self.fe)
+        fines = np.append(cortes[1:], len(self.fo))
+        # Una clase con FE = 0 (bordes degenerados o fuera del soporte) da
+        # infinito o nan; motivo_sin_decision lo informa
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.chi2_grupos = chi2_por_clase(fo_agr, fe_agr)
+        self.agrupadas = [
+            {"li": self.bordes[i], "ls": self.bordes[j], "fo": fo, "fe": fe}
+            for i, j, fo, fe in zip(cortes, fines, fo_agr.tolist(),
+                                    fe_agr.tolist())
+        ]
+
+    @cached_property
+    def clases(self):
+        """Una fila {'li', 'ls', 'fo', 'fe'} por intervalo (para mostrar)."""
+        return clases_desde_arreglos(self.bordes, self.fo, self.fe)
+
+    @classmethod
+    def desde_datos(cls, datos, intervalos, distrib, params,
+                    estrategia=ESTRATEGIA_POR_DEFECTO, bordes=None,
+                    ordenados=False, ric=None):
+        """
+        Analiza una serie con los intervalos de la estrategia (por defecto,
+        igual ancho entre min y max). Si la serie ya esta ordenada, min, max
+        y el rango intercuartil salen de ella y FO se cuenta sin recorrerla;
+        si no, se cuenta por bloques. ric evita calcular el rango
+        intercuartil (por ejemplo, si ya se estimo al generar).
+        """
+        n = len(datos)
+        if ordenados:
+            minimo, maximo = datos[0], datos[-1]
+        else:
+            minimo, maximo = np.min(datos), np.max(datos)
+        if usa_ric(estrategia) and ric is None:
+            ric = rango_intercuartil(datos if ordenados else np.sort(datos))
+        bordes = calcular_bordes(estrategia, intervalos, distrib, params, n,
+                                 float(minimo), float(maximo), ric, bordes)
+        if ordenados:
+            fo = contar(datos, bordes, ordenados=True)
+        else:
+            hist = HistogramaAcumulado(bordes)
+            for inicio in range(0, n, TAM_BLOQUE):
+                hist.agregar(datos[inicio:inicio + TAM_BLOQUE])
+            fo = hist.fo
+        return cls(bordes, fo, n, distrib, params, estrategia)
+
+    @classmethod
+    def desde_histograma(cls, hist, distrib, params,
+                         estrategia=ESTRATEGIA_POR_DEFECTO):
+        """Analiza a partir de un HistogramaAcumulado (serie por bloques)."""
+        return cls(hist.bordes, hist.fo, hist.total, distrib, params,
+                   estrategia)
+
+    @property
+    def intervalos(self):
+        return len(self.fo)
+
+    @property
+    def grados_libertad(self):
+        """Segun la regla de la distribucion, con las clases agrupadas."""
+        return obtener(self.distribucion).grados_libertad(len(self.agrupadas))
+
+    @property
+    def chi2(self):
+        """Estadistico χ² calculado sobre las clases agrupadas."""
+        return float(self.chi2_grupos.sum())
+
+    @property
+    def motivo_sin_decision(self):
+        """Por que χ² no permite decidir (None si lo permite): alguna clase
+        agrupada con FE = 0, χ² no finito o menos de un grado de libertad."""
+        if min(g["fe"] for g in self.agrupadas) <= 0:
+            return ("Hay clases con frecuencia esperada 0 (intervalos "
+                    "degenerados o fuera del soporte de la distribucion)")
+        if not np.isfinite(self.chi2):
+            return "El estadistico χ² no es finito"
+        if self.grados_libertad < 1:
+            return ("Sin grados de libertad: quedan muy pocas clases "
+                    "tras agrupar")
+        return None
+
+
+def ejecutar_chi2(distrib, cantidad, params, intervalos=10, alpha=0.05,
+                  semilla=None, trabajadores=1,
+                  generador=GENERADOR_POR_DEFECTO, con_ks=True,
+                  estrategia=ESTRATEGIA_POR_DEFECTO, bordes=None):
+    """
+    Genera la serie, arma las clases de χ² segun la estrategia de
+    core.intervalos (bordes: los del usuario, para "fijos"), las agrupa
+    (FE >= 5) y la compara con el valor critico. En la misma pasada resume
+    la serie (momentos y cuantiles, junto a los teoricos). Con con_ks
+    agrega ademas K-S aproximado por bloques (otra pasada de generacion,
+    sin ordenar la serie).
+    Devuelve un dict serializable a JSON.
+    """
+    raiz = semilla_raiz(semilla)
+
+    t0 = time.perf_counter()
+    resumen = ResumenSerie()
+    hist = histograma_paralelo(distrib, cantidad, params, intervalos, raiz,
+                               trabajadores=trabajadores, generador=generador,
+                               resumen=resumen, estrategia=estrategia,
+                               bordes=bordes)
+    t1 = time.perf_counter()
+    analisis = Analisis.desde_histograma(hist, distrib, params, estrategia)
+    # Si χ² no permite decidir (por ejemplo, N tan chico que todo queda en
+    # un grupo) no hay valor critico ni decision, y se informa el motivo.
+    # Un χ² no finito tambien queda en None para que el JSON sea valido
+    motivo = analisis.motivo_sin_decision
+    chi2 = analisis.chi2 if np.isfinite(analisis.chi2) else None
+    critico = None
+    if motivo is None:
+        critico = float(chi2_critico_gl(analisis.grados_libertad, alpha))
+    t2 = time.perf_counter()
+
+    resultado = {
+        "distribucion": distrib,
+        "parametros": list(params),
+        "cantidad": cantidad,
+        "intervalos": analisis.intervalos,
+        "estrategia": estrategia,
+        "fuera_de_bordes": analisis.fuera,
+        "semilla": raiz.entropy,
+        "generador": generador,
+        "alpha": alpha,
+        "clases": _clases_serializables(analisis.clases),
+        "agrupadas": _clases_serializables(analisis.agrupadas),
+        "chi2": chi2,
+        "grados_libertad": analisis.grados_libertad,
+        "chi2_critico": critico,
+        "rechaza_h0": None if critico is None else bool(chi2 > critico),
+        "motivo": motivo,
+        "resumen": {
+            "serie": resumen.resultado(),
+            "teorico": resumen_teorico(distrib, params),
+        },
+        "tiempos": {
+            "generacion": t1 - t0,
+            "analisis": t2 - t1,
+            "valores_por_segundo": cantidad / (t1 - t0),
+        },
+    }
+    if con_ks:
+        ks = ks_paralelo(distrib, cantidad, params, raiz, trabajadores,
+                         generador=generador)
+        ks["critico"] = valor_critico(ks, alpha)
+        ks["rechaza_h0"] = rechaza(ks, alpha)
+        resultado["ks"] = ks
+        resultado["tiempos"]["ks"] = time.perf_counter() - t2
+    return resultado
+
+
+def _clases_serializables(clases):
+    return [
+        {"li": float(c["li"]), "ls": float(c["ls"]),
+         "fo": int(c["fo"]), "fe": float(c["fe"])}
+        for c in clases
+    ]
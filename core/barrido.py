@@ -0,0 +1,212 @@
+"""
+Barrido de parametros: corre la prueba de χ² (ejecutar_chi2) para cada
+combinacion de una grilla y guarda cada resultado en disco.
+
+- armar_grilla: producto de los valores de cada parametro, N, intervalos y
+  semillas. Las combinaciones que la distribucion no admite (por ejemplo,
+  A >= B) y las de menos de 2 intervalos se omiten.
+- CacheBarrido: un .json por celda, nombrado con el hash SHA-256 de la
+  celda (distribucion, parametros, N, intervalos, estrategia, semilla,
+  generador, alpha y si incluye K-S). Con la misma semilla el resultado no
+  depende de la cantidad de procesos, asi que una celda terminada no se
+  vuelve a calcular.
+- barrido: reparte las celdas pendientes entre procesos (cada celda corre
+  entera en un proceso) y devuelve los resultados a medida que terminan.
+"""
+import hashlib
+import itertools
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from core.aleatorios import GENERADOR_POR_DEFECTO
+from core.analisis import ejecutar_chi2
+from core.distribuciones import obtener
+from core.intervalos import ESTRATEGIA_POR_DEFECTO
+from core.paralelo import cantidad_trabajadores
+
+# Cambia si cambia el formato de los resultados: invalida la cache anterior
+VERSION_CACHE = 1
+
+DIRECTORIO_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "generador-va" / "barrido")
+
+
+def armar_grilla(distrib, valores, cantidades, intervalos=(10,),
+                 semillas=(0,), generador=GENERADOR_POR_DEFECTO,
+                 estrategia=ESTRATEGIA_POR_DEFECTO, alpha=0.05,
+                 con_ks=True):
+    """
+    Celdas del barrido (dicts serializables a JSON), en el orden del
+    producto parametros x N x intervalos x semillas.
+    - valores: {nombre del parametro: lista de valores}; los que faltan
+      toman su valor por defecto
+    Devuelve (celdas, omitidas), donde omitidas es una lista de
+    (parametros, mensaje) de las combinaciones que no pasan la validacion.
+    Lanza ValueError si algun nombre no es un parametro de la distribucion.
+    """
+    distribucion = obtener(distrib)
+    nombres = distribucion.nombres_parametros()
+    desconocidos = set(valores) - set(nombres)
+    if desconocidos:
+        raise ValueError(
+            f"{distribucion.nombre} no tiene los parametros "
+            f"{', '.join(sorted(desconocidos))} ({', '.join(nombres)})")
+    listas = [valores.get(p.nombre) or [p.defecto]
+              for p in distribucion.parametros]
+
+    celdas, omitidas = [], []
+    for combinacion in itertools.product(*listas):
+        try:
+            params = distribucion.validar(combinacion)
+        except ValueError as e:
+            omitidas.append((combinacion, str(e)))
+            continue
+        for k in intervalos:
+            if k < 2:
+                omitidas.append(
+                    (params, f"{k} intervalos: hacen falta al menos 2"))
+        for n, k, semilla in itertools.product(
+                cantidades, [k for k in intervalos if k >= 2], semillas):
+            celdas.append({
+                "distribucion": distribucion.nombre,
+                "parametros": list(params),
+                "cantidad": int(n),
+                "intervalos": int(k),
+                "estrategia": estrategia,
+                "semilla": int(semilla),
+                "generador": generador,
+                "alpha": float(alpha),
+                "con_ks": bool(con_ks),
+            })
+    return celdas, omitidas
+
+
+def es_cacheable(resultado):
+    """True si el resultado tiene χ² y valor critico finitos (si χ² no
+    permite decidir no los tiene y no se guarda)."""
+    return all(resultado.get(clave) is not None
+               and math.isfinite(resultado[clave])
+               for clave in ("chi2", "chi2_critico"))
+
+
+def clave_celda(celda):
+    """Hash SHA-256 (hex) de la celda, que nombra su archivo en la cache."""
+    texto = json.dumps({"version": VERSION_CACHE, **celda}, sort_keys=True)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+class CacheBarrido:
+    """Resultados de celdas ya calculadas, un .json por celda."""
+
+    def __init__(self, directorio=DIRECTORIO_CACHE):
+        self.directorio = Path(directorio)
+
+    def ruta(self, celda):
+        return self.directorio / f"{clave_celda(celda)}.json"
+
+    def obtener(self, celda):
+        """Resultado guardado de la celda, o None si no esta (o no se
+        puede leer)."""
+        try:
+            with open(self.ruta(celda), encoding="utf-8") as f:
+                guardado = json.load(f)
+        except (OSError, ValueError):
+            return None
+        resultado = guardado.get("resultado")
+        if (guardado.get("celda") != celda or not resultado
+                or not es_cacheable(resultado)):
+            return None
+        return resultado
+
+    def guardar(self, celda, resultado):
+        """Guarda el resultado si es_cacheable; si no, no hace nada."""
+        if not es_cacheable(resultado):
+            return
+        # Se escribe a un temporal y se renombra: una corrida interrumpida
+        # no deja archivos a medio escribir
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        ruta = self.ruta(celda)
+        temporal = ruta.with_suffix(".tmp")
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump({"celda": celda, "resultado": resultado}, f,
+                      ensure_ascii=False, allow_nan=False)
+        os.replace(temporal, ruta)
+
+
+def ejecutar_celda(celda):
+    """Corre χ² para una celda, en un solo proceso."""
+    return ejecutar_chi2(
+        celda["distribucion"], celda["cantidad"], celda["parametros"],
+        celda["intervalos"], celda["alpha"], celda["semilla"], 1,
+        celda["generador"], con_ks=celda["con_ks"],
+        estrategia=celda["estrategia"])
+
+
+def barrido(celdas, trabajadores=None, cache=None, contexto=None):
+    """
+    Genera (indice, resultado, de_cache) por cada celda: primero las que ya
+    estan en la cache y despues las demas, a medida que terminan (no en el
+    orden de la grilla). Cada resultado nuevo se guarda en la cache.
+    contexto es el de multiprocessing para el pool (por ejemplo "spawn"
+    desde un hilo de la interfaz). Si se deja de iterar, las celdas que no
+    empezaron se cancelan y las que estan corriendo terminan en sus
+    procesos sin que se las espere (su resultado no se guarda).
+    """
+    pendientes = []
+    for i, celda in enumerate(celdas):
+        resultado = cache.obtener(celda) if cache is not None else None
+        if resultado is None:
+            pendientes.append(i)
+        else:
+            yield i, resultado, True
+    if not pendientes:
+        return
+
+    trabajadores = min(cantidad_trabajadores(trabajadores), len(pendientes))
+    if trabajadores == 1:
+        for i in pendientes:
+            resultado = ejecutar_celda(celdas[i])
+            if cache is not None:
+                cache.guardar(celdas[i], resultado)
+            yield i, resultado, False
+        return
+
+    pool = ProcessPoolExecutor(max_workers=trabajadores, mp_context=contexto)
+    try:
+        futuros = {pool.submit(ejecutar_celda, celdas[i]): i
+                   for i in pendientes}
+        for futuro in as_completed(futuros):
+            i = futuros[futuro]
+            resultado = futuro.result()
+            if cache is not None:
+                cache.guardar(celdas[i], resultado)
+            yield i, resultado, False
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def fila_resumen(celda, resultado, de_cache=False):
+    """Fila de la tabla resumen del barrido (dict plano)."""
+    ks = resultado.get("ks")
+    return {
+        "distribucion": celda["distribucion"],
+        "parametros": obtener(celda["distribucion"]).como_dict(
+            celda["parametros"]),
+        "cantidad": celda["cantidad"],
+        "intervalos": resultado["intervalos"],
+        "semilla": celda["semilla"],
+        "generador": celda["generador"],
+        "chi2": resultado["chi2"],
+        "grados_libertad": resultado["grados_libertad"],
+        "chi2_critico": resultado["chi2_critico"],
+        "rechaza_h0": resultado["rechaza_h0"],
+        "motivo": resultado.get("motivo"),
+        "ks_p_valor": ks["p_valor"] if ks else None,
+        "segundos": sum(v for k, v in resultado["tiempos"].items()
+                        if k != "valores_por_segundo"),
+        "de_cache": de_cache,
+    }
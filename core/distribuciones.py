@@ -0,0 +1,347 @@
+"""
+Registro de distribuciones.
+
+Cada distribucion se registra una sola vez con todo lo que usan la
+generacion, la prueba de χ² y la interfaz:
+- muestrear(n, params, rng): arreglo float64 con n valores, a partir de
+  cualquier generador de core.aleatorios
+- cdf(x, params), pdf(x, params), ppf(p, params): vectorizadas; los
+  parametros pueden ser escalares o arreglos que se combinan con x por
+  broadcasting (por ejemplo, columnas (P, 1) contra bordes (k+1,))
+- parametros: esquema de cada parametro (nombre, etiqueta, valor por
+  defecto y rango) y restricciones entre ellos (por ejemplo A < B)
+- estimados: parametros estimados de la muestra, que restan grados de
+  libertad en χ² (k - 1 - estimados)
+- media(params), varianza(params): momentos teoricos; asimetria(params) y
+  curtosis(params) (en exceso) son opcionales
+
+Para agregar una distribucion alcanza con llamar a registrar().
+"""
+import numpy as np
+from math import sqrt, log, pi, cos, gamma
+
+from core.aleatorios import crear_generador
+
+
+def _uniformes_abiertas(rng, n):
+    """Uniformes en (0, 1], seguras para aplicar log()."""
+    return 1.0 - rng.random(n)
+
+
+# Transformaciones de uniformes (las usan tambien las funciones de listas)
+def transformar_exp(u, lmd):
+    """Transforma un arreglo de uniformes en (0, 1] a la exponencial negativa
+    de parametro lmd: X = -1/lmd * ln(RND).
+    """
+    return (-1 / lmd) * np.log(u)
+
+
+def transformar_norm(u, media, desviacion, rng=None):
+    """Transforma un arreglo de uniformes en (0, 1] a la normal
+    N(media, desviacion) por Box-Muller, tomando los valores de a pares.
+    Si la cantidad es impar, el angulo del ultimo valor se genera con rng.
+    """
+    u = np.asarray(u, dtype=np.float64)
+    n = len(u)
+    pares = n - n % 2
+    res = np.empty(n, dtype=np.float64)
+
+    radio = np.sqrt(-2 * np.log(u[0:pares:2]))
+    angulo = 2 * pi * u[1:pares:2]
+    res[0:pares:2] = radio * np.cos(angulo)
+    res[1:pares:2] = radio * np.sin(angulo)
+
+    if n % 2:
+        rng = rng if rng is not None else crear_generador()
+        res[-1] = sqrt(-2 * log(u[-1])) * cos(2 * pi * rng.random())
+
+    return res * desviacion + media
+
+
+def transformar_unif_ab(u, A, B):
+    """Transforma un arreglo de uniformes en [0, 1) a la uniforme en [A, B]:
+    X = A + RND*(B - A).
+    """
+    return (B - A) * u + A
+
+
+def transformar_weibull(u, forma, escala):
+    """Transforma un arreglo de uniformes en (0, 1] a la Weibull por la
+    inversa: X = escala * (-ln RND)^(1/forma).
+    """
+    return escala * (-np.log(u)) ** (1 / forma)
+
+
+# Generadores vectorizados
+def generar_exponencial(n, lmd, rng=None):
+    """Genera n valores float64 de la exponencial negativa de parametro lmd."""
+    rng = rng if rng is not None else crear_generador()
+    return transformar_exp(_uniformes_abiertas(rng, n), lmd)
+
+
+def generar_normal(n, media, desviacion, rng=None):
+    """Genera n valores float64 de la normal N(media, desviacion) por
+    Box-Muller en una sola pasada vectorizada.
+    """
+    rng = rng if rng is not None else crear_generador()
+    u = _uniformes_abiertas(rng, n + n % 2)
+    return transformar_norm(u, media, desviacion)[:n]
+
+
+def generar_uniforme_ab(n, A, B, rng=None):
+    """Genera n valores float64 de la uniforme en [A, B]."""
+    rng = rng if rng is not None else crear_generador()
+    return transformar_unif_ab(rng.random(n), A, B)
+
+
+def generar_weibull(n, forma, escala, rng=None):
+    """Genera n valores float64 de la Weibull(forma, escala)."""
+    rng = rng if rng is not None else crear_generador()
+    return transformar_weibull(_uniformes_abiertas(rng, n), forma, escala)
+
+
+class Parametro:
+    """Un parametro del esquema de una distribucion."""
+
+    def __init__(self, nombre, etiqueta, defecto, minimo=-1e6, maximo=1e6,
+                 decimales=4):
+        self.nombre = nombre
+        # Texto para la interfaz, tal como sigue a "Ingrese ..."
+        self.etiqueta = etiqueta
+        self.defecto = defecto
+        self.minimo = minimo
+        self.maximo = maximo
+        self.decimales = decimales
+
+
+class Distribucion:
+    """
+    Entrada del registro. Ver el docstring del modulo para el significado
+    de cada campo. restricciones es una secuencia de (condicion, mensaje),
+    donde condicion recibe los parametros en el orden del esquema.
+    """
+
+    def __init__(self, nombre, clave, parametros, muestrear, cdf, pdf, ppf,
+                 media, varianza, restricciones=(), estimados=0,
+                 asimetria=None, curtosis=None):
+        self.nombre = nombre
+        # Nombre corto para la linea de comandos
+        self.clave = clave
+        self.parametros = tuple(parametros)
+        self.muestrear = muestrear
+        self.cdf = cdf
+        self.pdf = pdf
+        self.ppf = ppf
+        self.media = media
+        self.varianza = varianza
+        self.asimetria = asimetria
+        self.curtosis = curtosis
+        self.restricciones = tuple(restricciones)
+        self.estimados = estimados
+
+    def grados_libertad(self, k):
+        """Grados de libertad de χ² con k clases (ya agrupadas)."""
+        return k - 1 - self.estimados
+
+    def defectos(self):
+        return tuple(p.defecto for p in self.parametros)
+
+    def nombres_parametros(self):
+        return tuple(p.nombre for p in self.parametros)
+
+    def como_dict(self, params):
+        """{nombre: valor} de cada parametro, por ejemplo para metadatos."""
+        return dict(zip(self.nombres_parametros(), params))
+
+    def validar(self, params):
+        """
+        Devuelve los parametros como tupla de float. Lanza ValueError si la
+        cantidad no coincide con el esquema, si alguno esta fuera de su
+        rango o si no se cumple alguna restriccion.
+        """
+        params = tuple(float(v) for v in params)
+        if len(params) != len(self.parametros):
+            raise ValueError(
+                f"{self.nombre} necesita {len(self.parametros)} parametros "
+                f"({', '.join(self.nombres_parametros())}) y se pasaron "
+                f"{len(params)}")
+        for p, v in zip(self.parametros, params):
+            if not p.minimo <= v <= p.maximo:
+                raise ValueError(
+                    f"{p.nombre} debe estar entre {p.minimo:g} y {p.maximo:g}")
+        for condicion, mensaje in self.restricciones:
+            if not condicion(*params):
+                raise ValueError(mensaje)
+        return params
+
+
+DISTRIBUCIONES = {}
+
+
+def registrar(distribucion):
+    """Agrega una distribucion al registro (por su nombre) y la devuelve."""
+    DISTRIBUCIONES[distribucion.nombre] = distribucion
+    return distribucion
+
+
+def obtener(nombre):
+    """Distribucion registrada con ese nombre (ValueError si no existe)."""
+    try:
+        return DISTRIBUCIONES[nombre]
+    except KeyError:
+        raise ValueError(f"Distribucion desconocida: {nombre}") from None
+
+
+def por_clave(clave):
+    """Distribucion registrada con esa clave de linea de comandos."""
+    for distribucion in DISTRIBUCIONES.values():
+        if distribucion.clave == clave:
+            return distribucion
+    raise ValueError(f"Distribucion desconocida: {clave}")
+
+
+def nombres():
+    """Nombres de las distribuciones registradas, en orden de registro."""
+    return list(DISTRIBUCIONES)
+
+
+# Normal
+def _cdf_normal(x, params):
+    from scipy.special import ndtr
+    media, desviacion = params
+    return ndtr((x - media) / desviacion)
+
+
+def _pdf_normal(x, params):
+    media, desviacion = params
+    z = (x - media) / desviacion
+    return np.exp(-0.5 * z * z) / (desviacion * sqrt(2 * pi))
+
+
+def _ppf_normal(p, params):
+    from scipy.special import ndtri
+    media, desviacion = params
+    return media + desviacion * ndtri(p)
+
+
+registrar(Distribucion(
+    "Normal", "normal",
+    [Parametro("media", "la Media μ", 0.0),
+     Parametro("desviacion", "la Desviacion Estandar σ", 1.0,
+               minimo=0.0001)],
+    muestrear=lambda n, params, rng: generar_normal(n, *params, rng),
+    cdf=_cdf_normal,
+    pdf=_pdf_normal,
+    ppf=_ppf_normal,
+    media=lambda params: params[0],
+    varianza=lambda params: params[1] ** 2,
+    asimetria=lambda params: 0.0,
+    curtosis=lambda params: 0.0,
+))
+
+
+# Uniforme
+def _cdf_uniforme(x, params):
+    A, B = params
+    return np.clip((x - A) / (B - A), 0.0, 1.0)
+
+
+def _pdf_uniforme(x, params):
+    A, B = params
+    return np.where((x >= A) & (x <= B), 1.0 / (B - A), 0.0)
+
+
+def _ppf_uniforme(p, params):
+    A, B = params
+    return A + p * (B - A)
+
+
+registrar(Distribucion(
+    "Uniforme", "uniforme",
+    [Parametro("A", "el valor de A", 0.0),
+     Parametro("B", "el valor de B", 1.0)],
+    muestrear=lambda n, params, rng: generar_uniforme_ab(n, *params, rng),
+    cdf=_cdf_uniforme,
+    pdf=_pdf_uniforme,
+    ppf=_ppf_uniforme,
+    media=lambda params: (params[0] + params[1]) / 2,
+    varianza=lambda params: (params[1] - params[0]) ** 2 / 12,
+    restricciones=[(lambda A, B: A < B, "A debe ser menor que B")],
+    asimetria=lambda params: 0.0,
+    curtosis=lambda params: -1.2,
+))
+
+
+# Exponencial negativa
+def _cdf_exponencial(x, params):
+    lmd, = params
+    return -np.expm1(-lmd * np.maximum(x, 0.0))
+
+
+def _pdf_exponencial(x, params):
+    lmd, = params
+    return np.where(x >= 0, lmd * np.exp(-lmd * np.maximum(x, 0.0)), 0.0)
+
+
+def _ppf_exponencial(p, params):
+    lmd, = params
+    return -np.log1p(-p) / lmd
+
+
+registrar(Distribucion(
+    "Exponencial Negativa", "exponencial",
+    [Parametro("lmd", "el valor de Lambda λ", 1.0, minimo=0.0001)],
+    muestrear=lambda n, params, rng: generar_exponencial(n, *params, rng),
+    cdf=_cdf_exponencial,
+    pdf=_pdf_exponencial,
+    ppf=_ppf_exponencial,
+    media=lambda params: 1 / params[0],
+    varianza=lambda params: 1 / params[0] ** 2,
+    asimetria=lambda params: 2.0,
+    curtosis=lambda params: 6.0,
+))
+
+
+# Weibull
+def _cdf_weibull(x, params):
+    forma, escala = params
+    return -np.expm1(-(np.maximum(x, 0.0) / escala) ** forma)
+
+
+def _pdf_weibull(x, params):
+    forma, escala = params
+    z = np.maximum(x, 0.0) / escala
+    with np.errstate(divide="ignore"):
+        densidad = forma / escala * z ** (forma - 1) * np.exp(-z ** forma)
+    return np.where(x >= 0, densidad, 0.0)
+
+
+def _ppf_weibull(p, params):
+    forma, escala = params
+    return escala * (-np.log1p(-p)) ** (1 / forma)
+
+
+def _momentos_weibull(forma):
+    """Asimetria y curtosis en exceso (no dependen de la escala)."""
+    g1, g2, g3, g4 = (gamma(1 + i / forma) for i in range(1, 5))
+    varianza = g2 - g1 ** 2
+    asimetria = (g3 - 3 * g1 * g2 + 2 * g1 ** 3) / varianza ** 1.5
+    curtosis = (g4 - 4 * g1 * g3 + 6 * g1 ** 2 * g2 - 3 * g1 ** 4) \
+        / varianza ** 2 - 3
+    return asimetria, curtosis
+
+
+registrar(Distribucion(
+    "Weibull", "weibull",
+    [Parametro("forma", "la Forma k", 1.5, minimo=0.0001),
+     Parametro("escala", "la Escala λ", 1.0, minimo=0.0001)],
+    muestrear=lambda n, params, rng: generar_weibull(n, *params, rng),
+    cdf=_cdf_weibull,
+    pdf=_pdf_weibull,
+    ppf=_ppf_weibull,
+    media=lambda params: params[1] * gamma(1 + 1 / params[0]),
+    varianza=lambda params: params[1] ** 2 * (
+        gamma(1 + 2 / params[0]) - gamma(1 + 1 / params[0]) ** 2),
+    asimetria=lambda params: _momentos_weibull(params[0])[0],
+    curtosis=lambda params: _momentos_weibull(params[0])[1],
+))
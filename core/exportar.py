@@ -0,0 +1,137 @@
+"""
+Exportacion de series por bloques.
+
+Formatos:
+- "csv": texto, un valor por linea con todos sus digitos (repr)
+- "npy": binario de numpy, escrito sobre un archivo mapeado en memoria
+- "parquet": columnar, solo si pyarrow esta instalado
+
+Junto a cada archivo se escribe un .json con los metadatos de la corrida
+(distribucion, parametros, semilla, etc). cargar_serie abre un .npy como
+numpy.memmap, sin leerlo entero, para volver a analizarlo.
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+
+# Cantidad de valores que se escriben por vez
+TAM_BLOQUE_EXPORTACION = 100_000
+
+
+def _bloques(datos, tam_bloque):
+    for inicio in range(0, len(datos), tam_bloque):
+        yield datos[inicio:inicio + tam_bloque]
+
+
+def exportar_csv(ruta, datos, tam_bloque=TAM_BLOQUE_EXPORTACION):
+    """Escribe la serie como CSV de una columna ("valor") sin perder
+    precision y sin armar el texto completo en memoria."""
+    with open(ruta, "w", encoding="utf-8", newline="") as f:
+        f.write("valor\n")
+        for bloque in _bloques(datos, tam_bloque):
+            f.write("\n".join(map(repr, bloque.tolist())))
+            f.write("\n")
+
+
+def exportar_npy(ruta, datos, tam_bloque=TAM_BLOQUE_EXPORTACION):
+    """Escribe la serie en formato .npy copiando por bloques sobre un
+    archivo mapeado en memoria."""
+    datos = np.asarray(datos)
+    destino = np.lib.format.open_memmap(
+        ruta, mode="w+", dtype=datos.dtype, shape=datos.shape)
+    for inicio in range(0, len(datos), tam_bloque):
+        destino[inicio:inicio + tam_bloque] = datos[inicio:inicio + tam_bloque]
+    destino.flush()
+    del destino
+
+
+def exportar_parquet(ruta, datos, tam_bloque=TAM_BLOQUE_EXPORTACION):
+    """Escribe la serie como Parquet (un row group por bloque). Requiere
+    pyarrow."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    datos = np.asarray(datos)
+    esquema = pa.schema([("valor", pa.from_numpy_dtype(datos.dtype))])
+    with pq.ParquetWriter(ruta, esquema) as escritor:
+        for bloque in _bloques(datos, tam_bloque):
+            escritor.write_table(pa.table({"valor": bloque}, schema=esquema))
+
+
+EXPORTADORES = {
+    "csv": exportar_csv,
+    "npy": exportar_npy,
+    "parquet": exportar_parquet,
+}
+
+
+def formatos_disponibles():
+    """Formatos que se pueden usar con las dependencias instaladas."""
+    formatos = ["csv", "npy"]
+    try:
+        import pyarrow.parquet  # noqa: F401
+        formatos.append("parquet")
+    except ImportError:
+        pass
+    return formatos
+
+
+def ruta_metadatos(ruta):
+    """Ruta del archivo .json que acompaña a una serie exportada."""
+    return Path(ruta).with_suffix(".json")
+
+
+def escribir_metadatos(ruta, metadatos):
+    """Escribe el .json de metadatos junto al archivo de la serie."""
+    with ruta_metadatos(ruta).open("w", encoding="utf-8") as f:
+        json.dump(metadatos, f, ensure_ascii=False, indent=2)
+
+
+def exportar(ruta, datos, formato, metadatos=None,
+             tam_bloque=TAM_BLOQUE_EXPORTACION):
+    """
+    Exporta la serie en el formato indicado ("csv", "npy" o "parquet") y,
+    si se pasan metadatos, escribe el .json correspondiente.
+    """
+    if formato not in EXPORTADORES:
+        raise ValueError(f"Formato desconocido: {formato}")
+    EXPORTADORES[formato](ruta, datos, tam_bloque)
+    if metadatos is not None:
+        escribir_metadatos(ruta, dict(
+            metadatos,
+            formato=formato,
+            cantidad=len(datos),
+            dtype=str(np.asarray(datos).dtype),
+            archivo=Path(ruta).name,
+        ))
+    return ruta
+
+
+def leer_metadatos(ruta):
+    """Lee el .json de una serie exportada ({} si no existe)."""
+    ruta_json = ruta_metadatos(ruta)
+    if not ruta_json.exists():
+        return {}
+    with ruta_json.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def cargar_serie(ruta):
+    """
+    Abre una serie exportada y devuelve (datos, metadatos).
+    Los .npy se abren como numpy.memmap de solo lectura: no se copian a
+    memoria y las funciones de analisis los recorren directamente. CSV y
+    Parquet se leen completos.
+    """
+    formato = Path(ruta).suffix.lstrip(".").lower()
+    if formato == "npy":
+        datos = np.load(ruta, mmap_mode="r")
+    elif formato == "csv":
+        datos = np.loadtxt(ruta, dtype=np.float64, skiprows=1, ndmin=1)
+    elif formato == "parquet":
+        import pyarrow.parquet as pq
+        datos = pq.read_table(ruta).column("valor").to_numpy()
+    else:
+        raise ValueError(f"Formato desconocido: {formato}")
+    return datos, leer_metadatos(ruta)
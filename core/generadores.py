@@ -1,134 +1,465 @@
 import random
 import numpy as np
-from math import sqrt, log, pi, cos, sin, erf, exp
-from scipy.stats import chi2 as chi2_dist
+from functools import lru_cache
 
+from core.aleatorios import (
+    GENERADOR_POR_DEFECTO,
+    crear_generador,
+    secuencia_semilla,
+)
+from core.distribuciones import (
+    generar_exponencial,
+    generar_normal,
+    generar_uniforme_ab,
+    obtener,
+    transformar_exp,
+    transformar_norm,
+    transformar_unif_ab,
+)
+from core.intervalos import contar
+from core.tabla_chi2 import GL_MAX, TABLA_CHI2
 
-def generar_numeros_pseudoaleatorios(n):
-    """Genera una lista de n numeros pseudoaleatorios entre 0 y 1."""
-    nums = [random.random() for _ in range(n)]
+# Cantidad de valores por bloque en la generacion por bloques. Cada bloque
+# tiene su propio flujo, asi que la serie que produce una semilla depende de
+# este valor: todos los caminos (interfaz, paralelo, linea de comandos) lo
+# comparten para que la misma semilla de la misma serie.
+TAM_BLOQUE = 100_000
+
+# Tipos con que se puede guardar una serie completa. Los bloques siempre se
+# generan en float64; float32 ocupa la mitad de memoria a cambio de guardar
+# unos 7 digitos significativos por valor.
+TIPOS_DATOS = {"float64": np.float64, "float32": np.float32}
+TIPO_POR_DEFECTO = "float64"
+
+
+def generar_distribucion(distrib, n, params, rng=None):
+    """
+    Genera n valores de la distribucion registrada con nombre distrib.
+    - params: en el orden del esquema de la distribucion, por ejemplo
+      (A, B) para uniforme, (lmd,) para exponencial, (media, desviacion)
+      para normal
+    """
+    return obtener(distrib).muestrear(n, params, rng)
+
+
+def tipo_datos(tipo=TIPO_POR_DEFECTO):
+    """dtype de numpy de una clave de TIPOS_DATOS (ValueError si no existe)."""
+    try:
+        return np.dtype(TIPOS_DATOS[tipo])
+    except KeyError:
+        raise ValueError(f"Tipo de datos desconocido: {tipo}") from None
+
+
+def semilla_raiz(semilla=None):
+    """Normaliza una semilla (None, entero o SeedSequence) a SeedSequence."""
+    return secuencia_semilla(semilla)
+
+
+def semilla_bloque(raiz, i):
+    """
+    SeedSequence independiente del bloque i. Equivale a raiz.spawn(...)[i]
+    pero no depende de cuantas veces se haya llamado a spawn antes.
+    """
+    return np.random.SeedSequence(raiz.entropy,
+                                  spawn_key=raiz.spawn_key + (i,))
+
+
+def tamanios_bloques(cantidad, tam_bloque=TAM_BLOQUE):
+    """Divide cantidad en bloques de tam_bloque (el ultimo puede ser menor)."""
+    for inicio in range(0, cantidad, tam_bloque):
+        yield min(tam_bloque, cantidad - inicio)
+
+
+def generar_por_bloques(distrib, cantidad, params, semilla=None,
+                        tam_bloque=TAM_BLOQUE,
+                        generador=GENERADOR_POR_DEFECTO):
+    """
+    Genera la serie de a bloques de a lo sumo tam_bloque valores (arreglos
+    float64), sin materializarla completa. Cada bloque usa su propio flujo
+    del generador indicado (ver core.aleatorios) derivado de semilla, por
+    lo que la misma semilla y generador reproducen la misma serie. Con
+    semilla=None conviene pasar una SeedSequence ya creada si se quiere
+    recorrer la serie mas de una vez.
+    """
+    raiz = semilla_raiz(semilla)
+    for i, n in enumerate(tamanios_bloques(cantidad, tam_bloque)):
+        rng = crear_generador(semilla_bloque(raiz, i), generador)
+        yield generar_distribucion(distrib, n, params, rng)
+
+
+def generar_numeros_pseudoaleatorios(n, semilla=None, generador=None):
+    """
+    Genera una lista de n numeros pseudoaleatorios entre 0 y 1. Sin semilla
+    ni generador usa el modulo random global; si no, el generador indicado
+    de core.aleatorios (por defecto PCG64) con esa semilla.
+    """
+    if semilla is None and generador is None:
+        return [random.random() for _ in range(n)]
+    rng = crear_generador(semilla, generador or GENERADOR_POR_DEFECTO)
+    return rng.random(n).tolist()
+
+
+def _reemplazar(nums, res):
+    """Escribe res sobre nums: en el lugar si nums es un arreglo (sin pasar
+    por una lista) y como floats de Python si es una lista."""
+    if isinstance(nums, np.ndarray):
+        nums[:] = res
+    else:
+        nums[:] = res.tolist()
     return nums
 
 
 def darDistExp(nums, lmd):
-    """Transforma una lista de numeros pseudoaleatorios a una lista de numeros
+    """Transforma una lista (o arreglo) de numeros pseudoaleatorios a numeros
     distribuidos segun la exponencial negativa de parametro lmd.
     """
-    for i in range(len(nums)):
-        num = round(-1 / lmd * log(nums[i]), 4)
-        nums[i] = num
-    return nums
+    res = transformar_exp(np.asarray(nums, dtype=np.float64), lmd)
+    return _reemplazar(nums, np.round(res, 4))
 
 
 def darDistNorm(nums, media, desviacion):
-    """Transforma una lista de numeros pseudoaleatorios a una lista de numeros
+    """Transforma una lista (o arreglo) de numeros pseudoaleatorios a numeros
     distribuidos segun la normal de parametro media y desviacion.
     """
-    for i in range(0, len(nums) - 1, 2):
-        if i == len(nums) - 1 and i % 2 != 0:
-            num1 = nums[i]
-            num2 = random.random() * 2 * pi
-            n1 = ((sqrt((-2) * (log(num1))) * cos(num2)) * desviacion) + media
-            nums[i] = n1
-        else:
-            num1 = nums[i]
-            num2 = nums[i + 1] * 2 * pi
-            n1 = ((sqrt((-2) * (log(num1))) * cos(num2)) * desviacion) + media
-            n2 = ((sqrt((-2) * (log(num1))) * sin(num2)) * desviacion) + media
-            nums[i] = round(n1, 4)
-            nums[i + 1] = round(n2, 4)
-    return nums
+    res = transformar_norm(np.asarray(nums, dtype=np.float64),
+                           media, desviacion)
+    return _reemplazar(nums, np.round(res, 4))
 
 
 def darDistUnifAB(nums, A, B):
-    """Transforma una lista de numeros pseudoaleatorios a una lista de numeros
+    """Transforma una lista (o arreglo) de numeros pseudoaleatorios a numeros
     distribuidos segun la uniforme en [A, B].
     """
-    for i in range(len(nums)):
-        # Calculo de X = A + RND*(B - A)
-        num = round((B - A) * nums[i] + A, 4)
-        nums[i] = num
-    return nums
+    res = transformar_unif_ab(np.asarray(nums, dtype=np.float64), A, B)
+    return _reemplazar(nums, np.round(res, 4))
 
 
-def frecuencias_observadas(datos, n_intervalos):
+def cdf(distrib, x, params):
     """
-    Dado un conjunto de datos y un numero de intervalos,
-    devuelve una lista de tuplas (li, ls, fo) donde
-    - li y ls son los bordes del intervalo
-    - fo es la frecuencia observada en ese intervalo
+    CDF vectorizada de la distribucion registrada: evalua F(x) sobre un
+    arreglo x de cualquier forma. Los parametros pueden ser escalares o
+    arreglos que se combinan con x por broadcasting (por ejemplo, columnas
+    (P, 1) contra bordes (k+1,)).
     """
-    minim = min(datos)
-    maxim = max(datos)
+    return obtener(distrib).cdf(np.asarray(x, dtype=np.float64), params)
+
 
-    # Genera “n_intervalos + 1” equidistantes desde minim hasta maxim
-    bordes = np.linspace(minim, maxim, n_intervalos+1)
+def pdf(distrib, x, params):
+    """Densidad vectorizada, con los mismos params y broadcasting que cdf."""
+    return obtener(distrib).pdf(np.asarray(x, dtype=np.float64), params)
 
-    # np.histogram devuelve fo (Frecuencia Observada)
-    # Utilizando el intervalo [li, ls) (excepto el ultimo)
-    fo_list, _ = np.histogram(datos, bins=bordes)
 
-    resultado = []
-    for i in range(n_intervalos):
-        li, ls = bordes[i], bordes[i + 1]
-        # Lim Inf - Lim Sup - Frec Observada
-        resultado.append((li, ls, int(fo_list[i])))
-    return resultado
+# Puntos de la grilla sobre la que se dibuja la densidad teorica
+PUNTOS_CURVA = 400
 
 
-def cdf_exp(x, lmd):
-    """CDF (función de distribución acumulativa) de la exponencial negativa."""
-    return 1 - exp(-lmd * x)
+@lru_cache(maxsize=64)
+def curva_densidad(distrib, params, bordes, puntos=PUNTOS_CURVA):
+    """
+    Densidad teorica sobre una grilla fija de puntos entre el primer y el
+    ultimo borde. params y bordes van como tuplas porque el resultado se
+    guarda en cache por (distribucion, parametros, bordes); los arreglos
+    devueltos (x, f(x)) son de solo lectura.
+    """
+    x = np.linspace(bordes[0], bordes[-1], puntos)
+    y = pdf(distrib, x, params)
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y
 
 
-def cdf_norm(x, media, desviacion):
-    """CDF (función de distribución acumulativa) de la normal N(media, desviacion)."""
-    return 0.5 * (1 + erf((x - media) / (desviacion * sqrt(2))))
+def frecuencias_esperadas_bordes(bordes, total, distrib, params,
+                                 colas_abiertas=False):
+    """
+    FE de cada intervalo a partir del arreglo de bordes: evalua la CDF una
+    sola vez por borde y toma las diferencias, FEᵢ = [F(bᵢ₊₁)-F(bᵢ)] * total.
+    Con colas_abiertas la primera clase empieza en -inf y la ultima termina
+    en +inf (F = 0 y F = 1 en los extremos), asi que las FE suman total.
+    Si bordes es (R, k+1) devuelve (R, k).
+    """
+    acumulada = cdf(distrib, bordes, params)
+    if colas_abiertas:
+        acumulada = np.array(acumulada, dtype=np.float64)
+        acumulada[..., 0] = 0.0
+        acumulada[..., -1] = 1.0
+    return total * np.diff(acumulada, axis=-1)
 
 
-def frecuencias_esperadas(limites, total, distrib, params):
+def frecuencias_esperadas_lote(bordes, total, distrib, params_lote):
     """
-    Para cada (li, ls) en [limites], calcula Feᵢ = [F(ls)-F(li)] * total.
-    - distrib: "Uniforme", "Exponencial Negativa" o "Normal"
-    - params: (lmd,) para exponencial; (media, desviacion) para normal
+    FE para muchos juegos de parametros a la vez.
+    - params_lote: secuencia de P tuplas de parametros
+    Devuelve un arreglo (P, k).
     """
-    fe = []
-    if distrib == "Uniforme":
-        fe = [total/len(limites)] * len(limites)
-    elif distrib == "Exponencial Negativa":
-        lmd, = params
-        fe = [(cdf_exp(ls, lmd) - cdf_exp(li, lmd))
-              * total for li, ls in limites]
-    elif distrib == "Normal":
-        media, desviacion = params
-        fe = [(cdf_norm(ls, media, desviacion) - cdf_norm(li,
-               media, desviacion)) * total for li, ls in limites]
-    return fe
+    columnas = np.asarray(params_lote, dtype=np.float64).T[..., None]
+    return frecuencias_esperadas_bordes(bordes, total, distrib, columnas)
+
 
+def clases_desde_arreglos(bordes, fo, fe):
+    """Lista de dicts {'li', 'ls', 'fo', 'fe'} con valores de Python."""
+    return [
+        {"li": li, "ls": ls, "fo": fo_k, "fe": fe_k}
+        for li, ls, fo_k, fe_k in zip(
+            bordes[:-1].tolist(), bordes[1:].tolist(),
+            np.asarray(fo, dtype=np.int64).tolist(),
+            np.asarray(fe, dtype=np.float64).tolist())
+    ]
+
+
+# Hasta esta cantidad de clases los cortes se buscan con un bucle simple,
+# que con pocas clases es mas rapido que searchsorted
+CLASES_BUCLE = 64
 
-def obtener_histograma(datos, intervalos):
+
+def cortes_agrupacion(fe, minimo=5):
     """
-    Retorna (frecuencias, bordes) para pasar directamente a matplotlib.
+    Indices de la primera clase de cada grupo al agrupar clases consecutivas
+    hasta que cada grupo tenga FE >= minimo. Un grupo termina en la primera
+    clase en la que su FE acumulada llega a minimo: con pocas clases se
+    recorre la suma acumulada de FE y con muchas se busca con searchsorted.
+    Si al final sobra un grupo con FE < minimo, se une al anterior.
     """
-    frecuencias, bordes = np.histogram(datos, bins=intervalos)
-    return frecuencias.tolist(), bordes.tolist()
+    if len(fe) <= CLASES_BUCLE:
+        return np.array(
+            _cortes_bucle(np.asarray(fe, dtype=np.float64).tolist(), minimo),
+            dtype=np.intp)
+
+    acum = np.cumsum(fe)
+    n = len(acum)
+    cortes = [0]
+    base = 0.0
+    while True:
+        fin = int(np.searchsorted(acum, base + minimo, side="left"))
+        if fin >= n:
+            # El ultimo grupo no llega a minimo: se une al anterior
+            if len(cortes) > 1:
+                cortes.pop()
+            break
+        if fin == n - 1:
+            break
+        cortes.append(fin + 1)
+        base = acum[fin]
+    return np.array(cortes, dtype=np.intp)
 
 
-def calcular_clases_chi2(datos, intervalos, distrib, params):
+def _cortes_bucle(fe, minimo):
+    """cortes_agrupacion como lista, recorriendo una lista de FE."""
+    cortes = [0]
+    acum = base = 0.0
+    for fin, f in enumerate(fe):
+        acum += f
+        if acum >= base + minimo and fin < len(fe) - 1:
+            cortes.append(fin + 1)
+            base = acum
+    # El ultimo grupo no llega a minimo: se une al anterior
+    if acum < base + minimo and len(cortes) > 1:
+        cortes.pop()
+    return cortes
+
+
+def grupos_agrupacion(fe, minimo=5):
     """
-    Calcula FO y FE por clase para χ².
-    Devuelve lista de dicts: {'li', 'ls', 'fo', 'fe'}.
+    Version por filas de cortes_agrupacion para un arreglo fe de (R, k):
+    devuelve un arreglo (R, k) con el numero de grupo de cada clase (0, 1,
+    ...), con el mismo criterio. Se recorren las k columnas una vez para
+    todas las filas juntas.
     """
-    fo_list, bordes = np.histogram(datos, bins=intervalos)
-    limites = list(zip(bordes[:-1], bordes[1:]))
-    fe_list = frecuencias_esperadas(limites, len(datos), distrib, params)
+    acum = np.cumsum(fe, axis=1)
+    filas, k = acum.shape
+    grupos = np.empty((filas, k), dtype=np.intp)
+    grupo = np.zeros(filas, dtype=np.intp)
+    base = np.zeros(filas)
+    for j in range(k):
+        grupos[:, j] = grupo
+        if j < k - 1:
+            cierra = acum[:, j] >= base + minimo
+            grupo += cierra
+            base = np.where(cierra, acum[:, j], base)
+    # El ultimo grupo que no llega a minimo se une al anterior
+    corto = (acum[:, -1] < base + minimo) & (grupo > 0)
+    grupos -= corto[:, None] & (grupos == grupo[:, None])
+    return grupos
 
-    clases = [
-        {"li": li, "ls": ls, "fo": fo, "fe": fe}
-        for (li, ls), fo, fe in zip(limites, fo_list, fe_list)
-    ]
 
-    return clases
+def chi2_por_clase(fo, fe):
+    """Aporte (FO - FE)^2 / FE de cada clase, como arreglo."""
+    fo = np.asarray(fo, dtype=np.float64)
+    fe = np.asarray(fe, dtype=np.float64)
+    return (fo - fe) ** 2 / fe
+
+
+def agrupar_frecuencias(fo, fe, minimo=5):
+    """
+    Agrupa arreglos de FO y FE hasta que cada grupo tenga FE >= minimo.
+    Devuelve (cortes, fo_agrupada, fe_agrupada), donde cortes son los
+    indices de la primera clase de cada grupo.
+    """
+    fe = np.asarray(fe, dtype=np.float64)
+    cortes = cortes_agrupacion(fe, minimo)
+    return (cortes, np.add.reduceat(np.asarray(fo), cortes),
+            np.add.reduceat(fe, cortes))
+
+
+def chi2_lote(fo, fe, minimo=5):
+    """
+    Estadistico χ² (con clases agrupadas a FE >= minimo) de muchas series a
+    la vez.
+    - fo: arreglo (R, k) con las FO de cada serie
+    - fe: arreglo (k,) si todas comparten FE, o (R, k) si no
+    Devuelve (chi2, grados_libertad), ambos arreglos de largo R.
+    """
+    fo = np.atleast_2d(fo)
+    fe = np.asarray(fe, dtype=np.float64)
+    if fe.ndim == 1:
+        # Misma FE para todas: se agrupa una sola vez
+        cortes = cortes_agrupacion(fe, minimo)
+        fe_agr = np.add.reduceat(fe, cortes)
+        fo_agr = np.add.reduceat(fo, cortes, axis=1)
+        chi2 = chi2_por_clase(fo_agr, fe_agr).sum(axis=1)
+        grados = np.full(len(fo), len(cortes) - 1)
+        return chi2, grados
+
+    # FE por serie: los grupos de todas las filas se suman con un solo
+    # bincount, desplazando los de la fila r en r * k
+    filas, k = fo.shape
+    grupos = grupos_agrupacion(np.broadcast_to(fe, fo.shape), minimo)
+    indices = (grupos + k * np.arange(filas)[:, None]).ravel()
+    fo_agr = np.bincount(indices, fo.ravel(), filas * k).reshape(filas, k)
+    fe_agr = np.bincount(indices, np.broadcast_to(fe, fo.shape).ravel(),
+                         filas * k).reshape(filas, k)
+    grados = grupos[:, -1]
+    usados = np.arange(k) <= grados[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        chi2 = np.where(usados, chi2_por_clase(fo_agr, fe_agr), 0.0).sum(
+            axis=1)
+    return chi2, grados
+
+
+def agrupar_intervalos_chi2(clases):
+    """
+    Agrupa los intervalos de la tabla de χ² hasta que cada grupo
+    tenga FE >= 5. Devuelve la lista de grupos agrupados.
+    """
+    # Una sola pasada por las clases, con el mismo criterio que
+    # cortes_agrupacion (la lista de dicts ya se recorre en Python)
+    agrupadas = []
+    acum = base = 0.0
+    for c in clases:
+        if agrupadas and acum < base + 5:
+            grupo = agrupadas[-1]
+            grupo['ls'] = c['ls']
+            grupo['fo'] += c['fo']
+            grupo['fe'] += c['fe']
+        else:
+            base = acum
+            agrupadas.append(c.copy())
+        acum += c['fe']
+    # El ultimo grupo no llega a 5: se une al anterior
+    if len(agrupadas) > 1 and acum < base + 5:
+        ultimo = agrupadas.pop()
+        grupo = agrupadas[-1]
+        grupo['ls'] = ultimo['ls']
+        grupo['fo'] += ultimo['fo']
+        grupo['fe'] += ultimo['fe']
+    return agrupadas
+
+
+class HistogramaAcumulado:
+    """
+    Acumula las frecuencias observadas de una serie que llega por bloques,
+    con los bordes fijados de antemano. Usa memoria constante sin importar
+    cuantos valores se agreguen.
+    """
+
+    def __init__(self, bordes):
+        self.bordes = np.asarray(bordes, dtype=np.float64)
+        self.fo = np.zeros(len(self.bordes) - 1, dtype=np.int64)
+        self.total = 0
+
+    @classmethod
+    def equidistante(cls, minim, maxim, n_intervalos):
+        """Histograma de n_intervalos de igual ancho entre minim y maxim."""
+        return cls(np.linspace(minim, maxim, n_intervalos + 1))
+
+    def agregar(self, bloque):
+        """Suma a FO las frecuencias del bloque (los valores fuera de los
+        bordes no se cuentan en ninguna clase, pero si en el total)."""
+        self.fo += contar(bloque, self.bordes)
+        self.total += len(bloque)
+
+    def combinar(self, otro):
+        """Suma a este histograma las frecuencias de otro con los mismos
+        bordes (por ejemplo, el de otro proceso)."""
+        if not np.array_equal(self.bordes, otro.bordes):
+            raise ValueError("Los histogramas tienen bordes distintos")
+        self.fo += otro.fo
+        self.total += otro.total
+        return self
+
+def rango_por_bloques(bloques):
+    """Primera pasada: devuelve (min, max) de una serie dada por bloques."""
+    minim, maxim = np.inf, -np.inf
+    for bloque in bloques:
+        minim = min(minim, float(np.min(bloque)))
+        maxim = max(maxim, float(np.max(bloque)))
+    return minim, maxim
+
+
+def histograma_por_bloques(distrib, cantidad, params, intervalos,
+                           semilla=None, bordes=None, tam_bloque=TAM_BLOQUE,
+                           generador=GENERADOR_POR_DEFECTO):
+    """
+    Construye el HistogramaAcumulado de una serie generada por bloques, sin
+    guardarla en memoria.
+    - bordes: si se conocen de antemano se usan directamente; si es None se
+      hace una primera pasada (regenerando con la misma semilla) para hallar
+      min y max y se usan intervalos de igual ancho.
+    """
+    raiz = semilla_raiz(semilla)
+    if bordes is None:
+        minim, maxim = rango_por_bloques(generar_por_bloques(
+            distrib, cantidad, params, raiz, tam_bloque, generador))
+        hist = HistogramaAcumulado.equidistante(minim, maxim, intervalos)
+    else:
+        hist = HistogramaAcumulado(bordes)
+
+    for bloque in generar_por_bloques(distrib, cantidad, params, raiz,
+                                      tam_bloque, generador):
+        hist.agregar(bloque)
+    return hist
+
+
+@lru_cache(maxsize=1024)
+def _chi2_ppf(grad_lib, alpha):
+    """Valor critico fuera de la tabla; importa scipy.stats recien aca."""
+    from scipy.stats import chi2 as chi2_dist
+    return float(chi2_dist.ppf(1 - alpha, grad_lib))
+
+
+def chi2_critico_gl(grad_lib, alpha):
+    """Valor critico χ² para grad_lib grados de libertad. Usa la tabla
+    precalculada si puede y, si no, una cache LRU sobre scipy."""
+    valores = TABLA_CHI2.get(alpha)
+    if valores is not None and 1 <= grad_lib <= GL_MAX:
+        return valores[int(grad_lib) - 1]
+    return _chi2_ppf(int(grad_lib), alpha)
+
+
+def chi2_criticos_gl(grados_libertad, alpha):
+    """
+    Valores criticos para un arreglo de grados de libertad. Los que estan en
+    la tabla se indexan directo y el resto se calcula una sola vez por valor
+    distinto.
+    """
+    grados = np.asarray(grados_libertad, dtype=np.int64)
+    criticos = np.empty(grados.shape, dtype=np.float64)
+    valores = TABLA_CHI2.get(alpha)
+    en_tabla = (grados >= 1) & (grados <= GL_MAX) & (valores is not None)
+    if en_tabla.any():
+        criticos[en_tabla] = np.asarray(valores)[grados[en_tabla] - 1]
+    for g in np.unique(grados[~en_tabla]):
+        criticos[grados == g] = _chi2_ppf(int(g), alpha)
+    return criticos
 
 
 def chi2_critico(k, alpha):
@@ -139,5 +470,5 @@ def chi2_critico(k, alpha):
      - alpha: nivel de significancia
     """
     grad_lib = k - 1
-    p_crit = chi2_dist.ppf(1 - alpha, grad_lib)
+    p_crit = chi2_critico_gl(grad_lib, alpha)
     return p_crit
@@ -0,0 +1,135 @@
+"""
+Estrategias para armar los intervalos de la prueba de χ².
+
+- "iguales": k intervalos de igual ancho entre el minimo y el maximo
+- "equiprobables": bordes interiores F⁻¹(i/k) de la distribucion hipotetica;
+  las clases de los extremos quedan abiertas, asi que FE = total/k en todas
+  y no hace falta agrupar mientras total/k >= 5
+- "sturges": igual ancho con k = ⌈log2 n⌉ + 1
+- "freedman-diaconis": igual ancho 2·RIC/n^(1/3) (RIC: rango intercuartil)
+- "fijos": bordes indicados por el usuario. Los valores que quedan fuera
+  no se cuentan y FE se reparte entre los que quedan dentro segun la
+  distribucion restringida a [b₀, bₖ] (ver fe_condicionada)
+
+Las frecuencias se cuentan con contar(): se ordena la serie (o el bloque)
+una vez y se ubica cada borde con searchsorted, lo que sirve igual para
+bordes de cualquier ancho. Si la serie ya esta ordenada no se vuelve a
+ordenar.
+"""
+from math import ceil, log2
+
+import numpy as np
+
+from core.distribuciones import obtener
+
+ESTRATEGIA_POR_DEFECTO = "iguales"
+
+ESTRATEGIAS = {
+    "iguales": "Igual ancho",
+    "equiprobables": "Equiprobables (FE iguales)",
+    "sturges": "Sturges",
+    "freedman-diaconis": "Freedman-Diaconis",
+    "fijos": "Bordes fijos",
+}
+
+# Tope de intervalos de las reglas automaticas
+MAX_INTERVALOS = 1000
+
+
+def usa_ric(estrategia):
+    """True si la estrategia necesita el rango intercuartil de la serie."""
+    return estrategia == "freedman-diaconis"
+
+
+def colas_abiertas(estrategia):
+    """True si las clases de los extremos llegan a -inf y +inf en FE."""
+    return estrategia == "equiprobables"
+
+
+def fe_condicionada(estrategia):
+    """True si FE se calcula sobre los valores dentro de los bordes, con la
+    distribucion restringida a [b₀, bₖ]."""
+    return estrategia == "fijos"
+
+
+def cantidad_intervalos(estrategia, intervalos, n, minimo, maximo, ric=None):
+    """Cantidad de intervalos de la estrategia (intervalos si es fija)."""
+    if estrategia == "sturges":
+        k = ceil(log2(n)) + 1 if n > 0 else 1
+    elif estrategia == "freedman-diaconis":
+        ancho = 2 * ric / n ** (1 / 3) if n > 0 and ric else 0.0
+        k = ceil((maximo - minimo) / ancho) if ancho > 0 else intervalos
+    else:
+        k = intervalos
+    return int(min(max(k, 1), MAX_INTERVALOS))
+
+
+def calcular_bordes(estrategia, intervalos, distrib, params, n, minimo,
+                    maximo, ric=None, bordes=None):
+    """
+    Bordes (k+1 valores crecientes) segun la estrategia.
+    - intervalos: k para "iguales" y "equiprobables"
+    - minimo, maximo: de la serie
+    - ric: rango intercuartil, solo para "freedman-diaconis"
+    - bordes: los del usuario, solo para "fijos"; si se pasa distrib,
+      ademas deben abarcar valores posibles de la distribucion
+    Lanza ValueError si la estrategia no existe o los bordes no sirven.
+    """
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estrategia de intervalos desconocida: {estrategia}")
+
+    if estrategia == "fijos":
+        bordes = np.asarray(bordes if bordes is not None else [],
+                            dtype=np.float64)
+        if len(bordes) < 2 or np.any(np.diff(bordes) <= 0):
+            raise ValueError(
+                "Los bordes fijos deben ser al menos dos valores crecientes")
+        if distrib is not None:
+            d = obtener(distrib)
+            extremos = d.cdf(bordes[[0, -1]], params)
+            if extremos[1] - extremos[0] <= 0:
+                raise ValueError(
+                    f"Los bordes fijos [{bordes[0]:g}, {bordes[-1]:g}] no "
+                    f"abarcan valores posibles de la {d.nombre}")
+        return bordes
+
+    k = cantidad_intervalos(estrategia, intervalos, n, minimo, maximo, ric)
+    if estrategia != "equiprobables":
+        return np.linspace(minimo, maximo, k + 1)
+
+    interiores = obtener(distrib).ppf(np.arange(1, k) / k, params)
+    # Los extremos se dibujan en el minimo y el maximo de la serie (FE los
+    # trata como abiertos), sin cruzarse con los bordes interiores
+    primero = min(minimo, interiores[0]) if k > 1 else minimo
+    ultimo = max(maximo, interiores[-1]) if k > 1 else maximo
+    return np.concatenate([[primero], interiores, [ultimo]])
+
+
+def contar(datos, bordes, ordenados=False):
+    """
+    FO de cada intervalo [bᵢ, bᵢ₊₁) (el ultimo incluye su borde derecho),
+    igual que numpy.histogram. Los valores fuera de los bordes no se
+    cuentan.
+    """
+    datos = np.asarray(datos)
+    if not ordenados:
+        datos = np.sort(datos)
+    posiciones = np.searchsorted(datos, bordes, side="left")
+    posiciones[-1] = np.searchsorted(datos, bordes[-1], side="right")
+    return np.diff(posiciones).astype(np.int64)
+
+
+def _cuantil_ordenados(ordenados, p):
+    # Interpolacion lineal, igual que numpy.quantile, sin recorrer la serie
+    posicion = p * (len(ordenados) - 1)
+    i = int(posicion)
+    j = min(i + 1, len(ordenados) - 1)
+    return ordenados[i] + (posicion - i) * (ordenados[j] - ordenados[i])
+
+
+def rango_intercuartil(ordenados):
+    """Q3 - Q1 de una serie ordenada."""
+    if len(ordenados) == 0:
+        return 0.0
+    return float(_cuantil_ordenados(ordenados, 0.75)
+                 - _cuantil_ordenados(ordenados, 0.25))
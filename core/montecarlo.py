@@ -0,0 +1,136 @@
+"""
+Estudio Monte Carlo de la prueba de χ².
+
+Se repite R veces generar -> agrupar en intervalos -> probar, con N valores
+de la distribucion real y contrastando contra la hipotetica, y se informa la
+proporcion de rechazos:
+- si la distribucion real es la hipotetica, es el tamaño (error tipo I)
+- si no, es la potencia de la prueba para detectar esa diferencia
+
+Las replicas se generan de a lotes como una matriz (replicas x N) y cada
+fila se agrupa en intervalos de igual ancho entre su minimo y su maximo
+(como np.histogram). Cada lote tiene su propia SeedSequence, asi que el
+resultado no depende de la cantidad de procesos.
+"""
+import numpy as np
+
+from core.aleatorios import GENERADOR_POR_DEFECTO, crear_generador
+from core.distribuciones import obtener
+from core.generadores import (
+    chi2_criticos_gl,
+    chi2_lote,
+    frecuencias_esperadas_bordes,
+    generar_distribucion,
+    semilla_raiz,
+)
+from core.paralelo import (
+    bloques_con_semilla,
+    cantidad_trabajadores,
+    ejecutar_bloques,
+)
+
+# Cantidad aproximada de valores que se generan por lote (replicas x N)
+VALORES_POR_LOTE = 2_000_000
+
+
+def histogramas_por_fila(datos, intervalos):
+    """
+    Histograma de cada fila de datos (R x N) con intervalos de igual ancho
+    entre el minimo y el maximo de la fila. Da los mismos bordes y FO que
+    np.histogram(fila, bins=intervalos), pero para todas las filas juntas.
+    Devuelve (bordes (R, k+1), fo (R, k)).
+    """
+    filas = len(datos)
+    bordes = np.linspace(datos.min(axis=1), datos.max(axis=1),
+                         intervalos + 1, axis=1)
+    primero = bordes[:, :1]
+    ancho = (bordes[:, -1:] - primero) / intervalos
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        indices = ((datos - primero) / ancho).astype(np.intp)
+    np.clip(indices, 0, intervalos - 1, out=indices)
+
+    # Misma corrección que np.histogram para valores sobre un borde
+    bajo = datos < np.take_along_axis(bordes, indices, axis=1)
+    indices[bajo] -= 1
+    alto = ((datos >= np.take_along_axis(bordes, indices + 1, axis=1))
+            & (indices != intervalos - 1))
+    indices[alto] += 1
+
+    desplazamiento = (np.arange(filas) * intervalos)[:, None]
+    fo = np.bincount((indices + desplazamiento).ravel(),
+                     minlength=filas * intervalos)
+    return bordes, fo.reshape(filas, intervalos)
+
+
+def _lote_replicas(distrib_real, params_real, replicas, semilla, generador,
+                   n, intervalos, distrib_hip, params_hip):
+    """Genera un lote de replicas y devuelve (chi2, grados_libertad)."""
+    rng = crear_generador(semilla, generador)
+    datos = generar_distribucion(
+        distrib_real, replicas * n, params_real, rng).reshape(replicas, n)
+    bordes, fo = histogramas_por_fila(datos, intervalos)
+    fe = frecuencias_esperadas_bordes(bordes, n, distrib_hip, params_hip)
+    return chi2_lote(fo, fe)
+
+
+def estudio_chi2(n, intervalos, alpha, replicas, distrib_real, params_real,
+                 distrib_hip=None, params_hip=None, semilla=None,
+                 trabajadores=1, generador=GENERADOR_POR_DEFECTO):
+    """
+    Corre el estudio y devuelve un dict con:
+    - tasa_rechazo: proporcion de replicas en las que se rechaza H0, entre
+      las replicas_validas (None si no hay ninguna)
+    - error_estandar: error estandar Monte Carlo de esa proporcion
+    - sin_decision: replicas en las que χ² no permite decidir (menos de un
+      grado de libertad tras agrupar o χ² no finito, por ejemplo con una
+      clase de FE 0); no cuentan ni como rechazo ni como no rechazo
+    - rechazos, replicas, semilla, generador y los parametros del estudio
+    - chi2, grados_libertad: arreglos con el resultado de cada replica
+    Si distrib_hip es None se contrasta contra la distribucion real.
+    """
+    if distrib_hip is None:
+        distrib_hip, params_hip = distrib_real, params_real
+
+    raiz = semilla_raiz(semilla)
+    por_lote = max(1, VALORES_POR_LOTE // n)
+    lotes = bloques_con_semilla(replicas, raiz, por_lote)
+    partes = ejecutar_bloques(
+        _lote_replicas, distrib_real, params_real, lotes,
+        cantidad_trabajadores(trabajadores),
+        generador, n, intervalos, distrib_hip, params_hip)
+
+    chi2 = np.concatenate([p[0] for p in partes])
+    # chi2_lote cuenta k - 1; la regla de la distribucion hipotetica
+    # descuenta ademas los parametros estimados de la muestra
+    grados = (np.concatenate([p[1] for p in partes])
+              - obtener(distrib_hip).estimados)
+
+    validas = (grados >= 1) & np.isfinite(chi2)
+    criticos = chi2_criticos_gl(grados[validas], alpha)
+    rechazos = int(np.count_nonzero(chi2[validas] > criticos))
+    replicas_validas = int(np.count_nonzero(validas))
+    tasa = error = None
+    if replicas_validas:
+        tasa = rechazos / replicas_validas
+        error = (tasa * (1 - tasa) / replicas_validas) ** 0.5
+
+    return {
+        "distribucion_real": distrib_real,
+        "parametros_reales": list(params_real),
+        "distribucion_hipotetica": distrib_hip,
+        "parametros_hipoteticos": list(params_hip),
+        "cantidad": n,
+        "intervalos": intervalos,
+        "alpha": alpha,
+        "replicas": replicas,
+        "semilla": raiz.entropy,
+        "generador": generador,
+        "rechazos": rechazos,
+        "replicas_validas": replicas_validas,
+        "sin_decision": replicas - replicas_validas,
+        "tasa_rechazo": tasa,
+        "error_estandar": error,
+        "chi2": chi2,
+        "grados_libertad": grados,
+    }
@@ -0,0 +1,183 @@
+"""
+Generacion en paralelo con un pool de procesos.
+
+La serie se divide siempre en los mismos bloques de TAM_BLOQUE valores, cada
+uno con su SeedSequence derivada de la semilla (ver generar_por_bloques). El
+reparto de bloques entre procesos no influye en los valores, asi que para una
+misma semilla el resultado es identico con 1 o con N procesos.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.aleatorios import GENERADOR_POR_DEFECTO, crear_generador
+from core.generadores import (
+    TAM_BLOQUE,
+    TIPO_POR_DEFECTO,
+    HistogramaAcumulado,
+    generar_distribucion,
+    semilla_bloque,
+    semilla_raiz,
+    tamanios_bloques,
+    tipo_datos,
+)
+from core.estadisticas import ResumenSerie
+from core.intervalos import ESTRATEGIA_POR_DEFECTO, calcular_bordes, usa_ric
+from core.pruebas import KSPorBloques
+
+
+def bloques_con_semilla(cantidad, raiz, tam_bloque):
+    """Lista de (indice, n, SeedSequence) de cada bloque."""
+    return [
+        (i, n, semilla_bloque(raiz, i))
+        for i, n in enumerate(tamanios_bloques(cantidad, tam_bloque))
+    ]
+
+
+def _generar_bloque(distrib, params, n, semilla, generador):
+    rng = crear_generador(semilla, generador)
+    return generar_distribucion(distrib, n, params, rng)
+
+
+def _generar_bloque_tipo(distrib, params, n, semilla, generador, tipo):
+    # La conversion se hace en el proceso que genera: a float32 viaja la
+    # mitad de bytes entre procesos
+    bloque = _generar_bloque(distrib, params, n, semilla, generador)
+    return bloque.astype(tipo, copy=False)
+
+
+def _rango_bloque(distrib, params, n, semilla, generador):
+    bloque = _generar_bloque(distrib, params, n, semilla, generador)
+    return float(np.min(bloque)), float(np.max(bloque))
+
+
+def _resumen_bloque(distrib, params, n, semilla, generador):
+    bloque = _generar_bloque(distrib, params, n, semilla, generador)
+    return ResumenSerie(semilla=semilla.spawn_key).agregar(bloque)
+
+
+def _histograma_bloque(distrib, params, n, semilla, generador, bordes,
+                       con_resumen=False):
+    bloque = _generar_bloque(distrib, params, n, semilla, generador)
+    hist = HistogramaAcumulado(bordes)
+    hist.agregar(bloque)
+    resumen = None
+    if con_resumen:
+        # El spawn_key distingue a cada bloque: el bosquejo de cuantiles no
+        # reusa el flujo con que se generaron los datos
+        resumen = ResumenSerie(semilla=semilla.spawn_key).agregar(bloque)
+    return hist, resumen
+
+
+def _ks_bloque(distrib, params, n, semilla, generador):
+    ks = KSPorBloques(distrib, params)
+    ks.agregar(_generar_bloque(distrib, params, n, semilla, generador))
+    return ks
+
+
+def ejecutar_bloques(funcion, distrib, params, bloques, trabajadores,
+                     *extra):
+    """
+    Aplica funcion(distrib, params, n, semilla, *extra) a cada bloque y
+    devuelve los resultados en el orden de los bloques. Con un solo
+    trabajador no se levanta el pool.
+    """
+    if trabajadores == 1:
+        return [funcion(distrib, params, n, ss, *extra)
+                for _, n, ss in bloques]
+
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        futuros = [pool.submit(funcion, distrib, params, n, ss, *extra)
+                   for _, n, ss in bloques]
+        return [f.result() for f in futuros]
+
+
+def cantidad_trabajadores(trabajadores=None):
+    """Cantidad de procesos a usar (por defecto, uno por nucleo)."""
+    return trabajadores or os.cpu_count() or 1
+
+
+def generar_paralelo(distrib, cantidad, params, semilla=None,
+                     trabajadores=None, tam_bloque=TAM_BLOQUE,
+                     generador=GENERADOR_POR_DEFECTO, tipo=TIPO_POR_DEFECTO):
+    """
+    Genera la serie completa repartiendo los bloques entre procesos y
+    devuelve un arreglo del tipo indicado ("float64" o "float32", ver
+    TIPOS_DATOS) con los bloques en orden.
+    """
+    dtype = tipo_datos(tipo)
+    raiz = semilla_raiz(semilla)
+    bloques = bloques_con_semilla(cantidad, raiz, tam_bloque)
+    partes = ejecutar_bloques(_generar_bloque_tipo, distrib, params, bloques,
+                              cantidad_trabajadores(trabajadores), generador,
+                              dtype)
+    if not partes:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(partes)
+
+
+def histograma_paralelo(distrib, cantidad, params, intervalos, semilla=None,
+                        bordes=None, trabajadores=None, tam_bloque=TAM_BLOQUE,
+                        generador=GENERADOR_POR_DEFECTO, resumen=None,
+                        estrategia=ESTRATEGIA_POR_DEFECTO):
+    """
+    Igual que histograma_por_bloques, pero cada proceso devuelve solo las
+    frecuencias de sus bloques y se combinan en un HistogramaAcumulado.
+    Los bordes salen de la estrategia de core.intervalos (con "fijos", son
+    los bordes pasados). Si hacen falta, una primera pasada en paralelo
+    calcula min y max (y, para Freedman-Diaconis, el rango intercuartil con
+    el bosquejo de cuantiles).
+    Si se pasa un ResumenSerie, se le combinan (en el orden de los bloques)
+    los resumenes que cada proceso calcula sobre los mismos bloques.
+    """
+    raiz = semilla_raiz(semilla)
+    bloques = bloques_con_semilla(cantidad, raiz, tam_bloque)
+    trabajadores = cantidad_trabajadores(trabajadores)
+
+    if bordes is not None:
+        hist = HistogramaAcumulado(
+            calcular_bordes("fijos", intervalos, distrib, params, cantidad,
+                            None, None, bordes=bordes))
+    else:
+        ric = None
+        if usa_ric(estrategia):
+            previo = ResumenSerie()
+            for parcial in ejecutar_bloques(_resumen_bloque, distrib, params,
+                                            bloques, trabajadores, generador):
+                previo.combinar(parcial)
+            minim, maxim = previo.minimo, previo.maximo
+            q1, q3 = previo.bosquejo.cuantiles([0.25, 0.75])
+            ric = float(q3 - q1)
+        else:
+            rangos = ejecutar_bloques(_rango_bloque, distrib, params, bloques,
+                                      trabajadores, generador)
+            minim = min(r[0] for r in rangos)
+            maxim = max(r[1] for r in rangos)
+        hist = HistogramaAcumulado(calcular_bordes(
+            estrategia, intervalos, distrib, params, cantidad, minim, maxim,
+            ric))
+
+    for parcial, resumen_bloque in ejecutar_bloques(
+            _histograma_bloque, distrib, params, bloques, trabajadores,
+            generador, hist.bordes, resumen is not None):
+        hist.combinar(parcial)
+        if resumen is not None:
+            resumen.combinar(resumen_bloque)
+    return hist
+
+
+def ks_paralelo(distrib, cantidad, params, semilla=None, trabajadores=None,
+                tam_bloque=TAM_BLOQUE, generador=GENERADOR_POR_DEFECTO):
+    """
+    K-S aproximado (ver KSPorBloques) de la serie generada por bloques
+    contra la misma distribucion, sin guardarla ni ordenarla.
+    """
+    raiz = semilla_raiz(semilla)
+    bloques = bloques_con_semilla(cantidad, raiz, tam_bloque)
+    ks = KSPorBloques(distrib, params)
+    for parcial in ejecutar_bloques(_ks_bloque, distrib, params, bloques,
+                                    cantidad_trabajadores(trabajadores),
+                                    generador):
+        ks.combinar(parcial)
+    return ks.resultado()
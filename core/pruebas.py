@@ -0,0 +1,182 @@
+"""
+Pruebas de bondad de ajuste que no dependen de los intervalos:
+Kolmogorov-Smirnov y Anderson-Darling.
+
+Ambas ordenan la serie una vez (O(N log N)) y evaluan la CDF hipotetica
+de forma vectorizada sobre el arreglo ordenado. Para series que no conviene
+ordenar en memoria, KSPorBloques aproxima K-S acumulando por bloques el
+histograma de U = F(X) en M clases de igual ancho en [0, 1].
+
+Cada prueba devuelve un dict con prueba, n, estadistico y p_valor; el
+rechazo a un nivel alpha se decide con rechaza(resultado, alpha) y el
+valor critico con valor_critico(resultado, alpha).
+"""
+from functools import lru_cache
+from math import exp, log, sqrt
+
+import numpy as np
+
+from core.generadores import cdf
+
+# Terminos de la serie de Kolmogorov (sobran para cualquier lambda > 0.2)
+_TERMINOS_KOLMOGOROV = np.arange(1, 101)
+
+# Clases del histograma de F(X) en KSPorBloques (error de D <= 1/M)
+CLASES_KS = 2 ** 16
+
+
+def _sqrt_n_efectivo(n):
+    """Correccion de Stephens para la distribucion asintotica de D."""
+    raiz = sqrt(n)
+    return raiz + 0.12 + 0.11 / raiz
+
+
+def p_valor_ks(d, n):
+    """P(D > d) con la distribucion de Kolmogorov y la correccion de
+    Stephens para n finito."""
+    lmd = _sqrt_n_efectivo(n) * d
+    if lmd < 0.2:
+        return 1.0
+    k = _TERMINOS_KOLMOGOROV
+    p = 2 * np.sum((-1.0) ** (k - 1) * np.exp(-2 * (k * lmd) ** 2))
+    return float(min(1.0, max(0.0, p)))
+
+
+def ks_critico(n, alpha):
+    """Valor critico aproximado de D: sqrt(-ln(alpha/2) / 2) / sqrt(n)."""
+    return sqrt(-0.5 * log(alpha / 2)) / _sqrt_n_efectivo(n)
+
+
+def _verificar_n(n):
+    """Las pruebas necesitan al menos un valor."""
+    if n < 1:
+        raise ValueError("La prueba necesita al menos un valor")
+
+
+def ks(datos, distrib, params, ordenados=False):
+    """
+    Prueba de Kolmogorov-Smirnov contra la distribucion hipotetica:
+    D = max(D+, D-), con D+ = max(i/n - F(x_i)) y D- = max(F(x_i) - (i-1)/n)
+    sobre la serie ordenada. Lanza ValueError si la serie esta vacia.
+    """
+    x = np.asarray(datos, dtype=np.float64)
+    if not ordenados:
+        x = np.sort(x)
+    n = len(x)
+    _verificar_n(n)
+    f = cdf(distrib, x, params)
+    i = np.arange(1, n + 1)
+    d_mas = float(np.max(i / n - f))
+    d_menos = float(np.max(f - (i - 1) / n))
+    d = max(d_mas, d_menos)
+    return {"prueba": "Kolmogorov-Smirnov", "n": n, "estadistico": d,
+            "p_valor": p_valor_ks(d, n)}
+
+
+def _cdf_adinf(z):
+    """P(A² <= z) asintotica (Marsaglia y Marsaglia, 2004)."""
+    if z <= 0:
+        return 0.0
+    if z < 2:
+        return (exp(-1.2337141 / z) / sqrt(z)
+                * (2.00012 + (0.247105 - (0.0649821 - (0.0347962 - (
+                    0.011672 - 0.00168691 * z) * z) * z) * z) * z))
+    return exp(-exp(1.0776 - (2.30695 - (0.43424 - (0.082433 - (
+        0.008056 - 0.0003146 * z) * z) * z) * z) * z))
+
+
+def p_valor_ad(a2):
+    """P(A² > a2) con la distribucion asintotica (ADinf)."""
+    return min(1.0, max(0.0, 1.0 - _cdf_adinf(a2)))
+
+
+@lru_cache(maxsize=32)
+def ad_critico(alpha):
+    """Valor de A² con p-valor alpha (biseccion sobre ADinf)."""
+    bajo, alto = 0.01, 50.0
+    for _ in range(100):
+        medio = (bajo + alto) / 2
+        if p_valor_ad(medio) > alpha:
+            bajo = medio
+        else:
+            alto = medio
+    return (bajo + alto) / 2
+
+
+def anderson_darling(datos, distrib, params, ordenados=False):
+    """
+    Prueba de Anderson-Darling con parametros conocidos:
+    A² = -n - (1/n) Σ (2i - 1) [ln F(x_i) + ln(1 - F(x_(n+1-i)))].
+    Lanza ValueError si la serie esta vacia.
+    """
+    x = np.asarray(datos, dtype=np.float64)
+    if not ordenados:
+        x = np.sort(x)
+    n = len(x)
+    _verificar_n(n)
+    # Se acota F para que un valor en la cola no de log(0)
+    f = np.clip(cdf(distrib, x, params), 1e-300, 1 - 1e-16)
+    pesos = 2 * np.arange(1, n + 1) - 1
+    a2 = -n - float(np.dot(pesos, np.log(f) + np.log1p(-f[::-1]))) / n
+    return {"prueba": "Anderson-Darling", "n": n, "estadistico": a2,
+            "p_valor": p_valor_ad(a2)}
+
+
+def pruebas_ordenadas(datos, distrib, params, ordenados=False):
+    """K-S y Anderson-Darling ordenando la serie una sola vez (ninguna si
+    ya viene ordenada)."""
+    x = np.asarray(datos, dtype=np.float64)
+    if not ordenados:
+        x = np.sort(x)
+    return [ks(x, distrib, params, ordenados=True),
+            anderson_darling(x, distrib, params, ordenados=True)]
+
+
+class KSPorBloques:
+    """
+    K-S aproximado para series por bloques: acumula el histograma de
+    U = F(X) en M clases iguales de [0, 1]. Si X sigue la hipotesis, U es
+    uniforme, y D se estima en los bordes de las clases como
+    max |Fn(j/M) - j/M|. El D exacto queda entre ese valor y el mismo
+    mas 1/M. Los acumuladores de distintos procesos se pueden combinar.
+    """
+
+    def __init__(self, distrib, params, clases=CLASES_KS):
+        self.distribucion = distrib
+        self.params = tuple(params)
+        self.cuentas = np.zeros(clases, dtype=np.int64)
+        self.total = 0
+
+    def agregar(self, bloque):
+        u = cdf(self.distribucion, bloque, self.params)
+        clases = len(self.cuentas)
+        indices = np.minimum((u * clases).astype(np.intp), clases - 1)
+        self.cuentas += np.bincount(indices, minlength=clases)
+        self.total += len(bloque)
+
+    def combinar(self, otro):
+        self.cuentas += otro.cuentas
+        self.total += otro.total
+        return self
+
+    def resultado(self):
+        _verificar_n(self.total)
+        clases = len(self.cuentas)
+        acumulada = np.cumsum(self.cuentas) / self.total
+        bordes = np.arange(1, clases + 1) / clases
+        d = float(np.max(np.abs(acumulada - bordes)))
+        return {"prueba": "Kolmogorov-Smirnov", "n": self.total,
+                "estadistico": d, "p_valor": p_valor_ks(d, self.total),
+                "aproximado": True, "error_maximo": 1 / clases}
+
+
+def rechaza(resultado, alpha):
+    """True si la prueba rechaza H0 al nivel alpha."""
+    return resultado["p_valor"] < alpha
+
+
+def valor_critico(resultado, alpha):
+    """Valor critico del estadistico de la prueba al nivel alpha."""
+    if resultado["prueba"] == "Anderson-Darling":
+        return ad_critico(alpha)
+    return ks_critico(resultado["n"], alpha)
@@ -0,0 +1,229 @@
+"""
+Tabla de valores criticos de χ² precalculada con
+scipy.stats.chi2.ppf(1 - alpha, grados de libertad), para los alpha que
+ofrece la interfaz y de 1 a GL_MAX grados de libertad. Permite responder
+los casos comunes sin importar scipy.stats.
+"""
+
+# Maxima cantidad de grados de libertad incluida en la tabla
+GL_MAX = 100
+
+# alpha -> (valor para 1 grado de libertad, 2, ..., GL_MAX)
+TABLA_CHI2 = {
+    0.5: (
+        0.454936423119572, 1.386294361119891, 2.3659738843753377,
+        3.3566939800333224, 4.351460191095526, 5.348120627447118,
+        6.345811195521515, 7.344121497701794, 8.342832692252955,
+        9.34181776559197, 10.340998074391827, 11.34032237742414,
+        12.339755882563905, 13.33927414909954, 14.338859510956645,
+        15.338498885001608, 16.338182377392467, 17.33790236874074,
+        18.337652896756474, 19.337429229428256, 20.337227563547934,
+        21.337044807672633, 22.336878423184253, 23.336726306089535,
+        24.336586697884293, 25.336458117477264, 26.336339308591434,
+        27.3362291986898, 28.33612686658445, 29.336031516661585,
+        30.33594245819813, 31.335859088634486, 32.33578087994843,
+        33.33570736747922, 34.33563814070362, 35.335572835576905,
+        36.33551112813836, 37.33545272914338, 38.33539737953598,
+        39.33534484661134, 40.33529492074913, 41.335247412621,
+        42.33520215079366, 43.335158979663895, 44.33511775767295,
+        45.33507835575727, 46.335040655999876, 47.33500455045263,
+        48.33496994010476, 49.33493673397683, 50.334904848322715,
+        51.334874205924834, 52.33484473547028, 53.33481637099703,
+        54.33478905140144, 55.334762719999034, 56.33473732413218,
+        57.334712814818765, 58.33468914643707, 59.33466627644246,
+        60.33464416511231, 61.334622775315836, 62.33460207230615,
+        63.334582023531965, 64.33456259846689, 65.33454376845442,
+        66.3345255065669, 67.33450778747714, 68.3344905873412,
+        69.33447388369147, 70.3344576553387, 71.33444188228243,
+        72.33442654562872, 73.33441162751471, 74.33439711103925,
+        75.33438298019904, 76.33436921982972, 77.33435581555173,
+        78.33434275372011, 79.3343300213782, 80.3343176062148,
+        81.33430549652446, 82.33429368117069, 83.33428214955178,
+        84.33427089156912, 85.33425989759769, 86.3342491584586,
+        87.3342386653936, 88.33422841004118, 89.33421838441441,
+        90.3342085808802, 91.33419899213989, 92.33418961121116,
+        93.33418043141103, 94.33417144634008, 95.33416264986747,
+        96.33415403611706, 97.3341455994543, 98.33413733447392,
+        99.33412923598846,
+    ),
+    0.1: (
+        2.705543454095404, 4.605170185988092, 6.251388631170325,
+        7.779440339734858, 9.236356899781123, 10.644640675668422,
+        12.017036623780532, 13.36156613651173, 14.683656573259837,
+        15.987179172105265, 17.275008517500073, 18.54934778670325,
+        19.81192930712756, 21.064144212997064, 22.307129581578693,
+        23.541828923096105, 24.76903534390146, 25.98942308263721,
+        27.203571029356844, 28.41198058430563, 29.61508943618274,
+        30.813282343953027, 32.006899681704304, 33.19624428862818,
+        34.38158701755296, 35.563171271923466, 36.741216747797644,
+        37.915922544697075, 39.08746977069396, 40.2560237387118,
+        41.42173582978522, 42.584745082980845, 43.74517955943419,
+        44.90315751851995, 46.05878843683669, 47.21217389493738,
+        48.36340835219434, 49.51257982657556, 50.65977049321374,
+        51.80505721331751, 52.94851200308203, 54.090202450712404,
+        55.23019208840891, 56.368540725118756, 57.50530474499599,
+        58.64053737579172, 59.774288930795954, 60.90660702744837,
+        62.03753678530966, 63.167121005726315, 64.29540033521585,
+        65.42241341433979, 66.54819701360925, 67.6727861577775,
+        68.79621423970931, 69.91851312487637, 71.03971324740432,
+        72.15984369849215, 73.27893230793083, 74.3970057193686,
+        75.51408945989918, 76.63020800448774, 77.74538483569489,
+        78.8596424991116, 79.97300265487546, 81.08548612560165,
+        82.19711294102899, 83.3079023796519, 84.41787300758358,
+        85.52704271487188, 86.6354287494692, 87.74304774903904,
+        88.84991577076495, 89.95604831931354, 91.06146037308898,
+        92.16616640890501, 93.27018042518961, 94.37351596382737,
+        95.47618613073624, 96.57820361526701, 97.67958070850705,
+        98.7803293205625, 99.88046099688853, 100.97998693373012,
+        102.0789179927325, 103.17726471477495, 104.2750373330777,
+        105.37224578562838, 106.46889972697033, 107.56500853939279,
+        108.66058134355924, 109.75562700860829, 110.85015416175854,
+        111.94417119744712, 113.037686286029, 114.13070738206277,
+        115.2232422322066, 116.31529838274676, 117.4068831867789,
+        118.49800381106212,
+    ),
+    0.05: (
+        3.841458820694124, 5.991464547107979, 7.814727903251179,
+        9.487729036781154, 11.070497693516351, 12.591587243743977,
+        14.067140449340169, 15.50731305586545, 16.918977604620448,
+        18.307038053275146, 19.67513757268249, 21.02606981748307,
+        22.362032494826934, 23.684791304840576, 24.995790139728616,
+        26.29622760486423, 27.58711163827534, 28.869299430392623,
+        30.14352720564616, 31.410432844230918, 32.670573340917315,
+        33.92443847144381, 35.17246162690806, 36.41502850180731,
+        37.65248413348277, 38.885138659830055, 40.113272069413625,
+        41.33713815142739, 42.55696780429269, 43.77297182574219,
+        44.98534328036513, 46.19425952027847, 47.39988391908093,
+        48.602367367294164, 49.80184956820181, 50.99846016571065,
+        52.192319730102895, 53.383540622969356, 54.572227758941736,
+        55.75847927888702, 56.94238714682408, 58.12403768086803,
+        59.30351202689981, 60.480886582336446, 61.65623337627955,
+        62.829620411408165, 64.00111197221803, 65.17076890356982,
+        66.3386488629688, 67.5048065495412, 68.66929391228578,
+        69.83216033984813, 70.99345283378227, 72.15321616702309,
+        73.31149302908324, 74.46832415930936, 75.62374846937608,
+        76.7778031560615, 77.93052380523042, 79.08194448784874,
+        80.23209784876272, 81.3810151888991, 82.5287265414718,
+        83.67526074272097, 84.82064549765667, 85.96490744123096,
+        87.10807219532191, 88.25016442187412, 89.39120787250796,
+        90.53122543488065, 91.67023917605484, 92.80827038310771,
+        93.94533960119225, 95.08146666924324, 96.21667075350383,
+        97.35097037903296, 98.48438345934042, 99.61692732428385,
+        100.74861874635032, 101.87947396543588, 103.00950871222618,
+        104.13873823027387, 105.26717729686034, 106.39484024272251,
+        107.52174097071946, 108.6478929735076, 109.77330935028795,
+        110.89800282268448, 112.02198574980785, 113.1452701425554,
+        114.26786767719355, 115.38978970826685, 116.51104728087356,
+        117.63165114234555, 118.75161175336736, 119.87093929856714,
+        120.98964369660958, 122.10773460981942, 123.2252214533618,
+        124.34211340400407,
+    ),
+    0.025: (
+        5.023886187314888, 7.377758908227871, 9.348403604496148,
+        11.143286781877796, 12.832501994030027, 14.44937533544792,
+        16.012764274629326, 17.534546139484647, 19.02276779864163,
+        20.483177350807388, 21.9200492610212, 23.33666415864534,
+        24.735604884931547, 26.11894804503737, 27.488392863442975,
+        28.845350723404753, 30.19100912163982, 31.526378440386626,
+        32.85232686172969, 34.16960690283833, 35.478875905727264,
+        36.78071208403556, 38.0756272503558, 39.36407702660391,
+        40.6464691202752, 41.92317009635392, 43.19451096615604,
+        44.460791836317746, 45.72228580417452, 46.97924224367115,
+        48.23188959445197, 49.48043774297169, 50.72508006628123,
+        51.96599519512188, 53.20334854205644, 54.437293631813226,
+        55.6679732642611, 56.895520535055965, 58.12005973468633,
+        59.34170714317118, 60.56057173484372, 61.7767558053492,
+        62.990355531102004, 64.20146146988681, 65.41015900999955,
+        66.61652877425047, 67.82064698425245, 69.02258578966607,
+        70.22241356643451, 71.42019518750642, 72.61599226908585,
+        73.80986339506073, 75.0018643219286, 76.19204816624999,
+        77.38046557641917, 78.56716489032426, 79.75219228029036,
+        80.93559188653639, 82.1174059402383, 83.2976748771732,
+        84.47643744280906, 85.65373078961532, 86.82959056728612,
+        88.0040510064975, 89.17714499675617, 90.34890415884094,
+        91.51935891228952, 92.68853853833859, 93.85647123868539,
+        95.02318419040617, 96.18870359733322, 97.35305473816615,
+        98.51626201156778, 99.67834897847239, 100.83933840181336,
+        101.99925228386165, 103.15811190134657, 104.31593783851922,
+        105.47275001830302, 106.62856773166568, 107.7834096653345,
+        108.93729392796813, 110.09023807488877, 111.24225913146984,
+        112.39337361526813, 113.5435975569813, 114.69294652030611,
+        115.84143562076726, 116.98907954358143, 118.13589256061546,
+        119.28188854649565, 120.42708099391761, 121.57148302820679,
+        122.71510742117201, 123.85796660429504, 125.00007268129394,
+        126.14143744009598, 127.28207236425453, 128.4219886438403,
+        129.5611971858366,
+    ),
+    0.01: (
+        6.6348966010212145, 9.21034037197618, 11.344866730144373,
+        13.276704135987622, 15.08627246938899, 16.811893829770927,
+        18.475306906582357, 20.090235029663233, 21.665994333461924,
+        23.209251158954356, 24.724970311318277, 26.216967305535853,
+        27.68824961045705, 29.141237740672796, 30.57791416689249,
+        31.999926908815176, 33.40866360500461, 34.805305734705065,
+        36.19086912927004, 37.56623478662507, 38.93217268351607,
+        40.289360437593864, 41.638398118858476, 42.97982013935165,
+        44.31410489621915, 45.64168266628317, 46.962942124751436,
+        48.27823577031548, 49.58788447289881, 50.89218131151707,
+        52.19139483319193, 53.48577183623535, 54.77553976011035,
+        56.06090874778906, 57.3420734338592, 58.61921450168706,
+        59.89250004508689, 61.1620867636897, 62.4281210161849,
+        63.690739751564465, 64.9500713352112, 66.20623628399322,
+        67.45934792232582, 68.7095129693454, 69.95683206583814,
+        71.20140024831149, 72.44330737654823, 73.68263852010573,
+        74.91947430847816, 76.1538912490127, 77.38596201613736,
+        78.6157557150025, 79.84333812225145, 81.0687719062971,
+        82.29211682919967, 83.51342993198946, 84.73276570506393,
+        85.95017624510335, 87.16571139978757, 88.37941890144937,
+        89.59134449068712, 90.80153203083871, 92.01002361413214,
+        93.21685966023843, 94.42207900788506, 95.62571900011294,
+        96.82781556371239, 98.02840328331405, 99.22751547056947,
+        100.42518422881135, 101.62144051355205, 102.81631418914067,
+        104.00983408187484, 105.20202802983307, 106.3929229296718,
+        107.58254478061242, 108.77091872581823, 109.95806909135288,
+        111.14401942288376, 112.32879252029748, 113.51241047036046,
+        114.69489467756802, 115.87626589329334, 117.0565442433582,
+        118.23574925412316, 119.413899877195, 120.59101451284052,
+        121.76711103218736, 122.9422067982886, 124.11631868612129,
+        125.28946310158369, 126.46165599955252, 127.63291290105586,
+        128.80324890961418, 129.97267872679876, 131.141216667052,
+        132.30887667181258, 133.47567232298493, 134.64161685578915,
+        135.80672317102676,
+    ),
+    0.005: (
+        7.879438576622417, 10.596634733096073, 12.838156466598647,
+        14.860259000560243, 16.74960234363904, 18.547584178511087,
+        20.27773987496262, 21.95495499065953, 23.589350781257387,
+        25.18817957197117, 26.756848916469636, 28.299518822046025,
+        29.819471223653217, 31.31934962259528, 32.80132064579183,
+        34.26718653782669, 35.71846565900461, 37.15645145660674,
+        38.58225655493424, 39.99684631293865, 41.40106477141761,
+        42.795654999308546, 44.18127524997109, 45.558511936530586,
+        46.92789016008074, 48.28988233245682, 49.644915298994256,
+        50.993376268499446, 52.335617785933614, 53.671961930240585,
+        55.002703880023894, 56.328114959710874, 57.64844525585854,
+        58.963925875519394, 60.274770904781015, 61.581179114757255,
+        62.88333545374116, 64.18141235740624, 65.47557090346805,
+        66.76596183280391, 68.05272645544157, 69.33599745690042,
+        70.61589961796635, 71.89255045899918, 73.16606081822505,
+        74.4365353721017, 75.70407310469471, 76.96876773204455,
+        78.23070808668994, 79.48997846682893, 80.74665895401331,
+        82.00082570277534, 83.25255120516114, 84.50190453277642,
+        85.74895155864104, 86.99375516087174, 88.23637540998219,
+        89.47686974138104, 90.71529311447577, 91.95169815962974,
+        93.1861353140891, 94.41865294787443, 95.64929748052855,
+        96.8781134895179, 98.10514381100944, 99.3304296336631,
+        100.55401058602806, 101.77592481806388, 102.99620907726485,
+        104.21489877981679, 105.43202807717714, 106.64762991843354,
+        107.86173610876267, 109.074377364285, 110.28558336358,
+        111.49538279611295, 112.70380340778986, 113.9108720438518,
+        115.1166146892916, 116.32105650696919, 117.52422187358157,
+        118.72613441363404, 119.92681703154781, 121.1262919420236,
+        122.3245806987813, 123.52170422177669, 124.71768282299229,
+        125.91253623089726, 127.10628361365268, 128.29894360114548,
+        129.49053430592028, 130.68107334307612, 131.8705778491886,
+        133.05906450031736, 134.24654952915253, 135.43304874134594,
+        136.61857753108032, 137.80315089591303, 138.98678345093953,
+        140.1694894423138,
+    ),
+}
@@ -1,4 +1,5 @@
 from pathlib import Path
+import os
 import sys
 
 def _base_dir() -> Path:
@@ -15,3 +16,13 @@ def aplicar_estilo(qapp, modo: str = "claro") -> None:
             qapp.setStyleSheet(f.read())
     except FileNotFoundError:
         print(f"[WARNING] No se encontró {ruta_qss}")
+
+
+def memoria_residente() -> int:
+    """Memoria residente actual del proceso en bytes (0 si no se puede
+    leer, por ejemplo fuera de Linux)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
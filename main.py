@@ -1,20 +1,16 @@
+import multiprocessing
 import sys
+import weakref
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QStackedWidget
 
-from core.generadores import (
-    generar_numeros_pseudoaleatorios,
-    darDistExp,
-    darDistNorm,
-    darDistUnifAB,
-)
-from core.utilidades import aplicar_estilo
+from core.utilidades import aplicar_estilo, memoria_residente
 
 from paginas.PaginaInicio import PaginaInicio
 from paginas.PaginaElegirDist import PaginaElegirDist
-from paginas.PaginaValsExp import PaginaValsExp
-from paginas.PaginaValsNorm import PaginaValsNorm
-from paginas.PaginaValsUnif import PaginaValsUnif
-from paginas.PaginaResultados import PaginaResultados
+from paginas.PaginaParametros import PaginaParametros
+
+# numpy, scipy y matplotlib se importan recién al llegar a los resultados
+# (ver ir_a_resultados y cargar_serie) para que la ventana abra rápido
 
 
 class MainWindow(QWidget):
@@ -28,95 +24,166 @@ class MainWindow(QWidget):
         self.stack = QStackedWidget()
         main_layout.addWidget(self.stack)
 
+        # (datos, metadatos) de una serie cargada desde archivo, si la hay
+        self.serie_cargada = None
+
+        # Las páginas de inicio, elección y parámetros se crean una sola vez
+        # y se reutilizan; las de resultados se descartan al salir de ellas.
+        # resultados_vivos permite comprobar que no queden páginas retenidas.
+        self.pagina_elegir = None
+        self.pagina_barrido = None
+        self.paginas_parametros = {}
+        self.resultados_vivos = weakref.WeakSet()
+
         # Página inicial
-        inicio = PaginaInicio(
+        self.inicio = PaginaInicio(
             callback_seleccion=self.elegir_dist,
             callback_volver=self.volver,
             callback_cerrar=self.cerrar_aplicacion,
+            callback_barrido=self.ir_a_barrido,
         )
-        self.stack.addWidget(inicio)
+        self.stack.addWidget(self.inicio)
 
-    def elegir_dist(self):
-        elegir = PaginaElegirDist(
-            callback_seleccion=self.ir_a_parametros,
-            callback_volver=self.volver,
-            callback_cerrar=self.cerrar_aplicacion,
-        )
-        self.stack.addWidget(elegir)
-        self.stack.setCurrentWidget(elegir)
-
-    def ir_a_parametros(self, distribucion, cantidad, intervalos):
-        self.distribucion = distribucion
-        self.cantidad = cantidad
-        self.intervalos = intervalos
+    def _mostrar(self, pagina):
+        if self.stack.indexOf(pagina) == -1:
+            self.stack.addWidget(pagina)
+        self.stack.setCurrentWidget(pagina)
 
-        if distribucion == "Normal":
-            pagina = PaginaValsNorm(
-                cantidad,
-                intervalos,
-                callback_generado=self.ir_a_resultados,
+    def elegir_dist(self):
+        if self.pagina_elegir is None:
+            self.pagina_elegir = PaginaElegirDist(
+                callback_seleccion=self.ir_a_parametros,
                 callback_volver=self.volver,
                 callback_cerrar=self.cerrar_aplicacion,
+                callback_cargar=self.cargar_serie,
             )
-        elif distribucion == "Exponencial Negativa":
-            pagina = PaginaValsExp(
-                cantidad,
-                intervalos,
-                callback_generado=self.ir_a_resultados,
+        self._mostrar(self.pagina_elegir)
+
+    def ir_a_barrido(self):
+        from paginas.PaginaBarrido import PaginaBarrido
+
+        if self.pagina_barrido is None:
+            self.pagina_barrido = PaginaBarrido(
+                callback_detalle=self.ver_celda,
                 callback_volver=self.volver,
                 callback_cerrar=self.cerrar_aplicacion,
             )
-        else:  # Uniforme
-            pagina = PaginaValsUnif(
+        self._mostrar(self.pagina_barrido)
+
+    def ver_celda(self, celda):
+        """Resultados completos de una combinación del barrido: con su
+        semilla y generador se vuelve a generar la misma serie."""
+        self.serie_cargada = None
+        self.semilla = celda["semilla"]
+        self.generador = celda["generador"]
+        self.tipo = "float64"
+        self.estrategia = celda["estrategia"]
+        self.bordes = None
+        self.ir_a_resultados(celda["distribucion"], celda["cantidad"],
+                             celda["intervalos"], *celda["parametros"])
+
+    def cargar_serie(self, ruta, distribucion, intervalos,
+                     estrategia="iguales", bordes=None):
+        """Abre una serie exportada (los .npy como memmap) y sigue a los
+        parámetros de la distribución contra la que se la quiere probar."""
+        from core.exportar import cargar_serie
+
+        serie = cargar_serie(ruta)
+        self.ir_a_parametros(distribucion, len(serie[0]), intervalos,
+                             estrategia=estrategia, bordes=bordes)
+        self.serie_cargada = serie
+
+    def ir_a_parametros(self, distribucion, cantidad, intervalos,
+                        generador=None, semilla=None, tipo="float64",
+                        estrategia="iguales", bordes=None):
+        from core.aleatorios import GENERADOR_POR_DEFECTO
+        from core.distribuciones import obtener
+
+        self.serie_cargada = None
+        self.distribucion = distribucion
+        self.cantidad = cantidad
+        self.intervalos = intervalos
+        self.generador = generador or GENERADOR_POR_DEFECTO
+        self.semilla = semilla
+        self.tipo = tipo
+        self.estrategia = estrategia
+        self.bordes = bordes
+
+        pagina = self.paginas_parametros.get(distribucion)
+        if pagina is None:
+            pagina = PaginaParametros(
+                obtener(distribucion),
                 cantidad,
                 intervalos,
                 callback_generado=self.ir_a_resultados,
                 callback_volver=self.volver,
                 callback_cerrar=self.cerrar_aplicacion,
             )
+            self.paginas_parametros[distribucion] = pagina
+        else:
+            # Se conservan los parámetros ingresados la vez anterior
+            pagina.cantidad = cantidad
+            pagina.intervalos = intervalos
 
-        self.stack.addWidget(pagina)
-        self.stack.setCurrentWidget(pagina)
+        self._mostrar(pagina)
 
-    def ir_a_resultados(self, distribucion, cantidad, *params):
-        datos = generar_numeros_pseudoaleatorios(cantidad)
-        media = None
-        desviacion = None
-        lmd = None
-        val_A = None
-        val_B = None
-        
-        if distribucion == "Normal":
-            # PaginaValsNorm te pasa (cantidad, intervalos, media, desviacion)
-            datos = darDistNorm(datos, *params[1:])
-            media, desviacion = params[1], params[2]
-        elif distribucion == "Exponencial Negativa":
-            # PaginaValsExp te pasa (cantidad, intervalos, lmd)
-            datos = darDistExp(datos, *params[1:])
-            lmd, = params[1:]
-        else:  # Uniforme
-            # PaginaValsUnif te pasa (cantidad, intervalos, A, B)
-            datos = darDistUnifAB(datos, *params[1:])
-            val_A, val_B = params[1], params[2]
+    def ir_a_resultados(self, distribucion, cantidad, intervalos, *params):
+        from paginas.PaginaResultados import PaginaResultados
+        from paginas.TareaGeneracion import TareaGeneracion
 
         pagina = PaginaResultados(
             callback_volver=self.volver,
             callback_cerrar=self.cerrar_aplicacion,
-            datos=datos,
             nombre_dist=distribucion,
-            intervalos=self.intervalos,
-            media=media,
-            desviacion=desviacion,
-            lmd=lmd,
-            A=val_A,
-            B=val_B,
+            intervalos=intervalos,
+            params=params,
         )
-        self.stack.addWidget(pagina)
-        self.stack.setCurrentWidget(pagina)
+        self.resultados_vivos.add(pagina)
+        self._mostrar(pagina)
+
+        # La generación y el análisis corren fuera del hilo de la interfaz.
+        # Con una serie cargada no se genera: se analizan esos datos y se
+        # conservan la semilla y el generador con que se la generó.
+        datos, semilla, generador = None, self.semilla, self.generador
+        if self.serie_cargada is not None:
+            datos, metadatos = self.serie_cargada
+            semilla = metadatos.get("semilla")
+            generador = metadatos.get("generador", generador)
+        tarea = TareaGeneracion(
+            distribucion, cantidad, intervalos, params,
+            semilla=semilla, generador=generador, datos=datos, tipo=self.tipo,
+            estrategia=self.estrategia, bordes=self.bordes)
+        pagina.ejecutar(tarea)
 
     def volver(self, pagina_actual):
         self.stack.removeWidget(pagina_actual)
         self.stack.setCurrentIndex(self.stack.count() - 1)
+        if not self._reutilizable(pagina_actual):
+            pagina_actual.liberar()
+            pagina_actual.deleteLater()
+
+    def _reutilizable(self, pagina):
+        return (pagina is self.inicio or pagina is self.pagina_elegir
+                or pagina is self.pagina_barrido
+                or pagina in self.paginas_parametros.values())
+
+    def memoria(self):
+        """
+        Resumen de lo que retiene la ventana: páginas en la pila, páginas
+        reutilizables, páginas de resultados todavía vivas, bytes de series
+        que retienen y memoria residente del proceso.
+        """
+        vivas = list(self.resultados_vivos)
+        return {
+            "paginas_en_pila": self.stack.count(),
+            "paginas_reutilizables": (
+                1 + (self.pagina_elegir is not None)
+                + (self.pagina_barrido is not None)
+                + len(self.paginas_parametros)),
+            "resultados_vivos": len(vivas),
+            "bytes_series": sum(p.memoria() for p in vivas),
+            "memoria_residente": memoria_residente(),
+        }
 
     @staticmethod
     def cerrar_aplicacion(self):
@@ -124,6 +191,9 @@ class MainWindow(QWidget):
 
 
 if __name__ == "__main__":
+    # El barrido usa procesos con spawn: en un ejecutable congelado los
+    # procesos hijos arrancan por aca y no deben abrir otra ventana
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     aplicar_estilo(app, modo="oscuro")
 
@@ -0,0 +1,180 @@
+from matplotlib.backends.backend_qt5agg import (
+    FigureCanvasQTAgg as FigureCanvas)
+from matplotlib.figure import Figure
+import numpy as np
+
+
+class GraficoHistograma(FigureCanvas):
+    """
+    Histograma dibujado a partir de frecuencias ya calculadas (bordes y FO),
+    sin volver a agrupar los datos.
+
+    El fondo (ejes, grilla y etiquetas) se guarda cada vez que se dibuja la
+    figura completa. Mientras no cambien los bordes y las barras entren en el
+    eje Y, actualizar() solo cambia la altura de las barras y las pinta sobre
+    ese fondo (blitting). Con bordes nuevos se redibuja todo una vez.
+
+    La superposición teórica (FE por intervalo y densidad escalada) también
+    se pinta sobre el fondo: mostrarla u ocultarla solo vuelve a pintar.
+    """
+    # Con más intervalos se suman clases contiguas para dibujar
+    MAX_BARRAS = 200
+    MAX_ETIQUETAS = 12
+    # Margen sobre la FO máxima al fijar el eje Y, para no redibujar todo
+    # en cada actualización mientras la serie crece
+    MARGEN_Y = 1.25
+
+    def __init__(self, titulo, parent=None):
+        self.figura = Figure(figsize=(6, 6))
+        super().__init__(self.figura)
+        self.setParent(parent)
+
+        self.ax = self.figura.add_subplot(111)
+        self.ax.set_title(titulo, fontweight='bold')
+        self.ax.set_xlabel("Intervalos", fontsize=12)
+        self.ax.set_ylabel("Frecuencia Observada", fontsize=12)
+        self.ax.grid(True, linestyle='--', linewidth=0.5, alpha=0.5)
+        self.figura.subplots_adjust(bottom=0.25)
+
+        self.bordes = None
+        self.barras = None
+        self._teoricos = []
+        self._fondo = None
+        # Cantidad de dibujos completos y de actualizaciones por blitting
+        self.dibujos_completos = 0
+        self.dibujos_parciales = 0
+        self.mpl_connect("draw_event", self._guardar_fondo)
+
+    @classmethod
+    def reducir(cls, bordes, fo):
+        """Suma clases contiguas para no dibujar más de MAX_BARRAS barras."""
+        paso = -(-len(fo) // cls.MAX_BARRAS)
+        if paso == 1:
+            return bordes, fo
+        inicios = np.arange(0, len(fo), paso)
+        return (np.append(bordes[inicios], bordes[-1]),
+                np.add.reduceat(fo, inicios))
+
+    def actualizar(self, bordes, fo):
+        """Muestra las frecuencias fo de las clases definidas por bordes."""
+        bordes, fo = self.reducir(np.asarray(bordes), np.asarray(fo))
+        if self.bordes is None or not np.array_equal(bordes, self.bordes):
+            self._rearmar(bordes, fo)
+            return
+        for barra, altura in zip(self.barras, fo):
+            barra.set_height(altura)
+        if fo.max() > self.ax.get_ylim()[1]:
+            self._fijar_eje_y(fo)
+            self.draw_idle()
+        else:
+            self._blit()
+
+    def superponer(self, bordes, fe, x, densidad, total, visible=True):
+        """
+        Agrega la FE de cada intervalo (escalones) y la densidad teórica
+        escalada a frecuencia, total * ancho * f(x), sobre los mismos
+        bordes que las barras. Con intervalos de distinto ancho (por
+        ejemplo, equiprobables) la densidad no tiene una única escala y
+        solo se muestra la FE. Reemplaza una superposición anterior.
+        """
+        self._quitar_teoricos()
+        anchos = np.diff(bordes)
+        iguales = np.allclose(anchos, anchos[0])
+        bordes, fe = self.reducir(np.asarray(bordes), np.asarray(fe))
+        (escalones,) = self.ax.step(
+            bordes, np.append(fe, fe[-1]), where='post', color='#ffa94d',
+            linestyle='--', linewidth=1.5, label="FE", animated=True)
+        self._teoricos = [escalones]
+        maximo = fe.max()
+
+        if iguales:
+            # Ancho de las barras dibujadas (la primera siempre está completa)
+            curva = total * (bordes[1] - bordes[0]) * densidad
+            (linea,) = self.ax.plot(
+                x, curva, color='#ff6b6b', linewidth=2,
+                label="Densidad teórica", animated=True)
+            self._teoricos.append(linea)
+            maximo = max(maximo, curva.max())
+        leyenda = self.ax.legend(handles=list(self._teoricos),
+                                 loc='upper right')
+        leyenda.set_animated(True)
+        self._teoricos.append(leyenda)
+        self.mostrar_superposicion(visible)
+
+        # El eje Y se fija para que entre la superposición aunque esté
+        # oculta: así mostrarla u ocultarla nunca cambia el fondo
+        if maximo > self.ax.get_ylim()[1]:
+            self.ax.set_ylim(0, maximo * self.MARGEN_Y)
+            self.draw_idle()
+
+    def mostrar_superposicion(self, visible):
+        """Muestra u oculta la superposición teórica sin recalcularla."""
+        for artista in self._teoricos:
+            artista.set_visible(visible)
+        if self.barras is not None:
+            self._blit()
+
+    def liberar(self):
+        """Suelta las barras, el fondo guardado y el contenido de la figura."""
+        self._fondo = self.barras = self.bordes = None
+        self._teoricos = []
+        self.figura.clear()
+
+    def _quitar_teoricos(self):
+        for artista in self._teoricos:
+            artista.remove()
+        self._teoricos = []
+
+    def _rearmar(self, bordes, fo):
+        # Una superposición anterior corresponde a otros bordes
+        self._quitar_teoricos()
+        if self.barras is not None:
+            self.barras.remove()
+        self.bordes = bordes
+        self.barras = self.ax.bar(
+            bordes[:-1],
+            fo,
+            width=np.diff(bordes),
+            align='edge',
+            edgecolor='white',
+            linewidth=1.2,
+            color='#5c7cfa',
+            alpha=0.9,
+            animated=True,
+        )
+
+        # Límites de los intervalos en el eje X (a lo sumo MAX_ETIQUETAS)
+        marcas = bordes[::-(-len(bordes) // self.MAX_ETIQUETAS)]
+        self.ax.set_xticks(marcas)
+        self.ax.set_xticklabels([f"{b:.2f}" for b in marcas],
+                                rotation=45, ha='right', fontsize=9)
+        self.ax.set_xlim(bordes[0], bordes[-1])
+        self._fijar_eje_y(fo)
+        self.draw_idle()
+
+    def _fijar_eje_y(self, fo):
+        self.ax.set_ylim(0, max(1, fo.max()) * self.MARGEN_Y)
+
+    def _pintar_barras(self):
+        for barra in self.barras:
+            self.ax.draw_artist(barra)
+        for artista in self._teoricos:
+            if artista.get_visible():
+                self.ax.draw_artist(artista)
+
+    def _guardar_fondo(self, evento):
+        # Las barras son "animated": el dibujo completo las omite, se guarda
+        # el fondo sin ellas y después se pintan encima
+        self._fondo = self.copy_from_bbox(self.ax.bbox)
+        self.dibujos_completos += 1
+        if self.barras is not None:
+            self._pintar_barras()
+
+    def _blit(self):
+        if self._fondo is None:
+            self.draw_idle()
+            return
+        self.restore_region(self._fondo)
+        self._pintar_barras()
+        self.blit(self.ax.bbox)
+        self.dibujos_parciales += 1
@@ -0,0 +1,269 @@
+from PyQt5.QtWidgets import (
+    QLabel, QComboBox, QLineEdit, QCheckBox, QFormLayout, QWidget,
+    QHBoxLayout, QProgressBar, QPushButton, QTableWidget, QTableWidgetItem,
+    QHeaderView)
+from PyQt5.QtCore import Qt
+
+from core.aleatorios import DESCRIPCIONES, GENERADOR_POR_DEFECTO
+from core.barrido import DIRECTORIO_CACHE, CacheBarrido, armar_grilla
+from core.distribuciones import nombres, obtener
+from core.intervalos import ESTRATEGIAS
+
+from .PaginaBase import PaginaBase
+from .TareaBarrido import TareaBarrido
+
+
+class PaginaBarrido(PaginaBase):
+    """
+    Barrido de parámetros: se ingresan listas de valores (para cada
+    parámetro, N, intervalos y semillas), se corre χ² para cada combinación
+    en un pool de procesos y la tabla resumen se llena a medida que
+    terminan. Las combinaciones ya calculadas salen de la caché en disco.
+    Con doble clic en una fila se abren sus resultados completos.
+    """
+    COLUMNAS = ["Parámetros", "N", "Intervalos", "Semilla", "χ²", "Grad Lib",
+                "χ² Tabla", "Resultado", "p-valor K-S", "Origen"]
+
+    def __init__(self, callback_detalle, callback_volver, callback_cerrar):
+        super().__init__("Barrido de parámetros", callback_volver,
+                         callback_cerrar)
+        self.callback_detalle = callback_detalle
+        self.cache = CacheBarrido()
+        self.tarea = None
+        self.celdas = []
+
+        self.combo = QComboBox()
+        self.combo.addItems(nombres())
+        self.combo.currentTextChanged.connect(self._armar_parametros)
+
+        # Una entrada por parámetro; se rearma al cambiar la distribución
+        self.entradas = {}
+        self.form_parametros = QFormLayout()
+        contenedor_parametros = QWidget()
+        contenedor_parametros.setLayout(self.form_parametros)
+
+        self.entrada_cantidades = QLineEdit("10000 100000")
+        self.entrada_intervalos = QLineEdit("10 20")
+        self.entrada_semillas = QLineEdit("1")
+
+        self.estrategia_combo = QComboBox()
+        for clave, descripcion in ESTRATEGIAS.items():
+            if clave != "fijos":
+                self.estrategia_combo.addItem(descripcion, clave)
+
+        self.generador_combo = QComboBox()
+        for clave, descripcion in DESCRIPCIONES.items():
+            self.generador_combo.addItem(descripcion, clave)
+        self.generador_combo.setCurrentIndex(
+            self.generador_combo.findData(GENERADOR_POR_DEFECTO))
+
+        self.check_ks = QCheckBox("Incluir K-S (otra pasada por combinación)")
+        self.check_ks.setChecked(True)
+
+        self.lbl_error = QLabel()
+        self.lbl_error.setStyleSheet("color: #e57373;")
+
+        self.set_boton_extra_texto("Ejecutar barrido")
+        self.conectar_boton_extra(self.ejecutar)
+
+        explicacion = QLabel(
+            "Ingrese uno o más valores separados por espacios. Se prueba "
+            "cada combinación; las ya calculadas se leen de la caché.")
+        explicacion.setWordWrap(True)
+        self.agregar_widget(explicacion)
+        self.agregar_widget(self.combo)
+        self.agregar_widget(contenedor_parametros)
+
+        form = QFormLayout()
+        form.addRow("Cantidades de valores (N):", self.entrada_cantidades)
+        form.addRow("Cantidades de intervalos:", self.entrada_intervalos)
+        form.addRow("Cómo armar los intervalos:", self.estrategia_combo)
+        form.addRow("Semillas:", self.entrada_semillas)
+        form.addRow("Generador:", self.generador_combo)
+        self.contenedor.addLayout(form)
+        self.agregar_widget(self.check_ks)
+        self.agregar_widget(self.lbl_error)
+
+        self._crear_seccion_progreso()
+
+        self.lbl_estado = QLabel(f"Caché: {DIRECTORIO_CACHE}")
+        self.lbl_estado.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.agregar_widget(self.lbl_estado)
+
+        self.tabla = QTableWidget(0, len(self.COLUMNAS))
+        self.tabla.setHorizontalHeaderLabels(self.COLUMNAS)
+        self.tabla.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeToContents)
+        self.tabla.horizontalHeader().setStretchLastSection(True)
+        self.tabla.setMinimumHeight(300)
+        self.tabla.cellDoubleClicked.connect(self._ver_detalle)
+        self.agregar_widget(self.tabla)
+
+        self._armar_parametros(self.combo.currentText())
+
+    def _crear_seccion_progreso(self):
+        self.progreso = QWidget()
+        layout = QHBoxLayout(self.progreso)
+        self.barra_progreso = QProgressBar()
+        self.barra_progreso.setRange(0, 100)
+        self.boton_cancelar = QPushButton("Cancelar")
+        self.boton_cancelar.clicked.connect(self._detener_tarea)
+        layout.addWidget(self.barra_progreso)
+        layout.addWidget(self.boton_cancelar)
+        self.progreso.hide()
+        self.agregar_widget(self.progreso)
+
+    def _armar_parametros(self, nombre):
+        while self.form_parametros.rowCount():
+            self.form_parametros.removeRow(0)
+        self.entradas = {}
+        for parametro in obtener(nombre).parametros:
+            entrada = QLineEdit(f"{parametro.defecto:g}")
+            self.entradas[parametro.nombre] = entrada
+            self.form_parametros.addRow(
+                f"Valores de {parametro.etiqueta}:", entrada)
+
+    @staticmethod
+    def _numeros(entrada, tipo=float):
+        """Valores de una entrada separados por espacios o comas."""
+        return [tipo(t) for t in entrada.text().replace(",", " ").split()]
+
+    def _grilla(self):
+        """(celdas, omitidas) de lo ingresado; ValueError si no sirve."""
+        try:
+            valores = {nombre: self._numeros(entrada)
+                       for nombre, entrada in self.entradas.items()}
+            cantidades = self._numeros(self.entrada_cantidades, int)
+            intervalos = self._numeros(self.entrada_intervalos, int)
+            semillas = self._numeros(self.entrada_semillas, int)
+        except ValueError:
+            raise ValueError("Los valores deben ser números (N, intervalos "
+                             "y semillas, enteros).") from None
+        if not (cantidades and intervalos and semillas):
+            raise ValueError("Ingrese al menos un N, una cantidad de "
+                             "intervalos y una semilla.")
+        if min(cantidades) < 1 or min(intervalos) < 2 or min(semillas) < 0:
+            raise ValueError("N debe ser positivo, los intervalos al menos 2 "
+                             "y las semillas, no negativas.")
+        celdas, omitidas = armar_grilla(
+            self.combo.currentText(), valores, cantidades, intervalos,
+            semillas, self.generador_combo.currentData(),
+            self.estrategia_combo.currentData(),
+            con_ks=self.check_ks.isChecked())
+        if not celdas:
+            raise ValueError(
+                f"Ninguna combinación es válida: {omitidas[0][1]}")
+        return celdas, omitidas
+
+    # Tarea en segundo plano
+    def ejecutar(self):
+        self._detener_tarea()
+        try:
+            self.celdas, omitidas = self._grilla()
+        except ValueError as e:
+            self.lbl_error.setText(str(e))
+            return
+        self.lbl_error.setText(
+            f"Se omiten {len(omitidas)} combinaciones no válidas "
+            f"({omitidas[0][1]})." if omitidas else "")
+
+        self.tabla.setSortingEnabled(False)
+        self.tabla.clearContents()
+        self.tabla.setRowCount(len(self.celdas))
+        self._en_cache = 0
+        self.lbl_estado.setText(
+            f"{len(self.celdas)} combinaciones · Caché: {DIRECTORIO_CACHE}")
+
+        tarea = TareaBarrido(self.celdas, self.cache, parent=self)
+        tarea.celda_lista.connect(self._cargar_fila)
+        tarea.progreso.connect(self.barra_progreso.setValue)
+        tarea.fallo.connect(self._mostrar_error)
+        tarea.finished.connect(lambda: self._tarea_terminada(tarea))
+        self.tarea = tarea
+        self.barra_progreso.setValue(0)
+        self.progreso.show()
+        self.boton_extra.setEnabled(False)
+        tarea.start()
+
+    def _detener_tarea(self):
+        """
+        Cancela la tarea en curso sin esperarla: se desconectan sus filas y
+        la página queda libre enseguida. El hilo termina solo (al llegar la
+        próxima celda) y se descarta en _tarea_terminada.
+        """
+        tarea, self.tarea = self.tarea, None
+        if tarea is None:
+            return
+        corriendo = tarea.isRunning()
+        if corriendo:
+            tarea.cancelar()
+            tarea.celda_lista.disconnect(self._cargar_fila)
+            tarea.progreso.disconnect(self.barra_progreso.setValue)
+            tarea.fallo.disconnect(self._mostrar_error)
+        self._mostrar_terminado(cancelado=corriendo)
+
+    def volver(self):
+        self._detener_tarea()
+        super().volver()
+
+    def _tarea_terminada(self, tarea):
+        tarea.deleteLater()
+        if tarea is self.tarea:
+            self.tarea = None
+            self._mostrar_terminado()
+
+    def _mostrar_terminado(self, cancelado=False):
+        self.progreso.hide()
+        self.boton_extra.setEnabled(True)
+        # Con la tabla completa ya se puede ordenar por cualquier columna
+        self.tabla.setSortingEnabled(True)
+        hechas = sum(self.tabla.item(f, 0) is not None
+                     for f in range(self.tabla.rowCount()))
+        self.lbl_estado.setText(
+            f"{hechas} de {len(self.celdas)} combinaciones "
+            f"({self._en_cache} desde la caché"
+            f"{', cancelado' if cancelado else ''}) · Caché: "
+            f"{DIRECTORIO_CACHE}")
+
+    def _mostrar_error(self, mensaje):
+        self.lbl_error.setText(f"Error: {mensaje}")
+
+    def _cargar_fila(self, indice_fila):
+        indice, fila = indice_fila
+        self._en_cache += fila["de_cache"]
+        parametros = ", ".join(f"{nombre} = {valor:g}"
+                               for nombre, valor in fila["parametros"].items())
+        ks = fila["ks_p_valor"]
+        chi2 = fila["chi2"]
+        critico = fila["chi2_critico"]
+        if critico is None:
+            resultado = fila["motivo"] or "Sin decisión"
+        elif fila["rechaza_h0"]:
+            resultado = "Se rechaza la H0"
+        else:
+            resultado = "No se rechaza"
+        valores = [
+            parametros,
+            fila["cantidad"],
+            fila["intervalos"],
+            fila["semilla"],
+            "-" if chi2 is None else round(chi2, 4),
+            fila["grados_libertad"],
+            "-" if critico is None else round(critico, 4),
+            resultado,
+            "-" if ks is None else round(ks, 4),
+            "caché" if fila["de_cache"] else "calculado",
+        ]
+        for col, valor in enumerate(valores):
+            item = QTableWidgetItem()
+            # Los números se guardan como tales para ordenar bien
+            item.setData(Qt.DisplayRole, valor)
+            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+            if col == 0:
+                item.setData(Qt.UserRole, indice)
+            self.tabla.setItem(indice, col, item)
+
+    def _ver_detalle(self, fila, _columna):
+        item = self.tabla.item(fila, 0)
+        if item is not None and self.callback_detalle:
+            self.callback_detalle(self.celdas[item.data(Qt.UserRole)])
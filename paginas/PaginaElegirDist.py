@@ -1,15 +1,25 @@
-from PyQt5.QtWidgets import QLabel, QSpinBox, QComboBox
+from PyQt5.QtWidgets import (
+    QLabel, QSpinBox, QComboBox, QPushButton, QFileDialog, QLineEdit,
+    QCheckBox)
+from PyQt5.QtCore import QRegExp
+from PyQt5.QtGui import QRegExpValidator
 from .PaginaBase import PaginaBase
 
 
 class PaginaElegirDist(PaginaBase):
-    def __init__(self, callback_seleccion, callback_volver, callback_cerrar):
+    def __init__(self, callback_seleccion, callback_volver, callback_cerrar,
+                 callback_cargar=None):
         super().__init__("Elija una distribucion", callback_volver, callback_cerrar)
+        # El registro importa numpy: se carga recién al elegir distribución
+        from core.aleatorios import DESCRIPCIONES, GENERADOR_POR_DEFECTO
+        from core.distribuciones import nombres
+        from core.intervalos import ESTRATEGIAS
 
         self.callback = callback_seleccion
+        self.callback_cargar = callback_cargar
 
         self.combo = QComboBox()
-        self.combo.addItems(["Normal", "Uniforme", "Exponencial Negativa"])
+        self.combo.addItems(nombres())
 
         self.spin = QSpinBox()
         self.spin.setMinimum(1)
@@ -19,6 +29,36 @@ class PaginaElegirDist(PaginaBase):
         self.intervalos_combo = QComboBox()
         self.intervalos_combo.addItems(["10", "15", "20", "25"])
 
+        # Estrategia de intervalos (la clave va como dato) y bordes fijos
+        self.estrategia_combo = QComboBox()
+        for clave, descripcion in ESTRATEGIAS.items():
+            self.estrategia_combo.addItem(descripcion, clave)
+        self.estrategia_combo.currentIndexChanged.connect(
+            self._estrategia_cambiada)
+        self.entrada_bordes = QLineEdit()
+        self.entrada_bordes.setPlaceholderText(
+            "Bordes crecientes separados por espacios, por ejemplo: -2 -1 0 1 2")
+        self.entrada_bordes.setEnabled(False)
+        self.lbl_error = QLabel()
+        self.lbl_error.setStyleSheet("color: #e57373;")
+
+        # Generador de números pseudoaleatorios (la clave va como dato)
+        self.generador_combo = QComboBox()
+        for clave, descripcion in DESCRIPCIONES.items():
+            self.generador_combo.addItem(descripcion, clave)
+        self.generador_combo.setCurrentIndex(
+            self.generador_combo.findData(GENERADOR_POR_DEFECTO))
+
+        self.entrada_semilla = QLineEdit()
+        self.entrada_semilla.setPlaceholderText("Aleatoria")
+        self.entrada_semilla.setValidator(
+            QRegExpValidator(QRegExp("[0-9]{0,30}")))
+
+        # Guardar la serie en float32 (la mitad de memoria, ~7 dígitos)
+        self.check_float32 = QCheckBox(
+            "Guardar la serie en float32 (usa la mitad de memoria y "
+            "conserva unos 7 dígitos por valor)")
+
         self.set_boton_extra_texto("Continuar")
         self.conectar_boton_extra(self.enviar_datos)
 
@@ -34,6 +74,13 @@ class PaginaElegirDist(PaginaBase):
         label_intervalos.setWordWrap(True)
         self.agregar_widget(label_intervalos)
         self.agregar_widget(self.intervalos_combo)
+        label_estrategia = QLabel(
+            "Cómo armar los intervalos (Sturges y Freedman-Diaconis eligen "
+            "su cantidad):")
+        label_estrategia.setWordWrap(True)
+        self.agregar_widget(label_estrategia)
+        self.agregar_widget(self.estrategia_combo)
+        self.agregar_widget(self.entrada_bordes)
         self.agregar_widget(QLabel(" "))
 
         label_input_val = QLabel(
@@ -41,9 +88,79 @@ class PaginaElegirDist(PaginaBase):
         label_input_val.setWordWrap(True)
         self.agregar_widget(label_input_val)
         self.agregar_widget(self.spin)
+        self.agregar_widget(QLabel(" "))
+
+        self.agregar_widget(QLabel("Generador de números pseudoaleatorios:"))
+        self.agregar_widget(self.generador_combo)
+        label_semilla = QLabel(
+            "Semilla (vacía para una aleatoria; con la misma semilla y "
+            "generador se repite la serie):")
+        label_semilla.setWordWrap(True)
+        self.agregar_widget(label_semilla)
+        self.agregar_widget(self.entrada_semilla)
+        self.agregar_widget(self.check_float32)
+        self.agregar_widget(self.lbl_error)
+
+        if callback_cargar:
+            self.agregar_widget(QLabel(" "))
+            label_cargar = QLabel(
+                "O analice una serie exportada anteriormente con la "
+                "distribucion e intervalos elegidos:")
+            label_cargar.setWordWrap(True)
+            self.boton_cargar = QPushButton("Cargar serie...")
+            self.boton_cargar.clicked.connect(self.cargar_serie)
+            self.agregar_widget(label_cargar)
+            self.agregar_widget(self.boton_cargar)
+
+    def _estrategia_cambiada(self):
+        self.entrada_bordes.setEnabled(
+            self.estrategia_combo.currentData() == "fijos")
+
+    def intervalos_elegidos(self):
+        """
+        (intervalos, estrategia, bordes) elegidos. Con bordes fijos los
+        valida y, si no sirven, muestra el error y devuelve None.
+        """
+        from core.intervalos import calcular_bordes
+
+        intervalos = int(self.intervalos_combo.currentText())
+        estrategia = self.estrategia_combo.currentData()
+        bordes = None
+        if estrategia == "fijos":
+            try:
+                bordes = [float(v) for v in
+                          self.entrada_bordes.text().replace(",", " ").split()]
+                calcular_bordes(estrategia, intervalos, None, None, None,
+                                None, None, bordes=bordes)
+            except ValueError:
+                self.lbl_error.setText(
+                    "Los bordes fijos deben ser al menos dos números "
+                    "crecientes.")
+                return None
+        self.lbl_error.clear()
+        return intervalos, estrategia, bordes
 
     def enviar_datos(self):
+        elegidos = self.intervalos_elegidos()
+        if elegidos is None:
+            return
+        intervalos, estrategia, bordes = elegidos
         dist = self.combo.currentText()
         cantidad = self.spin.value()
-        intervalos = int(self.intervalos_combo.currentText())
-        self.callback(dist, cantidad, intervalos)
+        texto = self.entrada_semilla.text()
+        semilla = int(texto) if texto else None
+        tipo = "float32" if self.check_float32.isChecked() else "float64"
+        self.callback(dist, cantidad, intervalos,
+                      self.generador_combo.currentData(), semilla, tipo,
+                      estrategia, bordes)
+
+    def cargar_serie(self):
+        elegidos = self.intervalos_elegidos()
+        if elegidos is None:
+            return
+        ruta, _ = QFileDialog.getOpenFileName(
+            self, "Cargar serie", "",
+            "Series exportadas (*.npy *.csv *.parquet)")
+        if ruta:
+            dist = self.combo.currentText()
+            self.callback_cargar(ruta, dist, *elegidos)
@@ -1,8 +1,10 @@
+from PyQt5.QtWidgets import QLabel, QPushButton
 from .PaginaBase import PaginaBase
 
 
 class PaginaInicio(PaginaBase):
-    def __init__(self, callback_seleccion, callback_volver, callback_cerrar):
+    def __init__(self, callback_seleccion, callback_volver, callback_cerrar,
+                 callback_barrido=None):
         super().__init__("Bienvenido al Programa del TP 2 del Grupo 1",
                          callback_volver, callback_cerrar)
         self.callback = callback_seleccion
@@ -10,3 +12,13 @@ class PaginaInicio(PaginaBase):
         self.boton_volver.hide()
         self.set_boton_extra_texto("Continuar")
         self.conectar_boton_extra(self.callback)
+
+        if callback_barrido:
+            label_barrido = QLabel(
+                "O pruebe χ² para muchas combinaciones de parámetros, N e "
+                "intervalos a la vez:")
+            label_barrido.setWordWrap(True)
+            self.boton_barrido = QPushButton("Barrido de parámetros...")
+            self.boton_barrido.clicked.connect(callback_barrido)
+            self.agregar_widget(label_barrido)
+            self.agregar_widget(self.boton_barrido)
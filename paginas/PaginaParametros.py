@@ -0,0 +1,52 @@
+from PyQt5.QtWidgets import QLabel, QDoubleSpinBox
+from .PaginaBase import PaginaBase
+
+
+class PaginaParametros(PaginaBase):
+    """
+    Parámetros de una distribución del registro: arma una entrada por cada
+    parámetro de su esquema y, antes de generar, valida los valores
+    (rangos y restricciones como A < B).
+    """
+
+    def __init__(self, distribucion, cantidad, intervalos,
+                 callback_generado, callback_volver, callback_cerrar):
+        super().__init__(f"Parámetros de {distribucion.nombre}",
+                         callback_volver, callback_cerrar)
+        self.distribucion = distribucion
+        self.cantidad = cantidad
+        self.intervalos = intervalos
+        self.callback = callback_generado
+
+        self.entradas = []
+        for parametro in distribucion.parametros:
+            entrada = QDoubleSpinBox()
+            entrada.setDecimals(parametro.decimales)
+            entrada.setSingleStep(10 ** -parametro.decimales)
+            entrada.setRange(parametro.minimo, parametro.maximo)
+            entrada.setValue(parametro.defecto)
+            self.entradas.append(entrada)
+
+            self.agregar_widget(QLabel(f"Ingrese {parametro.etiqueta}:"))
+            self.agregar_widget(entrada)
+            self.agregar_widget(QLabel(" "))
+
+        self.lbl_error = QLabel()
+        self.lbl_error.setStyleSheet("color: #e57373;")
+        self.agregar_widget(self.lbl_error)
+
+        self.set_boton_extra_texto("Generar")
+        self.conectar_boton_extra(self.generar)
+
+    def valores(self):
+        return tuple(entrada.value() for entrada in self.entradas)
+
+    def generar(self):
+        try:
+            params = self.distribucion.validar(self.valores())
+        except ValueError as e:
+            self.lbl_error.setText(str(e))
+            return
+        self.lbl_error.clear()
+        self.callback(self.distribucion.nombre, self.cantidad,
+                      self.intervalos, *params)
@@ -1,51 +1,77 @@
 from PyQt5.QtWidgets import (
     QLabel, QPushButton, QHBoxLayout, QVBoxLayout, QStackedWidget,
-    QTableWidget, QTableWidgetItem, QPlainTextEdit, QWidget, QHeaderView,
-    QComboBox
+    QTableWidget, QTableWidgetItem, QWidget, QHeaderView,
+    QComboBox, QProgressBar, QCheckBox
 )
 from PyQt5.QtCore import Qt
 from datetime import datetime
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
-from core.generadores import (
-    frecuencias_observadas,
-    frecuencias_esperadas,
-    obtener_histograma,
-    chi2_critico,
-    calcular_clases_chi2,
-)
+from time import perf_counter
+import numpy as np
+
+from core.exportar import formatos_disponibles
+from core.aleatorios import DESCRIPCIONES
+from core.distribuciones import obtener
+from core.estadisticas import resumen_teorico
+from core.intervalos import ESTRATEGIAS
+from core.generadores import chi2_critico_gl, curva_densidad
+from core.pruebas import rechaza, valor_critico
 
 from .PaginaBase import PaginaBase
+from .TareaExportacion import TareaExportacion
+from .VisorSerie import VisorSerie
 
 
 class PaginaResultados(PaginaBase):
+    VISTA_TABLA, VISTA_HISTOGRAMA, VISTA_SERIE = range(3)
+
     def __init__(
         self,
         callback_volver,
         callback_cerrar,
-        datos,
         nombre_dist="",
         intervalos=10,
-        media=None,
-        desviacion=None,
-        lmd=None,
-        A=None,
-        B=None,
+        params=(),
     ):
         super().__init__("Resultados", callback_volver, callback_cerrar)
         self.boton_extra.hide()
-        self.datos, self.intervalos = datos, intervalos
+        self.datos, self.intervalos = None, intervalos
         self.distribucion = nombre_dist
-        self.param_media, self.param_desv, self.param_lmd = media, desviacion, lmd
-        self.param_A, self.param_B = A, B
+        self.params = tuple(params)
+        self.tarea = None
+        self._exportacion = None
+        self._inicio = perf_counter()
+
+        # Resultado del análisis (compartido por la tabla, χ² e histograma)
+        self.analisis = None
+        # Momentos y cuantiles de la serie (llegan junto con los datos)
+        self.resumen = None
+        self.tabla_resumen = None
+        # Resultados de K-S y Anderson-Darling (llegan después del análisis)
+        self.pruebas = None
+        self.tabla_pruebas = None
+        # (bordes, fo) parciales mientras se genera y gráfico del histograma
+        self._parcial = None
+        self._grafico = None
+
+        # Vistas ya construidas y tiempos de construcción (en segundos)
+        self._construidas = set()
+        self._vista_actual = self.VISTA_TABLA
+        self.tiempos = {}
 
         self.agregar_widget(
             QLabel(f"<h2>Distribución: {self.distribucion}</h2>"))
+        # Generador y semilla de la corrida (se completa en ejecutar)
+        self.lbl_semilla = QLabel()
+        self.lbl_semilla.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.agregar_widget(self.lbl_semilla)
+
+        # Progreso de la tarea en segundo plano
+        self._crear_seccion_progreso()
+
+        # Cada vista arranca vacía y se construye recién la primera vez
+        # que se muestra (y ya están sus datos); después queda cacheada
         self.stack = QStackedWidget()
-        self.stack.addWidget(self._widget_tabla())
-        self.stack.addWidget(self._widget_histograma())
-        self.stack.addWidget(self._widget_serie())
+        self._layouts = [self._agregar_vista() for _ in range(3)]
 
         # Botones de navegación de vistas
         botones = QHBoxLayout()
@@ -63,51 +89,266 @@ class PaginaResultados(PaginaBase):
         self._crear_controles_serie()
         self.contenedor.addWidget(self.stack)
 
-    def _widget_tabla(self):
+    def _agregar_vista(self):
+        vista = QWidget()
+        layout = QVBoxLayout(vista)
+        layout.addWidget(QLabel("Calculando..."))
+        self.stack.addWidget(vista)
+        return layout
+
+    @staticmethod
+    def _reemplazar_contenido(layout, widget):
+        """Quita el texto provisorio de la vista y agrega el widget."""
+        while layout.count():
+            item = layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        layout.addWidget(widget)
+
+    def _crear_seccion_progreso(self):
+        self.progreso = QWidget()
+        layout = QHBoxLayout(self.progreso)
+        self.lbl_etapa = QLabel()
+        self.barra_progreso = QProgressBar()
+        self.barra_progreso.setRange(0, 100)
+        self.boton_cancelar = QPushButton("Cancelar")
+        self.boton_cancelar.clicked.connect(self.cancelar)
+        layout.addWidget(self.lbl_etapa)
+        layout.addWidget(self.barra_progreso)
+        layout.addWidget(self.boton_cancelar)
+        self.agregar_widget(self.progreso)
+
+    # Tarea en segundo plano
+    def ejecutar(self, tarea):
+        """
+        Conecta la página a una TareaGeneracion y la inicia. Las vistas se
+        completan a medida que la tarea emite cada etapa.
+        """
+        self.tarea = tarea
+        tarea.setParent(self)
+        self.lbl_semilla.setText(
+            f"Generador: {DESCRIPCIONES.get(tarea.generador, tarea.generador)}"
+            f" · Semilla: {tarea.semilla.entropy} · Serie en {tarea.tipo}")
+        tarea.etapa.connect(self.lbl_etapa.setText)
+        tarea.progreso.connect(self.barra_progreso.setValue)
+        tarea.parcial.connect(self.cargar_parcial)
+        tarea.datos_listos.connect(self.cargar_datos)
+        tarea.resumen_listo.connect(self.cargar_resumen)
+        tarea.analisis_listo.connect(self.cargar_analisis)
+        tarea.pruebas_listas.connect(self.cargar_pruebas)
+        tarea.fallo.connect(self._mostrar_error)
+        tarea.finished.connect(self._tarea_terminada)
+        tarea.start()
+
+    def cancelar(self):
+        """Cancela la tarea en curso y vuelve a la página anterior."""
+        self._detener_tarea()
+        self.volver()
+
+    def volver(self):
+        self._detener_tarea()
+        super().volver()
+
+    def _detener_tarea(self):
+        if self.tarea is not None and self.tarea.isRunning():
+            self.tarea.cancelar()
+            self.tarea.wait()
+        if self._exportacion is not None:
+            self._exportacion.wait()
+
+    def liberar(self):
+        """
+        Suelta la serie, el análisis, la figura y las vistas antes de
+        descartar la página, sin esperar al recolector de basura.
+        """
+        self._detener_tarea()
+        if self.tarea is not None:
+            self.tarea.datos = None
+        self.tarea = self._exportacion = None
+        if self._grafico is not None:
+            self._grafico.liberar()
+            self._grafico = None
+        for layout in self._layouts:
+            while layout.count():
+                item = layout.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+        self._construidas.clear()
+        self.tabla_pruebas = self.tabla_resumen = None
+        self.datos = self.analisis = self._parcial = None
+        self.pruebas = self.resumen = None
+
+    def memoria(self):
+        """Bytes de la serie que retiene la página (0 si es un memmap)."""
+        if self.datos is None or isinstance(self.datos, np.memmap):
+            return 0
+        return self.datos.nbytes
+
+    def _tarea_terminada(self):
+        if self.tarea is not None and not self.tarea.fue_cancelada():
+            self.progreso.hide()
+
+    def _mostrar_error(self, mensaje):
+        self.lbl_etapa.setText(f"Error: {mensaje}")
+        self.boton_cancelar.hide()
+
+    def cargar_datos(self, datos):
+        self.datos = datos
+        self._construir_vista(self._vista_actual)
+
+    def cargar_resumen(self, resumen):
+        self.resumen = resumen
+        if self.tabla_resumen is not None:
+            self._actualizar_resumen()
+
+    def cargar_parcial(self, parcial):
+        """Histograma de lo generado hasta ahora (bordes, fo)."""
+        self._parcial = parcial
+        if self._grafico is not None:
+            self._grafico.actualizar(*parcial)
+        elif self._vista_actual == self.VISTA_HISTOGRAMA:
+            self._construir_vista(self.VISTA_HISTOGRAMA)
+
+    def cargar_analisis(self, analisis):
+        self.analisis = analisis
+        if self._grafico is not None:
+            self._grafico.actualizar(analisis.bordes, analisis.fo)
+            self._superponer_teorica()
+        self._construir_vista(self._vista_actual)
+
+    def cargar_pruebas(self, pruebas):
+        self.pruebas = pruebas
+        if self.tabla_pruebas is not None:
+            self._actualizar_pruebas()
+
+    # Construcción diferida de vistas
+    def _vista_lista(self, indice):
+        if indice == self.VISTA_SERIE:
+            return self.datos is not None
+        if indice == self.VISTA_HISTOGRAMA:
+            return self.analisis is not None or self._parcial is not None
+        return self.analisis is not None
+
+    def _construir_vista(self, indice):
+        """
+        Construye la vista indicada si todavía no se construyó y ya llegaron
+        sus datos. Registra en self.tiempos cuánto tardó y, para la primera
+        vista, la latencia desde que se creó la página.
+        """
+        if indice in self._construidas or not self._vista_lista(indice):
+            return
+        t0 = perf_counter()
+        if indice == self.VISTA_TABLA:
+            widget = self._vista_tabla()
+        elif indice == self.VISTA_HISTOGRAMA:
+            widget = self._widget_histograma()
+        else:
+            widget = self._widget_serie()
+        self._reemplazar_contenido(self._layouts[indice], widget)
+        self._construidas.add(indice)
+
+        fin = perf_counter()
+        nombre = ("tabla", "histograma", "serie")[indice]
+        self.tiempos[nombre] = fin - t0
+        if len(self._construidas) == 1:
+            self.tiempos["apertura"] = fin - self._inicio
+
+    def _vista_tabla(self):
         contenedor = QWidget()
         layout = QVBoxLayout(contenedor)
-        # Generar datos de tabla
-        datos_interv = frecuencias_observadas(self.datos, self.intervalos)
-        # extraer sólo límites para FE
-        limites = [(li, ls) for (li, ls, fo) in datos_interv]
+
+        # Resumen de la serie junto a los valores teóricos
+        parametros = ", ".join(
+            f"{nombre} = {valor:g}" for nombre, valor in
+            obtener(self.distribucion).como_dict(self.params).items())
+        layout.addWidget(QLabel(f"Resumen de la serie ({parametros}):"))
+        self.tabla_resumen = QTableWidget(0, 3)
+        self.tabla_resumen.setHorizontalHeaderLabels(
+            ["Estadístico", "Serie", "Teórico"])
+        self.tabla_resumen.horizontalHeader().setSectionResizeMode(
+            QHeaderView.Stretch)
+        layout.addWidget(self.tabla_resumen)
+        self._actualizar_resumen()
+
+        layout.addWidget(self._widget_tabla())
+
+        # Crear Tabla de chi2
+        layout.addLayout(self._crear_seccion_chi2())
+
+        # K-S y Anderson-Darling, que no dependen de los intervalos
+        layout.addWidget(QLabel("Otras pruebas (sin agrupar en intervalos):"))
+        self.tabla_pruebas = QTableWidget(0, 5)
+        self.tabla_pruebas.setHorizontalHeaderLabels(
+            ["Prueba", "Estadístico", "Valor Crítico", "p-valor", "Resultado"]
+        )
+        self.tabla_pruebas.horizontalHeader().setSectionResizeMode(
+            QHeaderView.Stretch)
+        layout.addWidget(self.tabla_pruebas)
+        self._actualizar_pruebas()
+        return contenedor
+
+    # (etiqueta, clave) de cada fila del resumen, antes de los cuantiles
+    FILAS_RESUMEN = [
+        ("Media", "media"),
+        ("Desviación estándar", "desviacion"),
+        ("Varianza", "varianza"),
+        ("Asimetría", "asimetria"),
+        ("Curtosis (exceso)", "curtosis"),
+        ("Mínimo", "minimo"),
+        ("Máximo", "maximo"),
+    ]
+
+    def _actualizar_resumen(self):
+        """
+        Completa la tabla de momentos y cuantiles de la serie (calculados
+        mientras se generaba; los cuantiles son aproximados) con los
+        valores teóricos de la distribución al lado.
+        """
+        tabla = self.tabla_resumen
+        if self.resumen is None:
+            tabla.setRowCount(1)
+            tabla.setItem(0, 0, QTableWidgetItem("Calculando..."))
+            return
+        teorico = resumen_teorico(self.distribucion, self.params)
+        filas = [(etiqueta, self.resumen[clave], teorico.get(clave))
+                 for etiqueta, clave in self.FILAS_RESUMEN]
+        filas += [(f"Percentil {float(p) * 100:g} (aprox.)", valor,
+                   teorico["cuantiles"][p])
+                  for p, valor in self.resumen["cuantiles"].items()]
+
+        tabla.setRowCount(len(filas))
+        for fila, (etiqueta, serie, teo) in enumerate(filas):
+            valores = [etiqueta, f"{serie:.6f}",
+                       "-" if teo is None else f"{teo:.6f}"]
+            for col, txt in enumerate(valores):
+                item = QTableWidgetItem(txt)
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                tabla.setItem(fila, col, item)
+
+    def _widget_tabla(self):
+        clases = self.analisis.clases
 
         # Crear tabla con 5 columnas
-        tabla = QTableWidget(len(datos_interv), 5)
+        tabla = QTableWidget(len(clases), 5)
         tabla.setHorizontalHeaderLabels(
             ["Intervalo N°", "Límite Inf.", "Límite Sup.", "FO", "FE"]
         )
         tabla.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
-        # Calcular FE según distribución
-        total = len(self.datos)
-        if self.distribucion == "Uniforme":
-            params = (self.param_A, self.param_B)
-        elif self.distribucion == "Exponencial Negativa":
-            params = (self.param_lmd,)
-        else:  # "Normal"
-            params = (self.param_media, self.param_desv)
-        fe_list = frecuencias_esperadas(
-            limites, total, self.distribucion, params)
-
         # Poblar Tabla
-        for i, (li, ls, fo) in enumerate(datos_interv):
+        for i, c in enumerate(clases):
             valores = [
                 i + 1,
-                f"{li:.4f}",
-                f"{ls:.4f}",
-                fo,
-                f"{fe_list[i]:.4f}",
+                f"{c['li']:.4f}",
+                f"{c['ls']:.4f}",
+                c['fo'],
+                f"{c['fe']:.4f}",
             ]
             for j, v in enumerate(valores):
                 item = QTableWidgetItem(str(v))
                 item.setFlags(item.flags() & ~Qt.ItemIsEditable)
                 tabla.setItem(i, j, item)
-        layout.addWidget(tabla)
-
-        # Crear Tabla de chi2
-        layout.addLayout(self._crear_seccion_chi2())
-
-        return contenedor
+        return tabla
 
     def actualizar_critico(self):
         """
@@ -115,10 +356,17 @@ class PaginaResultados(PaginaBase):
         seleccionado en el QComboBox de alpha.
         """
         alpha = float(self.alpha_combo.currentText())
-        k = len(self._agrupadas_chi2)
-        p_crit = chi2_critico(k, alpha)
+        grad_lib = self.analisis.grados_libertad
+        motivo = self.analisis.motivo_sin_decision
+        if motivo is not None:
+            self.lbl_critico.setText(f"χ² Tabla (Grad Lib={grad_lib}): -")
+            self.lbl_resultado.setText(f"No se decide: {motivo}.")
+            if self.tabla_pruebas is not None:
+                self._actualizar_pruebas()
+            return None
+        p_crit = chi2_critico_gl(grad_lib, alpha)
         self.lbl_critico.setText(
-            f"χ² Tabla (Grad Lib={k - 1}, Alpha={alpha}): {p_crit:.4f}")
+            f"χ² Tabla (Grad Lib={grad_lib}, Alpha={alpha}): {p_crit:.4f}")
 
         if self._chi2_calculado > p_crit:
             self.lbl_resultado.setText("Se rechaza la H0.")
@@ -126,33 +374,43 @@ class PaginaResultados(PaginaBase):
             self.lbl_resultado.setText(
                 "No se tiene suficiente evidencia para rechazar H0.")
 
+        if self.tabla_pruebas is not None:
+            self._actualizar_pruebas()
         return p_crit
 
-    def agrupar_intervalos_chi2(self, clases):
+    def _actualizar_pruebas(self):
         """
-        Agrupa los intervalos de la tabla de χ² hasta que cada grupo
-        tenga FE >= 5. Devuelve la lista de grupos agrupados.
+        Completa la tabla de K-S y Anderson-Darling con el alpha elegido.
+        Si K-S se aproximó por bloques, el estadístico indica su error máximo;
+        una prueba omitida (A-D sin la serie ordenada) muestra el motivo.
         """
-        agrupadas = []
-        current = clases[0].copy()
-        for c in clases[1:]:
-            if current['fe'] < 5:
-                current['ls'] = c['ls']
-                current['fo'] += c['fo']
-                current['fe'] += c['fe']
+        tabla = self.tabla_pruebas
+        if self.pruebas is None:
+            tabla.setRowCount(1)
+            tabla.setItem(0, 0, QTableWidgetItem("Calculando..."))
+            return
+        alpha = float(self.alpha_combo.currentText())
+        tabla.setRowCount(len(self.pruebas))
+        for fila, prueba in enumerate(self.pruebas):
+            if "omitida" in prueba:
+                valores = [prueba["prueba"], "-", "-", "-",
+                           f"Omitida: {prueba['omitida']}"]
             else:
-                agrupadas.append(current)
-                current = c.copy()
-
-        if current['fe'] < 5 and agrupadas:
-            prev = agrupadas[-1]
-            prev['ls'] = current['ls']
-            prev['fo'] += current['fo']
-            prev['fe'] += current['fe']
-        else:
-            agrupadas.append(current)
-
-        return agrupadas
+                estadistico = f"{prueba['estadistico']:.6f}"
+                if prueba.get("aproximado"):
+                    estadistico += f" (± {prueba['error_maximo']:.1e})"
+                valores = [
+                    prueba["prueba"],
+                    estadistico,
+                    f"{valor_critico(prueba, alpha):.6f}",
+                    f"{prueba['p_valor']:.4f}",
+                    "Se rechaza la H0" if rechaza(prueba, alpha)
+                    else "No se rechaza la H0",
+                ]
+            for col, txt in enumerate(valores):
+                item = QTableWidgetItem(txt)
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                tabla.setItem(fila, col, item)
 
     def _get_tabla_chi2(self, agrupadas):
         """
@@ -174,12 +432,13 @@ class PaginaResultados(PaginaBase):
         )
         tabla.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
-        chi2_acum = 0.0
+        chi2_grupos = self.analisis.chi2_grupos
+        chi2_acumulado = np.cumsum(chi2_grupos)
         for k, grp in enumerate(agrupadas):
             fo_k = grp['fo']
             fe_k = grp['fe']
-            chi2_val = (fo_k - fe_k) ** 2 / fe_k
-            chi2_acum += chi2_val
+            chi2_val = chi2_grupos[k]
+            chi2_acum = chi2_acumulado[k]
 
             datos_fila = [
                 f"{grp['li']:.4f}",
@@ -193,28 +452,27 @@ class PaginaResultados(PaginaBase):
                 item = QTableWidgetItem(txt)
                 item.setFlags(item.flags() & ~Qt.ItemIsEditable)
                 tabla.setItem(k, col, item)
-        self._chi2_calculado = chi2_acum
+        self._chi2_calculado = self.analisis.chi2
         self.lbl_calculado.setText(f"χ² calculado: {self._chi2_calculado:.4f}")
 
         return tabla
 
     def _crear_seccion_chi2(self):
-        if self.distribucion == "Uniforme":
-            params = (self.param_A, self.param_B)
-        elif self.distribucion == "Exponencial Negativa":
-            params = (self.param_lmd,)
-        else:
-            params = (self.param_media, self.param_desv)
-
-        clases = calcular_clases_chi2(
-            self.datos, self.intervalos, self.distribucion, params)
-        agrupadas = self.agrupar_intervalos_chi2(clases)
-
-        # Gaurdar valores en contexto
-        self._agrupadas_chi2 = agrupadas
+        agrupadas = self.analisis.agrupadas
 
         # Widget contenedor
         layout = QVBoxLayout()
+        a = self.analisis
+        layout.addWidget(QLabel(
+            f"Intervalos: {ESTRATEGIAS[a.estrategia]} ({a.intervalos} "
+            f"intervalos, {len(agrupadas)} tras agrupar FE < 5)"))
+        if a.fuera:
+            lbl_fuera = QLabel(
+                f"{a.fuera} valores quedaron fuera de los bordes y no se "
+                f"cuentan; FE se calcula sobre los {a.total - a.fuera} de "
+                f"adentro.")
+            lbl_fuera.setWordWrap(True)
+            layout.addWidget(lbl_fuera)
 
         # Seleccion de alpha
         layout.addWidget(QLabel("Nivel de significancia Alpha:"))
@@ -243,83 +501,106 @@ class PaginaResultados(PaginaBase):
         return layout
 
     def _widget_histograma(self):
-        _, bins = obtener_histograma(self.datos, self.intervalos)
-        fig = Figure(figsize=(6, 6))
-        ax = fig.add_subplot(111)
-
-        # Dibujar histograma
-        ax.hist(
-            self.datos,
-            bins=bins,
-            edgecolor='white',
-            linewidth=1.2,
-            color='#5c7cfa',
-            alpha=0.9
-        )
+        # matplotlib se importa recién cuando se muestra el histograma
+        from .GraficoHistograma import GraficoHistograma
+
+        contenedor = QWidget()
+        layout = QVBoxLayout(contenedor)
+        self.check_teorica = QCheckBox("Mostrar FE y densidad teórica")
+        self.check_teorica.setChecked(True)
+        self.check_teorica.toggled.connect(self._mostrar_teorica)
+        layout.addWidget(self.check_teorica)
+
+        # Se dibujan las FO ya calculadas (o las parciales mientras se
+        # genera), sin volver a agrupar los datos
+        self._grafico = GraficoHistograma(
+            f"Histograma de la Distribución {self.distribucion}")
+        if self.analisis is not None:
+            self._grafico.actualizar(self.analisis.bordes, self.analisis.fo)
+            self._superponer_teorica()
+        else:
+            self._grafico.actualizar(*self._parcial)
+        layout.addWidget(self._grafico)
+        return contenedor
 
-        # Mostrar los límites de los intervalos en el eje X
-        etiquetas = [f"{b:.2f}" for b in bins]
-        ax.set_xticks(bins)
-        ax.set_xticklabels(etiquetas, rotation=45, ha='right', fontsize=9)
-
-        # Detalles
-        ax.set_title(f"Histograma de la Distribución {
-                     self.distribucion}", fontweight='bold')
-        ax.set_xlabel("Intervalos", fontsize=12)
-        ax.set_ylabel("Frecuencia Observada", fontsize=12)
-        ax.tick_params(axis='both')
-        ax.grid(True, linestyle='--', linewidth=0.5, alpha=0.5)
-        fig.subplots_adjust(bottom=0.25)
-        return FigureCanvas(fig)
+    def _superponer_teorica(self):
+        """FE por intervalo y densidad teórica (en cache por distribución,
+        parámetros y bordes) sobre el histograma del análisis."""
+        a = self.analisis
+        x, densidad = curva_densidad(
+            a.distribucion, a.params, tuple(a.bordes.tolist()))
+        self._grafico.superponer(a.bordes, a.fe, x, densidad, a.total,
+                                 self.check_teorica.isChecked())
+
+    def _mostrar_teorica(self, visible):
+        if self._grafico is not None:
+            self._grafico.mostrar_superposicion(visible)
 
     def _widget_serie(self):
-        self.texto = QPlainTextEdit(readOnly=True)
-        self.pagina, items_por_pagina = 0, 10000
-        self.max_pag = (len(self.datos)-1) // items_por_pagina
-        self._mostrar_pagina(items_por_pagina)
-        return self.texto
+        return VisorSerie(self.datos)
 
     def _crear_controles_serie(self):
         self.nav = QWidget()
         layout = QHBoxLayout(self.nav)
-        for txt, cb in [("←", self._ant), ("Exportar", self._exp), ("→", self._sig)]:
-            btn = QPushButton(txt)
-            btn.clicked.connect(cb)
-            layout.addWidget(btn)
+        self.lbl_exportacion = QLabel()
+        self.formato_combo = QComboBox()
+        self.formato_combo.addItems(formatos_disponibles())
+        self.boton_exportar = QPushButton("Exportar")
+        self.boton_exportar.clicked.connect(self._exp)
+        layout.addWidget(self.lbl_exportacion)
+        layout.addStretch()
+        layout.addWidget(self.formato_combo)
+        layout.addWidget(self.boton_exportar)
         self.nav.hide()
         self.contenedor.addWidget(self.nav)
 
-    def _mostrar_pagina(self, items_por_pagina):
-        inicio = self.pagina * items_por_pagina
-        fin = min(len(self.datos), inicio + items_por_pagina)
-        txt = ', '.join(f"{x:.4f}" for x in self.datos[inicio:fin])
-        self.texto.setPlainText(
-            f"[{inicio+1}-{fin}] de {len(self.datos)}:\n{txt}")
-
-    def _ant(self):
-        if self.pagina > 0:
-            self.pagina -= 1
-            self._mostrar_pagina(10000)
-
-    def _sig(self):
-        if self.pagina < self.max_pag:
-            self.pagina += 1
-            self._mostrar_pagina(10000)
+    def _metadatos(self):
+        return {
+            "distribucion": self.distribucion,
+            "parametros": obtener(self.distribucion).como_dict(self.params),
+            "intervalos": self.intervalos,
+            "semilla": self.tarea.semilla.entropy if self.tarea else None,
+            "generador": self.tarea.generador if self.tarea else None,
+            "fecha": f"{datetime.now():%Y-%m-%d %H:%M:%S}",
+        }
 
     def _exp(self):
-        fn = f"serie_{datetime.now():%Y%m%d_%H%M%S}.txt"
-        with open(fn, "w") as f:
-            f.write(', '.join(f"{x:.4f}" for x in self.datos))
+        """Exporta la serie en el formato elegido, en segundo plano."""
+        if self.datos is None:
+            return
+        formato = self.formato_combo.currentText()
+        fn = f"serie_{datetime.now():%Y%m%d_%H%M%S}.{formato}"
+
+        self.boton_exportar.setEnabled(False)
+        self.lbl_exportacion.setText(f"Exportando {fn}...")
+        self._exportacion = TareaExportacion(
+            fn, self.datos, formato, self._metadatos(), parent=self)
+        self._exportacion.terminada.connect(self._exportacion_terminada)
+        self._exportacion.fallo.connect(self._exportacion_fallida)
+        self._exportacion.start()
+
+    def _exportacion_terminada(self, ruta):
+        self.boton_exportar.setEnabled(True)
+        self.lbl_exportacion.setText(f"Exportado: {ruta}")
+
+    def _exportacion_fallida(self, mensaje):
+        self.boton_exportar.setEnabled(True)
+        self.lbl_exportacion.setText(f"Error al exportar: {mensaje}")
 
     # Vistas
+    def _mostrar_vista(self, indice):
+        self._vista_actual = indice
+        self._construir_vista(indice)
+        self.stack.setCurrentIndex(indice)
+
     def mostrar_tabla(self):
-        self.stack.setCurrentIndex(0)
+        self._mostrar_vista(self.VISTA_TABLA)
         self.nav.hide()
 
     def mostrar_histograma(self):
-        self.stack.setCurrentIndex(1)
+        self._mostrar_vista(self.VISTA_HISTOGRAMA)
         self.nav.hide()
 
     def mostrar_serie(self):
-        self.stack.setCurrentIndex(2)
+        self._mostrar_vista(self.VISTA_SERIE)
         self.nav.show()
@@ -0,0 +1,48 @@
+import multiprocessing
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.barrido import barrido, fila_resumen
+
+
+class TareaBarrido(QThread):
+    """
+    Corre un barrido de parámetros (core.barrido) fuera del hilo de la
+    interfaz. Por cada celda emite celda_lista con (indice, fila_resumen);
+    las que ya estaban en la caché llegan primero. La cancelación se revisa
+    entre celdas: las que no empezaron se descartan y las que están
+    corriendo terminan en segundo plano, sin que el hilo las espere.
+    """
+    celda_lista = pyqtSignal(object)
+    progreso = pyqtSignal(int)
+    fallo = pyqtSignal(str)
+
+    def __init__(self, celdas, cache, trabajadores=None, parent=None):
+        super().__init__(parent)
+        self.celdas = celdas
+        self.cache = cache
+        self.trabajadores = trabajadores
+        self._cancelada = False
+
+    def cancelar(self):
+        self._cancelada = True
+
+    def fue_cancelada(self):
+        return self._cancelada
+
+    def run(self):
+        # Los procesos se crean con spawn: hacer fork desde un hilo de Qt
+        # no es seguro
+        resultados = barrido(self.celdas, self.trabajadores, self.cache,
+                             multiprocessing.get_context("spawn"))
+        try:
+            for hechas, (i, resultado, de_cache) in enumerate(resultados, 1):
+                if self._cancelada:
+                    break
+                self.celda_lista.emit(
+                    (i, fila_resumen(self.celdas[i], resultado, de_cache)))
+                self.progreso.emit(hechas * 100 // len(self.celdas))
+        except Exception as e:
+            self.fallo.emit(str(e))
+        finally:
+            resultados.close()
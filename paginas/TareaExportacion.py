@@ -0,0 +1,25 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.exportar import exportar
+
+
+class TareaExportacion(QThread):
+    """Exporta la serie (y su .json de metadatos) fuera del hilo de la
+    interfaz."""
+    terminada = pyqtSignal(str)
+    fallo = pyqtSignal(str)
+
+    def __init__(self, ruta, datos, formato, metadatos, parent=None):
+        super().__init__(parent)
+        self.ruta = ruta
+        self.datos = datos
+        self.formato = formato
+        self.metadatos = metadatos
+
+    def run(self):
+        try:
+            exportar(self.ruta, self.datos, self.formato, self.metadatos)
+        except Exception as e:
+            self.fallo.emit(str(e))
+        else:
+            self.terminada.emit(str(self.ruta))
@@ -0,0 +1,193 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from time import perf_counter
+import numpy as np
+
+from core.analisis import Analisis
+from core.aleatorios import GENERADOR_POR_DEFECTO
+from core.estadisticas import ResumenSerie
+from core.intervalos import ESTRATEGIA_POR_DEFECTO
+from core.generadores import (
+    TAM_BLOQUE, TIPO_POR_DEFECTO, HistogramaAcumulado, generar_por_bloques,
+    semilla_raiz, tipo_datos)
+from core.pruebas import KSPorBloques, pruebas_ordenadas
+
+
+class TareaGeneracion(QThread):
+    """
+    Genera la serie y calcula sus estadisticas fuera del hilo de la interfaz.
+    Cada etapa se emite apenas termina para que la pagina se vaya llenando:
+        datos_listos -> resumen_listo -> analisis_listo -> pruebas_listas
+    Mientras se genera, parcial emite (bordes, fo) del histograma de lo
+    generado hasta el momento, para mostrarlo mientras crece. El resumen
+    (momentos y cuantiles) se acumula bloque a bloque durante la generación.
+    La cancelacion se revisa entre bloques y entre etapas.
+    La serie se guarda en un arreglo del tipo indicado ("float64" o
+    "float32"). Los intervalos de χ² siguen la estrategia de
+    core.intervalos (bordes: los del usuario, para "fijos"). Si se pasan
+    datos (por ejemplo, una serie cargada como memmap) no se genera nada y
+    solo se analizan.
+    """
+    etapa = pyqtSignal(str)
+    progreso = pyqtSignal(int)
+    parcial = pyqtSignal(object)
+    datos_listos = pyqtSignal(object)
+    resumen_listo = pyqtSignal(object)
+    analisis_listo = pyqtSignal(object)
+    pruebas_listas = pyqtSignal(object)
+    fallo = pyqtSignal(str)
+
+    # Segundos mínimos entre dos emisiones de parcial
+    INTERVALO_PARCIAL = 0.1
+    # Hasta esta cantidad se ordena una copia en float64 de la serie (40 MB
+    # como máximo), que sirve para contar FO y para K-S y Anderson-Darling.
+    # Con más, o si la serie es un memmap o está en float32, no se copia: FO
+    # se cuenta por bloques y K-S se aproxima, recorriéndola por bloques
+    LIMITE_ORDENAR = 5_000_000
+
+    def __init__(self, distribucion, cantidad, intervalos, params,
+                 semilla=None, generador=GENERADOR_POR_DEFECTO, datos=None,
+                 tipo=TIPO_POR_DEFECTO, estrategia=ESTRATEGIA_POR_DEFECTO,
+                 bordes=None, parent=None):
+        super().__init__(parent)
+        self.distribucion = distribucion
+        self.cantidad = cantidad
+        self.intervalos = intervalos
+        self.params = params
+        # Se fija la semilla al crear la tarea para poder registrarla
+        self.semilla = semilla_raiz(semilla)
+        self.generador = generador
+        self.datos = datos
+        self.tipo = str(datos.dtype) if datos is not None else tipo
+        self.estrategia = estrategia
+        self.bordes = bordes
+        self._cancelada = False
+
+    def cancelar(self):
+        self._cancelada = True
+
+    def fue_cancelada(self):
+        return self._cancelada
+
+    def run(self):
+        try:
+            self._ejecutar()
+        except Exception as e:
+            self.fallo.emit(str(e))
+
+    def _ejecutar(self):
+        resumen = ResumenSerie()
+        if self.datos is not None:
+            datos = self.datos
+            for inicio in range(0, len(datos), TAM_BLOQUE):
+                if self._cancelada:
+                    return
+                resumen.agregar(datos[inicio:inicio + TAM_BLOQUE])
+        else:
+            datos = self._generar(resumen)
+        if datos is None:
+            return
+        self.datos_listos.emit(datos)
+        self.resumen_listo.emit(resumen.resultado())
+
+        if self._cancelada:
+            return
+        self.etapa.emit("Calculando frecuencias y χ²...")
+        ordenados = self._copia_ordenada(datos)
+        self.analisis_listo.emit(self._analizar(datos, ordenados, resumen))
+
+        if self._cancelada:
+            return
+        self.etapa.emit("Calculando K-S y Anderson-Darling...")
+        self.pruebas_listas.emit(self._pruebas(datos, ordenados))
+        self.etapa.emit("")
+
+    def _motivo_por_bloques(self, datos):
+        """
+        Por qué conviene recorrer la serie por bloques en lugar de ordenar
+        una copia (None si se puede ordenar): una serie cargada como memmap
+        no se lee entera y una en float32 no se duplica en float64.
+        """
+        if isinstance(datos, np.memmap):
+            return "la serie se lee del disco por bloques"
+        if datos.dtype == np.float32:
+            return "la serie está en float32 y no se copia a float64"
+        if len(datos) > self.LIMITE_ORDENAR:
+            return f"la serie tiene más de {self.LIMITE_ORDENAR:,} valores"
+        return None
+
+    def _copia_ordenada(self, datos):
+        """Copia ordenada en float64 de la serie, o None si se recorre por
+        bloques (ver _motivo_por_bloques)."""
+        if self._motivo_por_bloques(datos) is not None:
+            return None
+        return np.sort(np.asarray(datos, dtype=np.float64))
+
+    def _analizar(self, datos, ordenados, resumen):
+        if ordenados is not None:
+            return Analisis.desde_datos(
+                ordenados, self.intervalos, self.distribucion, self.params,
+                self.estrategia, self.bordes, ordenados=True)
+        # Sin copia ordenada, el rango intercuartil sale del bosquejo
+        q1, q3 = resumen.bosquejo.cuantiles([0.25, 0.75])
+        return Analisis.desde_datos(
+            datos, self.intervalos, self.distribucion, self.params,
+            self.estrategia, self.bordes, ric=float(q3 - q1))
+
+    def _pruebas(self, datos, ordenados):
+        if ordenados is not None:
+            return pruebas_ordenadas(ordenados, self.distribucion,
+                                     self.params, ordenados=True)
+        ks = KSPorBloques(self.distribucion, self.params)
+        for inicio in range(0, len(datos), TAM_BLOQUE):
+            ks.agregar(datos[inicio:inicio + TAM_BLOQUE])
+        # Anderson-Darling necesita la serie ordenada: se informa que se
+        # omitió y por qué
+        omitida = {"prueba": "Anderson-Darling",
+                   "omitida": self._motivo_por_bloques(datos)}
+        return [ks.resultado(), omitida]
+
+    def _generar(self, resumen):
+        """Genera la serie por bloques, agregando cada uno al resumen;
+        devuelve None si se canceló."""
+        self.etapa.emit("Generando valores...")
+        datos = np.empty(self.cantidad, dtype=tipo_datos(self.tipo))
+        hechos = 0
+        hist, ultimo = None, perf_counter()
+        for bloque in generar_por_bloques(
+                self.distribucion, self.cantidad, self.params, self.semilla,
+                generador=self.generador):
+            if self._cancelada:
+                return None
+            # Desde acá se usa lo guardado (en float32 puede diferir del
+            # bloque) para que resumen e histograma describan la serie
+            guardado = datos[hechos:hechos + len(bloque)]
+            guardado[:] = bloque
+            hechos += len(bloque)
+            resumen.agregar(guardado)
+            self.progreso.emit(hechos * 100 // self.cantidad)
+
+            hist = self._histograma_parcial(hist, datos[:hechos], guardado)
+            if (hechos == self.cantidad
+                    or perf_counter() - ultimo >= self.INTERVALO_PARCIAL):
+                self.parcial.emit((hist.bordes, hist.fo.copy()))
+                ultimo = perf_counter()
+        return datos
+
+    def _histograma_parcial(self, hist, generados, bloque):
+        """
+        Histograma de lo generado hasta ahora con intervalos de igual ancho
+        entre su mínimo y su máximo (al terminar coincide con el del
+        análisis). Solo se vuelve a agrupar todo cuando el bloque amplía el
+        rango; si no, se suma el bloque.
+        """
+        minim, maxim = float(bloque.min()), float(bloque.max())
+        if hist is None or minim < hist.bordes[0] or maxim > hist.bordes[-1]:
+            if hist is not None:
+                minim = min(minim, hist.bordes[0])
+                maxim = max(maxim, hist.bordes[-1])
+            hist = HistogramaAcumulado.equidistante(
+                minim, maxim, self.intervalos)
+            hist.agregar(generados)
+        else:
+            hist.agregar(bloque)
+        return hist
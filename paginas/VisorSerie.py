@@ -0,0 +1,96 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSpinBox,
+    QTableView, QHeaderView, QAbstractItemView
+)
+
+
+class ModeloSerie(QAbstractTableModel):
+    """
+    Modelo de solo lectura sobre el arreglo de la serie, con COLUMNAS
+    valores por fila. No copia ni formatea los datos de antemano: la vista
+    pide únicamente las celdas visibles.
+    """
+    COLUMNAS = 10
+
+    def __init__(self, datos, parent=None):
+        super().__init__(parent)
+        self._datos = datos
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return -(-len(self._datos) // self.COLUMNAS)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.COLUMNAS
+
+    def posicion(self, index):
+        """Posición en la serie (desde 0) de una celda del modelo."""
+        return index.row() * self.COLUMNAS + index.column()
+
+    def indice(self, posicion):
+        """Celda del modelo que muestra la posición (desde 0) de la serie."""
+        fila, columna = divmod(posicion, self.COLUMNAS)
+        return self.index(fila, columna)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        pos = self.posicion(index)
+        if pos >= len(self._datos):
+            return None
+        if role == Qt.DisplayRole:
+            return f"{self._datos[pos]:.4f}"
+        if role == Qt.ToolTipRole:
+            return f"Valor N° {pos + 1}"
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return f"+{section}"
+        return str(section * self.COLUMNAS + 1)
+
+
+class VisorSerie(QWidget):
+    """Tabla virtualizada de la serie con salto directo a una posición."""
+
+    def __init__(self, datos, parent=None):
+        super().__init__(parent)
+        self.modelo = ModeloSerie(datos, self)
+
+        self.tabla = QTableView()
+        self.tabla.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Alto de fila fijo (antes de asignar el modelo): la vista no mide
+        # filas fuera de pantalla
+        vertical = self.tabla.verticalHeader()
+        vertical.setSectionResizeMode(QHeaderView.Fixed)
+        vertical.setDefaultSectionSize(24)
+        self.tabla.setModel(self.modelo)
+
+        self.spin_indice = QSpinBox()
+        self.spin_indice.setRange(1, max(1, len(datos)))
+        boton_ir = QPushButton("Ir")
+        boton_ir.clicked.connect(self.ir_a_indice)
+        self.spin_indice.editingFinished.connect(self.ir_a_indice)
+
+        controles = QHBoxLayout()
+        controles.addWidget(QLabel(f"{len(datos)} valores. Ir al valor N°:"))
+        controles.addWidget(self.spin_indice)
+        controles.addWidget(boton_ir)
+        controles.addStretch()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(controles)
+        layout.addWidget(self.tabla)
+
+    def ir_a_indice(self):
+        """Desplaza la tabla hasta el valor indicado (numerado desde 1)."""
+        indice = self.modelo.indice(self.spin_indice.value() - 1)
+        self.tabla.scrollTo(indice, QAbstractItemView.PositionAtTop)
+        self.tabla.setCurrentIndex(indice)
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from core.aleatorios import GENERADORES, GeneradorLCG, crear_generador
+
+
+def test_lcg_igual_a_la_recurrencia():
+    generador = GeneradorLCG(7)
+    x = generador.estado
+    esperado = []
+    for _ in range(GeneradorLCG.TRAMO + 10):
+        x = (GeneradorLCG.A * x + GeneradorLCG.C) % GeneradorLCG.M
+        esperado.append(x / GeneradorLCG.M)
+
+    # En dos llamados, cruzando el borde de un tramo
+    obtenido = np.concatenate([generador.random(100),
+                               generador.random(GeneradorLCG.TRAMO - 90)])
+    assert obtenido.tolist() == esperado
+
+
+@pytest.mark.parametrize("clave", list(GENERADORES))
+def test_misma_semilla_misma_serie(clave):
+    a = crear_generador(42, clave).random(1000)
+    b = crear_generador(42, clave).random(1000)
+    assert np.array_equal(a, b)
+    assert a.dtype == np.float64
+    assert np.all((a >= 0) & (a < 1))
+
+
+def test_pcg64_igual_a_default_rng():
+    assert np.array_equal(crear_generador(3).random(10),
+                          np.random.default_rng(3).random(10))
+
+
+def test_generador_desconocido():
+    with pytest.raises(ValueError):
+        crear_generador(0, "otro")
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from core.generadores import darDistExp, generar_por_bloques, tipo_datos
+from core.paralelo import generar_paralelo
+
+
+def test_tipo_datos():
+    assert tipo_datos("float32") == np.float32
+    assert tipo_datos() == np.float64
+    with pytest.raises(ValueError):
+        tipo_datos("float16")
+
+
+def test_generar_paralelo_float32():
+    doble = generar_paralelo("Normal", 250_000, (0.0, 1.0), 4, 1)
+    simple = generar_paralelo("Normal", 250_000, (0.0, 1.0), 4, 1,
+                              tipo="float32")
+    assert doble.dtype == np.float64
+    assert simple.dtype == np.float32
+    assert np.array_equal(simple, doble.astype(np.float32))
+
+
+def test_transformar_arreglo_en_el_lugar():
+    nums = np.random.default_rng(0).random(100).astype(np.float32)
+    resultado = darDistExp(nums, 2.0)
+    assert resultado is nums
+    assert resultado.dtype == np.float32
+
+    lista = [0.1, 0.5, 0.9]
+    assert isinstance(darDistExp(lista, 2.0), list)
+    assert all(isinstance(x, float) for x in lista)
+
+
+def test_tarea_generacion_guarda_float32():
+    QtCore = pytest.importorskip("PyQt5.QtCore")
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    from paginas.TareaGeneracion import TareaGeneracion
+
+    tarea = TareaGeneracion("Normal", 150_000, 10, (0.0, 1.0), semilla=7,
+                            tipo="float32")
+    recibidos = {}
+    tarea.datos_listos.connect(lambda d: recibidos.setdefault("datos", d))
+    tarea.analisis_listo.connect(
+        lambda a: recibidos.setdefault("analisis", a))
+    tarea.pruebas_listas.connect(
+        lambda p: recibidos.setdefault("pruebas", p))
+    tarea.fallo.connect(lambda m: recibidos.setdefault("fallo", m))
+    tarea.run()
+    app.processEvents()
+
+    assert "fallo" not in recibidos
+    datos = recibidos["datos"]
+    assert datos.dtype == np.float32
+    esperado = np.concatenate(list(generar_por_bloques(
+        "Normal", 150_000, (0.0, 1.0), 7)))
+    assert np.array_equal(datos, esperado.astype(np.float32))
+    assert recibidos["analisis"].fo.sum() == 150_000
+    # En float32 no se ordena una copia: K-S por bloques y A-D omitida
+    ks, ad = recibidos["pruebas"]
+    assert ks["aproximado"]
+    assert ad["prueba"] == "Anderson-Darling" and "float32" in ad["omitida"]
@@ -0,0 +1,50 @@
+import math
+
+import pytest
+
+from core.barrido import (
+    CacheBarrido, armar_grilla, barrido, clave_celda, es_cacheable)
+
+
+def test_grilla_omite_combinaciones_invalidas():
+    celdas, omitidas = armar_grilla(
+        "Uniforme", {"A": [0, 1], "B": [1, 2]}, [100, 200], [1, 10], [0])
+    # A=1, B=1 no es valida; los 1 intervalos se omiten en las otras tres
+    assert len(celdas) == 3 * 2
+    assert len(omitidas) == 1 + 3
+    assert all(c["intervalos"] == 10 for c in celdas)
+
+
+def test_grilla_parametro_desconocido():
+    with pytest.raises(ValueError):
+        armar_grilla("Normal", {"sigma": [1]}, [100])
+
+
+def test_clave_celda():
+    celda, otra = armar_grilla("Normal", {}, [100], [10], [0, 1])[0]
+    assert clave_celda(celda) == clave_celda(dict(reversed(celda.items())))
+    assert clave_celda(celda) != clave_celda(otra)
+    assert len(clave_celda(celda)) == 64
+
+
+def test_cache(tmp_path):
+    celdas, _ = armar_grilla("Normal", {}, [1000], [10], [0, 1])
+    cache = CacheBarrido(tmp_path)
+    primera = list(barrido(celdas, 1, cache))
+    assert [de_cache for _, _, de_cache in primera] == [False, False]
+
+    segunda = sorted(barrido(celdas, 1, cache))
+    assert [de_cache for _, _, de_cache in segunda] == [True, True]
+    assert ([r["chi2"] for _, r, _ in segunda]
+            == [r["chi2"] for _, r, _ in sorted(primera)])
+
+
+def test_cache_no_guarda_sin_valor_critico(tmp_path):
+    celdas, _ = armar_grilla("Normal", {}, [3], [10], [0], con_ks=False)
+    cache = CacheBarrido(tmp_path)
+    (_, resultado, _), = barrido(celdas, 1, cache)
+    assert resultado["chi2_critico"] is None
+    assert not list(tmp_path.iterdir())
+    assert not es_cacheable({"chi2": 1.0, "chi2_critico": math.nan})
+    assert not es_cacheable({"chi2": None, "chi2_critico": 3.84})
+    assert es_cacheable({"chi2": 1.0, "chi2_critico": 3.84})
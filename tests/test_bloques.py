@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from core.generadores import (
+    HistogramaAcumulado, generar_por_bloques, histograma_por_bloques,
+    tamanios_bloques)
+
+
+def test_tamanios_bloques():
+    assert list(tamanios_bloques(250, 100)) == [100, 100, 50]
+    assert sum(tamanios_bloques(1_000_001)) == 1_000_001
+
+
+def test_bloques_reproducibles():
+    uno = np.concatenate(list(generar_por_bloques(
+        "Normal", 25_000, (0.0, 1.0), 3, tam_bloque=10_000)))
+    otro = np.concatenate(list(generar_por_bloques(
+        "Normal", 25_000, (0.0, 1.0), 3, tam_bloque=10_000)))
+    assert len(uno) == 25_000
+    assert np.array_equal(uno, otro)
+
+
+def test_histograma_acumulado_igual_a_histogram():
+    datos = np.random.default_rng(0).exponential(2.0, 50_000)
+    bordes = np.linspace(datos.min(), datos.max(), 16)
+    hist = HistogramaAcumulado(bordes)
+    for inicio in range(0, len(datos), 7_000):
+        hist.agregar(datos[inicio:inicio + 7_000])
+    esperado, _ = np.histogram(datos, bins=bordes)
+    assert np.array_equal(hist.fo, esperado)
+    assert hist.total == len(datos)
+
+    # Combinar dos mitades da lo mismo que acumular todo junto
+    mitad = HistogramaAcumulado(bordes)
+    mitad.agregar(datos[:25_000])
+    resto = HistogramaAcumulado(bordes)
+    resto.agregar(datos[25_000:])
+    assert np.array_equal(mitad.combinar(resto).fo, esperado)
+    with pytest.raises(ValueError):
+        mitad.combinar(HistogramaAcumulado(bordes + 1))
+
+
+def test_histograma_por_bloques_igual_a_la_serie_completa():
+    hist = histograma_por_bloques("Uniforme", 30_000, (0.0, 1.0), 12,
+                                  semilla=5, tam_bloque=8_000)
+    datos = np.concatenate(list(generar_por_bloques(
+        "Uniforme", 30_000, (0.0, 1.0), 5, tam_bloque=8_000)))
+    esperado, bordes = np.histogram(datos, bins=12)
+    assert np.allclose(hist.bordes, bordes)
+    assert np.array_equal(hist.fo, esperado)
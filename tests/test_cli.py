@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from core.__main__ import main
+
+
+def correr(capsys, *argv):
+    main(list(argv))
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.mark.parametrize("argv", [
+    ["chi2", "--dist", "normal", "-n", "0", "--params", "0", "1"],
+    ["chi2", "--dist", "normal", "-n", "100", "--params", "0", "-1"],
+    ["chi2", "--dist", "normal", "-n", "100", "--params", "0", "1",
+     "--alpha", "1.5"],
+    ["chi2", "--dist", "normal", "-n", "100", "--params", "0", "1",
+     "--bordes", "50", "60", "70"],
+    ["montecarlo", "--dist", "normal", "-n", "100", "--params", "0", "1",
+     "--replicas", "0"],
+    ["barrido", "--dist", "normal", "-n", "100", "--intervalos", "1"],
+])
+def test_errores_de_uso(argv, capsys):
+    with pytest.raises(SystemExit) as e:
+        main(argv)
+    assert e.value.code == 2
+    assert "error" in capsys.readouterr().err
+
+
+def test_chi2(capsys):
+    resultado = correr(capsys, "chi2", "--dist", "normal", "-n", "10000",
+                       "--params", "0", "1", "--semilla", "1")
+    assert sum(c["fo"] for c in resultado["clases"]) == 10_000
+    assert resultado["motivo"] is None
+    assert resultado["rechaza_h0"] == (
+        resultado["chi2"] > resultado["chi2_critico"])
+    assert resultado["ks"]["p_valor"] is not None
+
+
+@pytest.mark.parametrize("cantidad", ["1", "3"])
+def test_chi2_sin_decision(cantidad, capsys):
+    # Con N = 1 los intervalos son degenerados (FE = 0); con N = 3 no quedan
+    # grados de libertad. En los dos casos el JSON es valido y dice por que
+    resultado = correr(capsys, "chi2", "--dist", "normal", "-n", cantidad,
+                       "--params", "0", "1", "--semilla", "1", "--sin-ks")
+    assert resultado["chi2_critico"] is None
+    assert resultado["rechaza_h0"] is None
+    assert resultado["motivo"]
+
+
+def test_barrido_con_n_1(capsys, tmp_path):
+    resultado = correr(capsys, "barrido", "--dist", "normal", "-n", "1",
+                       "1000", "--intervalos", "5", "--sin-ks",
+                       "--cache", str(tmp_path))
+    chi2 = [c["chi2"] for c in resultado["celdas"]]
+    assert chi2[0] is None and chi2[1] > 0
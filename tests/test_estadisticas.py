@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from core.estadisticas import BosquejoCuantiles, Momentos, ResumenSerie
+
+
+@pytest.fixture
+def datos():
+    return np.random.default_rng(0).exponential(2.0, 200_000)
+
+
+def test_momentos_combinados_igual_a_una_pasada(datos):
+    acumulado = Momentos()
+    for bloque in np.array_split(datos, 7):
+        acumulado.combinar(Momentos.de_bloque(bloque))
+
+    assert acumulado.n == len(datos)
+    assert acumulado.media == pytest.approx(datos.mean(), rel=1e-12)
+    assert acumulado.varianza == pytest.approx(datos.var(ddof=1), rel=1e-10)
+    assert acumulado.asimetria == pytest.approx(stats.skew(datos), rel=1e-9)
+    assert acumulado.curtosis == pytest.approx(stats.kurtosis(datos),
+                                               rel=1e-9)
+
+
+def test_momentos_vacios_y_constantes():
+    assert Momentos().combinar(Momentos()).n == 0
+    constantes = Momentos.de_bloque(np.full(10, 3.0))
+    assert constantes.varianza == 0
+    assert constantes.asimetria == 0
+    assert constantes.curtosis == 0
+
+
+def test_bosquejo_error_de_rango(datos):
+    bosquejo = BosquejoCuantiles(semilla=1)
+    for bloque in np.array_split(datos, 20):
+        bosquejo.agregar(bloque)
+
+    probabilidades = [0.01, 0.25, 0.5, 0.75, 0.99]
+    ordenados = np.sort(datos)
+    rangos = np.searchsorted(ordenados, bosquejo.cuantiles(probabilidades))
+    assert np.all(np.abs(rangos / len(datos) - probabilidades) < 0.005)
+    assert bosquejo.total == len(datos)
+    assert bosquejo.tamanio() < 5 * bosquejo.k
+
+
+def test_bosquejo_combinar_igual_que_agregar(datos):
+    mitades = np.array_split(datos, 2)
+    a = BosquejoCuantiles(semilla=2).agregar(mitades[0])
+    a.combinar(BosquejoCuantiles(semilla=3).agregar(mitades[1]))
+
+    mediana = a.cuantiles([0.5])[0]
+    rango = np.searchsorted(np.sort(datos), mediana) / len(datos)
+    assert a.total == len(datos)
+    assert rango == pytest.approx(0.5, abs=0.005)
+
+
+def test_bosquejo_vacio():
+    assert np.isnan(BosquejoCuantiles().cuantiles([0.5])).all()
+
+
+def test_resumen_serie(datos):
+    resumen = ResumenSerie()
+    for bloque in np.array_split(datos, 3):
+        resumen.agregar(bloque)
+    resultado = resumen.resultado()
+
+    assert resultado["n"] == len(datos)
+    assert resultado["minimo"] == datos.min()
+    assert resultado["maximo"] == datos.max()
+    assert set(resultado["cuantiles"]) == {
+        "0.01", "0.05", "0.25", "0.5", "0.75", "0.95", "0.99"}
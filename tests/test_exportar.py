@@ -0,0 +1,99 @@
+import json
+
+import numpy as np
+import pytest
+
+from core.analisis import Analisis
+from core.exportar import (
+    cargar_serie, exportar, formatos_disponibles, leer_metadatos,
+    ruta_metadatos)
+
+
+@pytest.fixture
+def datos():
+    return np.random.default_rng(0).normal(0.0, 1.0, 25_000)
+
+
+def test_csv_sin_perder_precision(datos, tmp_path):
+    ruta = tmp_path / "serie.csv"
+    exportar(ruta, datos, "csv", tam_bloque=7_000)
+    with open(ruta, encoding="utf-8") as f:
+        assert f.readline() == "valor\n"
+    leidos = np.loadtxt(ruta, skiprows=1)
+    assert np.array_equal(leidos, datos)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_npy(datos, tmp_path, dtype):
+    ruta = tmp_path / "serie.npy"
+    exportar(ruta, datos.astype(dtype), "npy", tam_bloque=7_000)
+    leidos = np.load(ruta)
+    assert leidos.dtype == dtype
+    assert np.array_equal(leidos, datos.astype(dtype))
+
+
+def test_parquet(datos, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    ruta = tmp_path / "serie.parquet"
+    exportar(ruta, datos, "parquet", tam_bloque=7_000)
+    assert np.array_equal(pq.read_table(ruta).column("valor").to_numpy(),
+                          datos)
+
+
+def test_metadatos(datos, tmp_path):
+    ruta = tmp_path / "serie.npy"
+    exportar(ruta, datos.astype(np.float32), "npy",
+             {"distribucion": "Normal", "parametros": [0.0, 1.0],
+              "semilla": 3})
+    assert ruta_metadatos(ruta) == tmp_path / "serie.json"
+    with open(ruta_metadatos(ruta), encoding="utf-8") as f:
+        metadatos = json.load(f)
+    assert metadatos == leer_metadatos(ruta)
+    assert metadatos["semilla"] == 3
+    assert metadatos["formato"] == "npy"
+    assert metadatos["cantidad"] == len(datos)
+    assert metadatos["dtype"] == "float32"
+    assert metadatos["archivo"] == "serie.npy"
+    # Sin metadatos no se escribe el .json
+    exportar(tmp_path / "otra.csv", datos, "csv")
+    assert leer_metadatos(tmp_path / "otra.csv") == {}
+
+
+def test_formato_desconocido(datos, tmp_path):
+    assert {"csv", "npy"} <= set(formatos_disponibles())
+    with pytest.raises(ValueError):
+        exportar(tmp_path / "serie.xls", datos, "xls")
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_cargar_npy_como_memmap(datos, tmp_path, dtype):
+    ruta = tmp_path / "serie.npy"
+    metadatos = {"distribucion": "Normal", "parametros": [0.0, 1.0]}
+    exportar(ruta, datos.astype(dtype), "npy", metadatos)
+    cargados, leidos = cargar_serie(ruta)
+    assert isinstance(cargados, np.memmap)
+    assert cargados.dtype == dtype
+    assert np.array_equal(cargados, datos.astype(dtype))
+    assert leidos["parametros"] == [0.0, 1.0]
+    assert leidos["dtype"] == np.dtype(dtype).name
+
+
+def test_cargar_csv(datos, tmp_path):
+    ruta = tmp_path / "serie.csv"
+    exportar(ruta, datos, "csv")
+    cargados, metadatos = cargar_serie(ruta)
+    assert np.array_equal(cargados, datos)
+    assert metadatos == {}
+    with pytest.raises(ValueError):
+        cargar_serie(tmp_path / "serie.txt")
+
+
+def test_analisis_del_memmap_igual_al_de_la_serie(datos, tmp_path):
+    ruta = tmp_path / "serie.npy"
+    exportar(ruta, datos, "npy")
+    cargados, _ = cargar_serie(ruta)
+    en_memoria = Analisis.desde_datos(datos, 12, "Normal", (0.0, 1.0))
+    del_disco = Analisis.desde_datos(cargados, 12, "Normal", (0.0, 1.0))
+    assert np.array_equal(en_memoria.bordes, del_disco.bordes)
+    assert np.array_equal(en_memoria.fo, del_disco.fo)
+    assert en_memoria.chi2 == del_disco.chi2
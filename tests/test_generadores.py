@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+import core.generadores as generadores
+from core.generadores import (
+    agrupar_frecuencias, agrupar_intervalos_chi2, chi2_lote, chi2_por_clase,
+    cortes_agrupacion, frecuencias_esperadas_bordes)
+
+
+def test_cortes_agrupacion():
+    fe = [1, 2, 3, 10, 0.5, 4, 6, 1]
+    # 1+2+3 = 6 cierra el primer grupo, 10 el segundo, 0.5+4+6 el tercero y
+    # el 1 que sobra se une al anterior
+    assert cortes_agrupacion(fe).tolist() == [0, 3, 4]
+    assert cortes_agrupacion([1, 1, 1]).tolist() == [0]
+    assert cortes_agrupacion([5, 5]).tolist() == [0, 1]
+
+
+@pytest.mark.parametrize("k", [5, 20, 200])
+def test_cortes_bucle_igual_a_searchsorted(k, monkeypatch):
+    rng = np.random.default_rng(k)
+    series = [rng.exponential(rng.uniform(0.5, 10), k) for _ in range(50)]
+    con_bucle = [cortes_agrupacion(fe) for fe in series]
+    monkeypatch.setattr(generadores, "CLASES_BUCLE", 0)
+    for fe, esperado in zip(series, con_bucle):
+        assert np.array_equal(cortes_agrupacion(fe), esperado)
+
+
+def test_agrupar_intervalos_como_arreglos():
+    rng = np.random.default_rng(1)
+    for _ in range(100):
+        fe = rng.exponential(3.0, 15)
+        fo = rng.poisson(fe)
+        clases = [{"li": i, "ls": i + 1, "fo": f, "fe": e}
+                  for i, (f, e) in enumerate(zip(fo.tolist(), fe.tolist()))]
+        cortes, fo_agr, fe_agr = agrupar_frecuencias(fo, fe)
+        agrupadas = agrupar_intervalos_chi2(clases)
+        assert [g["li"] for g in agrupadas] == cortes.tolist()
+        assert [g["fo"] for g in agrupadas] == fo_agr.tolist()
+        assert np.allclose([g["fe"] for g in agrupadas], fe_agr)
+
+
+def _chi2_por_fila(fo, fe):
+    chi2, grados = [], []
+    for fila_fo, fila_fe in zip(fo, fe):
+        cortes, fo_agr, fe_agr = agrupar_frecuencias(fila_fo, fila_fe)
+        chi2.append(chi2_por_clase(fo_agr, fe_agr).sum())
+        grados.append(len(cortes) - 1)
+    return np.array(chi2), np.array(grados)
+
+
+@pytest.mark.parametrize("k", [2, 20, 100])
+def test_chi2_lote_igual_a_una_por_serie(k):
+    rng = np.random.default_rng(k)
+    fe = rng.exponential(2.0, (300, k))
+    fo = rng.poisson(fe)
+    chi2, grados = chi2_lote(fo, fe)
+    esperado_chi2, esperado_grados = _chi2_por_fila(fo, fe)
+    assert np.array_equal(grados, esperado_grados)
+    assert np.allclose(chi2, esperado_chi2)
+
+    # FE comun a todas las series
+    chi2, grados = chi2_lote(fo, fe[0])
+    esperado_chi2, esperado_grados = _chi2_por_fila(fo, [fe[0]] * len(fo))
+    assert np.array_equal(grados, esperado_grados)
+    assert np.allclose(chi2, esperado_chi2)
+
+
+def test_frecuencias_esperadas_bordes():
+    bordes = np.linspace(-2, 2, 9)
+    fe = frecuencias_esperadas_bordes(bordes, 1000, "Normal", (0.0, 1.0))
+    assert np.allclose(fe, 1000 * np.diff(stats.norm.cdf(bordes)))
+    abiertas = frecuencias_esperadas_bordes(bordes, 1000, "Normal",
+                                            (0.0, 1.0), colas_abiertas=True)
+    assert abiertas.sum() == pytest.approx(1000)
+    assert abiertas[1:-1] == pytest.approx(fe[1:-1])
+    lote = frecuencias_esperadas_bordes(np.stack([bordes, bordes + 1]), 1000,
+                                        "Normal", (0.0, 1.0))
+    assert lote.shape == (2, 8)
+    assert np.allclose(lote[1], 1000 * np.diff(stats.norm.cdf(bordes + 1)))
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from core.analisis import Analisis
+from core.distribuciones import obtener
+from core.generadores import chi2_critico_gl
+from core.intervalos import (
+    MAX_INTERVALOS, calcular_bordes, cantidad_intervalos, contar,
+    rango_intercuartil)
+
+
+@pytest.fixture
+def datos():
+    return np.random.default_rng(3).normal(0.0, 1.0, 10_000)
+
+
+def test_contar_igual_a_histogram(datos):
+    bordes = np.linspace(-2, 2, 9)
+    esperado, _ = np.histogram(datos, bins=bordes)
+    assert np.array_equal(contar(datos, bordes), esperado)
+    assert np.array_equal(contar(np.sort(datos), bordes, ordenados=True),
+                          esperado)
+
+
+def test_contar_incluye_el_ultimo_borde():
+    assert contar(np.array([0.0, 1.0, 2.0]), np.array([0.0, 1.0, 2.0])
+                  ).tolist() == [1, 2]
+
+
+def test_iguales(datos):
+    bordes = calcular_bordes("iguales", 10, "Normal", (0.0, 1.0), len(datos),
+                             datos.min(), datos.max())
+    assert np.allclose(bordes, np.linspace(datos.min(), datos.max(), 11))
+
+
+def test_equiprobables_en_los_cuantiles(datos):
+    bordes = calcular_bordes("equiprobables", 4, "Normal", (0.0, 1.0),
+                             len(datos), datos.min(), datos.max())
+    ppf = obtener("Normal").ppf(np.array([0.25, 0.5, 0.75]), (0.0, 1.0))
+    assert np.allclose(bordes[1:-1], ppf)
+    assert bordes[0] == datos.min() and bordes[-1] == datos.max()
+
+
+def test_sturges_y_freedman_diaconis():
+    assert cantidad_intervalos("sturges", 10, 1000, 0, 1) == 11
+    # ancho = 2 * 1 / 1000^(1/3) = 0.2
+    assert cantidad_intervalos("freedman-diaconis", 10, 1000, 0, 1,
+                               ric=1.0) == 5
+    assert cantidad_intervalos("freedman-diaconis", 10, 10**9, 0, 1e6,
+                               ric=1.0) == MAX_INTERVALOS
+
+
+@pytest.mark.parametrize("bordes", [[1.0], [0.0, 0.0], [1.0, 0.0], None])
+def test_fijos_invalidos(bordes):
+    with pytest.raises(ValueError):
+        calcular_bordes("fijos", 10, "Normal", (0.0, 1.0), 10, 0, 1,
+                        bordes=bordes)
+
+
+def test_estrategia_desconocida():
+    with pytest.raises(ValueError):
+        calcular_bordes("otra", 10, "Normal", (0.0, 1.0), 10, 0, 1)
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 1000, 12345])
+def test_rango_intercuartil_igual_a_numpy(n):
+    x = np.sort(np.random.default_rng(n).normal(size=n))
+    q1, q3 = np.quantile(x, [0.25, 0.75])
+    assert rango_intercuartil(x) == pytest.approx(q3 - q1, abs=1e-12)
+
+
+def test_fijos_fuera_del_soporte():
+    with pytest.raises(ValueError):
+        calcular_bordes("fijos", None, "Normal", (0.0, 1.0), None, None,
+                        None, bordes=[50, 60, 70])
+    with pytest.raises(ValueError):
+        calcular_bordes("fijos", None, "Exponencial Negativa", (1.0,), None,
+                        None, None, bordes=[-3, -2, -1])
+
+
+def test_fijos_fe_sobre_los_de_adentro():
+    datos = np.random.default_rng(5).normal(0.0, 1.0, 100_000)
+    bordes = calcular_bordes("fijos", None, "Normal", (0.0, 1.0), None, None,
+                             None, bordes=[-1, 0, 1, 2])
+    fo = contar(datos, bordes)
+    a = Analisis(bordes, fo, len(datos), "Normal", (0.0, 1.0),
+                 estrategia="fijos")
+    assert a.fuera == len(datos) - fo.sum() > 0
+    assert a.fe.sum() == pytest.approx(fo.sum())
+    # Con FE condicionada la muestra correcta no se rechaza
+    assert a.chi2 < chi2_critico_gl(a.grados_libertad, 0.05)
@@ -0,0 +1,54 @@
+import numpy as np
+
+from core.montecarlo import estudio_chi2, histogramas_por_fila
+
+
+def test_histogramas_por_fila_igual_a_histogram():
+    datos = np.random.default_rng(0).normal(size=(50, 200))
+    datos[0, :10] = datos[0, 0]
+    bordes, fo = histogramas_por_fila(datos, 12)
+    for fila, b, f in zip(datos, bordes, fo):
+        esperado, esperados_bordes = np.histogram(fila, bins=12)
+        assert np.array_equal(f, esperado)
+        assert np.allclose(b, esperados_bordes)
+
+
+def test_tamanio_y_potencia():
+    # Con la distribucion real la tasa de rechazo ronda alpha (el tamaño);
+    # contra otra distribucion, la potencia es alta
+    tamanio = estudio_chi2(500, 10, 0.05, 2000, "Normal", (0.0, 1.0),
+                           semilla=1)
+    assert tamanio["replicas_validas"] == 2000
+    assert abs(tamanio["tasa_rechazo"] - 0.05) < 4 * tamanio["error_estandar"]
+    potencia = estudio_chi2(500, 10, 0.05, 500, "Exponencial Negativa",
+                            (1.0,), "Normal", (1.0, 1.0), semilla=1)
+    assert potencia["tasa_rechazo"] > 0.9
+
+
+def test_no_depende_de_los_trabajadores():
+    uno = estudio_chi2(100, 8, 0.05, 300, "Uniforme", (0.0, 1.0), semilla=7)
+    dos = estudio_chi2(100, 8, 0.05, 300, "Uniforme", (0.0, 1.0), semilla=7,
+                       trabajadores=2)
+    assert np.array_equal(uno["chi2"], dos["chi2"])
+    assert uno["rechazos"] == dos["rechazos"]
+
+
+def test_replicas_sin_grados_de_libertad():
+    # Con N = 10 en 5 intervalos todo queda en uno o dos grupos: sin grados
+    # de libertad no se decide, y esas replicas no cuentan en la tasa
+    resultado = estudio_chi2(10, 5, 0.05, 200, "Normal", (0.0, 1.0),
+                             semilla=1)
+    assert resultado["sin_decision"] == 200
+    assert resultado["replicas_validas"] == 0
+    assert resultado["tasa_rechazo"] is None
+
+
+def test_tasa_solo_entre_replicas_validas():
+    # Con N = 12 solo algunas replicas tienen grados de libertad
+    resultado = estudio_chi2(12, 10, 0.05, 1000, "Normal", (0.0, 1.0),
+                             semilla=3)
+    validas = resultado["replicas_validas"]
+    assert 0 < validas < 1000
+    assert validas + resultado["sin_decision"] == 1000
+    assert validas == np.count_nonzero(resultado["grados_libertad"] >= 1)
+    assert resultado["tasa_rechazo"] == resultado["rechazos"] / validas
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from core.generadores import generar_por_bloques
+from core.paralelo import generar_paralelo, histograma_paralelo, ks_paralelo
+
+
+@pytest.mark.parametrize("generador", ["pcg64", "philox"])
+def test_generar_no_depende_de_los_trabajadores(generador):
+    uno = generar_paralelo("Exponencial Negativa", 250_000, (1.5,), 11,
+                           trabajadores=1, generador=generador)
+    cuatro = generar_paralelo("Exponencial Negativa", 250_000, (1.5,), 11,
+                              trabajadores=4, generador=generador)
+    assert np.array_equal(uno, cuatro)
+    # Y es la misma serie que la generada por bloques en un proceso
+    esperado = np.concatenate(list(generar_por_bloques(
+        "Exponencial Negativa", 250_000, (1.5,), 11, generador=generador)))
+    assert np.array_equal(uno, esperado)
+
+
+@pytest.mark.parametrize("estrategia", ["iguales", "freedman-diaconis"])
+def test_histograma_no_depende_de_los_trabajadores(estrategia):
+    uno = histograma_paralelo("Normal", 300_000, (0.0, 1.0), 15, 4,
+                              trabajadores=1, estrategia=estrategia)
+    tres = histograma_paralelo("Normal", 300_000, (0.0, 1.0), 15, 4,
+                               trabajadores=3, estrategia=estrategia)
+    assert np.array_equal(uno.bordes, tres.bordes)
+    assert np.array_equal(uno.fo, tres.fo)
+    assert uno.total == tres.total == 300_000
+
+
+def test_histograma_igual_a_la_serie():
+    datos = generar_paralelo("Uniforme", 200_000, (2.0, 5.0), 8,
+                             trabajadores=2)
+    hist = histograma_paralelo("Uniforme", 200_000, (2.0, 5.0), 10, 8,
+                               trabajadores=2)
+    esperado, bordes = np.histogram(datos, bins=10)
+    assert np.allclose(hist.bordes, bordes)
+    assert np.array_equal(hist.fo, esperado)
+
+
+def test_ks_no_depende_de_los_trabajadores():
+    uno = ks_paralelo("Normal", 200_000, (0.0, 1.0), 2, trabajadores=1)
+    dos = ks_paralelo("Normal", 200_000, (0.0, 1.0), 2, trabajadores=2)
+    assert uno == dos
+
+
+def test_serie_vacia():
+    assert len(generar_paralelo("Normal", 0, (0.0, 1.0), 1)) == 0
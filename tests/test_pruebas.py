@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from core.pruebas import (
+    KSPorBloques, ad_critico, anderson_darling, ks, p_valor_ad,
+    pruebas_ordenadas, rechaza, valor_critico)
+
+
+@pytest.fixture
+def datos():
+    return np.random.default_rng(5).normal(0.0, 1.0, 5000)
+
+
+def test_ks_igual_a_scipy(datos):
+    resultado = ks(datos, "Normal", (0.0, 1.0))
+    referencia = stats.kstest(datos, "norm")
+    assert resultado["estadistico"] == pytest.approx(referencia.statistic,
+                                                     rel=1e-12)
+    # p-valor asintotico con la correccion de Stephens
+    assert resultado["p_valor"] == pytest.approx(referencia.pvalue, abs=0.01)
+
+
+def test_anderson_darling_igual_a_la_formula(datos):
+    x = np.sort(datos)
+    n = len(x)
+    f = stats.norm.cdf(x)
+    i = np.arange(1, n + 1)
+    a2 = -n - np.sum((2 * i - 1) * (np.log(f) + np.log(1 - f[::-1]))) / n
+
+    resultado = anderson_darling(datos, "Normal", (0.0, 1.0))
+    assert resultado["estadistico"] == pytest.approx(a2, rel=1e-10)
+
+
+def test_ad_critico_valores_conocidos():
+    # Cuantiles de ADinf (Marsaglia y Marsaglia, 2004)
+    assert ad_critico(0.05) == pytest.approx(2.492, abs=0.005)
+    assert ad_critico(0.01) == pytest.approx(3.878, abs=0.005)
+    assert p_valor_ad(ad_critico(0.05)) == pytest.approx(0.05, abs=1e-6)
+
+
+def test_pruebas_ordenadas_sin_volver_a_ordenar(datos):
+    ordenados = np.sort(datos)
+    assert (pruebas_ordenadas(datos, "Normal", (0.0, 1.0))
+            == pruebas_ordenadas(ordenados, "Normal", (0.0, 1.0),
+                                 ordenados=True))
+
+
+def test_ks_por_bloques_dentro_del_error(datos):
+    exacto = ks(datos, "Normal", (0.0, 1.0))
+    por_bloques = KSPorBloques("Normal", (0.0, 1.0))
+    for bloque in np.array_split(datos, 4):
+        por_bloques.agregar(bloque)
+    aproximado = por_bloques.resultado()
+
+    assert aproximado["n"] == len(datos)
+    assert (abs(aproximado["estadistico"] - exacto["estadistico"])
+            <= aproximado["error_maximo"])
+
+
+def test_rechaza_otra_distribucion():
+    datos = np.random.default_rng(1).exponential(1.0, 2000)
+    for prueba in pruebas_ordenadas(datos, "Normal", (1.0, 1.0)):
+        assert rechaza(prueba, 0.05)
+        assert prueba["estadistico"] > valor_critico(prueba, 0.05)
+
+
+def test_serie_vacia():
+    vacia = np.array([])
+    with pytest.raises(ValueError):
+        ks(vacia, "Normal", (0.0, 1.0))
+    with pytest.raises(ValueError):
+        anderson_darling(vacia, "Normal", (0.0, 1.0))
+    with pytest.raises(ValueError):
+        KSPorBloques("Normal", (0.0, 1.0)).resultado()
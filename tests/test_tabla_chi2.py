@@ -0,0 +1,20 @@
+import pytest
+from scipy.stats import chi2
+
+from core.generadores import chi2_critico_gl, chi2_criticos_gl
+from core.tabla_chi2 import GL_MAX, TABLA_CHI2
+
+
+@pytest.mark.parametrize("alpha", list(TABLA_CHI2))
+def test_tabla_igual_a_scipy(alpha):
+    valores = TABLA_CHI2[alpha]
+    assert len(valores) == GL_MAX
+    for gl, valor in enumerate(valores, 1):
+        assert valor == pytest.approx(chi2.ppf(1 - alpha, gl), rel=1e-9)
+
+
+def test_fuera_de_la_tabla():
+    assert chi2_critico_gl(GL_MAX + 50, 0.05) == pytest.approx(
+        chi2.ppf(0.95, GL_MAX + 50))
+    assert chi2_criticos_gl([1, GL_MAX + 1], 0.05).tolist() == [
+        chi2_critico_gl(1, 0.05), chi2_critico_gl(GL_MAX + 1, 0.05)]